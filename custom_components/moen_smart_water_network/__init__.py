@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.const import CONF_ACCESS_TOKEN, Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import (
+    ConfigEntryError,
     ConfigEntryNotReady,
     HomeAssistantError,
     ServiceValidationError,
@@ -21,9 +23,30 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CLIENT, CONF_REFRESH_TOKEN, DOMAIN
+from .const import (
+    CLIENT,
+    CONF_API_URL,
+    CONF_CAPTURE_FILE,
+    CONF_DIAGNOSTICS_PROBE,
+    CONF_MQTT_BROKER,
+    CONF_REFRESH_TOKEN,
+    CONF_ZONE_DURATIONS,
+    DOMAIN,
+    MQTT_CLIENT,
+    RECORDER,
+)
 from .coordinator import MoenDataUpdateCoordinator
-from .moen_api import MoenApiClient, MoenApiError, MoenAuth, MoenMqttClient
+from .moen_api import (
+    DEFAULT_ENDPOINTS,
+    Endpoints,
+    MoenApiClient,
+    MoenApiError,
+    MoenAuth,
+    MoenMqttClient,
+)
+from .moen_api.capture import TrafficRecorder
+from .moen_api.models import Device
+from .storage import CREDENTIALS_SAVE_DELAY, SnapshotStore, credentials_store
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -92,56 +115,172 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     session = async_get_clientsession(hass)
 
-    hass.data[DOMAIN][entry.entry_id] = {}
+    endpoints = _entry_endpoints(entry)
+    hass.data[DOMAIN][entry.entry_id] = {"options": _setup_options(entry)}
+    store = credentials_store(hass, entry.entry_id)
+    stored_credentials = await store.async_load()
+
+    def _schedule_credentials_save() -> None:
+        # Called from the event loop or an AWS CRT thread
+        hass.loop.call_soon_threadsafe(
+            store.async_delay_save, auth.as_dict, CREDENTIALS_SAVE_DELAY
+        )
+
     try:
         auth = MoenAuth(
             access_token=entry.data[CONF_ACCESS_TOKEN],
             refresh_token=entry.data[CONF_REFRESH_TOKEN],
             session=session,
+            on_update=_schedule_credentials_save,
+            endpoints=endpoints,
         )
-        client = MoenApiClient(auth=auth, session=session)
-        mqtt_client = MoenMqttClient(auth=auth)
+        if stored_credentials is not None:
+            auth.restore(stored_credentials)
+        client = MoenApiClient(auth=auth, session=session, endpoints=endpoints)
         hass.data[DOMAIN][entry.entry_id][CLIENT] = client
     except MoenApiError as err:
         raise ConfigEntryNotReady from err
 
-    user = await client.async_get_user()
-    resp = await client.async_get_devices()
-    _LOGGER.debug("INITIAL devices: %s", resp)
+    snapshots = SnapshotStore(hass, entry.entry_id)
+    if snapshot := await snapshots.async_load():
+        # Warm start: build entities from the last-known state and let the
+        # live refresh reconcile in the background.
+        legacy_id = snapshot["legacy_id"]
+        device_payloads = [device["device"] for device in snapshot["devices"]]
+    else:
+        user = await client.async_get_user()
+        resp = await client.async_get_devices()
+        _LOGGER.debug("INITIAL devices: %s", resp)
+        legacy_id = user["legacyId"]
+        device_payloads = resp["devices"]
+
+    # One MQTT connection is shared by every device on the account
+    mqtt_client = MoenMqttClient(auth=auth, legacy_id=legacy_id, endpoints=endpoints)
+    hass.data[DOMAIN][entry.entry_id][MQTT_CLIENT] = mqtt_client
+
+    if capture_file := entry.options.get(CONF_CAPTURE_FILE):
+        # Record live traffic for offline replay (see tests/replay.py)
+        recorder = TrafficRecorder(hass.config.path(capture_file))
+        client.set_recorder(recorder)
+        mqtt_client.set_recorder(recorder)
+        hass.data[DOMAIN][entry.entry_id][RECORDER] = recorder
+        _LOGGER.warning("Capturing Moen traffic to %s", recorder.path)
 
     hass.data[DOMAIN][entry.entry_id]["devices"] = devices = [
         MoenDataUpdateCoordinator(
             hass,
             client,
             mqtt_client,
-            device["duid"],
+            device.duid,
             device,
-            legacy_id=user["legacyId"],
             config_entry=entry,
         )
-        for device in resp["devices"]
+        for device in map(Device.from_api, device_payloads)
     ]
 
-    tasks = [device.async_config_entry_first_refresh() for device in devices]
-    await asyncio.gather(*tasks)
+    if snapshot:
+        for device, device_snapshot in zip(devices, snapshot["devices"], strict=True):
+            device.async_restore_snapshot(device_snapshot)
+        entry.async_create_background_task(
+            hass,
+            _async_reconcile_snapshot(hass, entry, client, devices),
+            name=f"moen_reconcile_{entry.entry_id}",
+        )
+    else:
+        tasks = [device.async_config_entry_first_refresh() for device in devices]
+        await asyncio.gather(*tasks)
+
+    @callback
+    def _schedule_snapshot_save() -> None:
+        snapshots.async_schedule_save(
+            lambda: {
+                "legacy_id": legacy_id,
+                "devices": [device.snapshot() for device in devices],
+            }
+        )
 
     for device in devices:
+        entry.async_on_unload(device.async_add_listener(_schedule_snapshot_save))
         await device.async_start_mqtt()
+    _schedule_snapshot_save()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
     return True
 
 
+def _setup_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the options that are only read during setup."""
+    # Zone run durations and the diagnostics probe are read on every use
+    return {
+        key: value
+        for key, value in entry.options.items()
+        if key not in (CONF_ZONE_DURATIONS, CONF_DIAGNOSTICS_PROBE)
+    }
+
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when an option read during setup changes."""
+    if _setup_options(entry) != hass.data[DOMAIN][entry.entry_id]["options"]:
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+def _entry_endpoints(entry: ConfigEntry) -> Endpoints:
+    """Return the production endpoints unless the entry overrides them."""
+    if api_url := entry.options.get(CONF_API_URL):
+        _LOGGER.warning("Using Moen API stand-in at %s", api_url)
+        try:
+            return Endpoints.local(api_url, entry.options.get(CONF_MQTT_BROKER))
+        except ValueError as err:
+            msg = f"Invalid {CONF_MQTT_BROKER} option: {err}"
+            raise ConfigEntryError(msg) from err
+    return DEFAULT_ENDPOINTS
+
+
+async def _async_reconcile_snapshot(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: MoenApiClient,
+    devices: list[MoenDataUpdateCoordinator],
+) -> None:
+    """Refresh warm-started devices and reload if the device list changed."""
+    results = await asyncio.gather(
+        client.async_get_devices(),
+        *(device.async_refresh() for device in devices),
+        return_exceptions=True,
+    )
+    resp = results[0]
+    if isinstance(resp, BaseException):
+        _LOGGER.debug("Unable to reconcile device list: %s", resp)
+        return
+    if {device["duid"] for device in resp["devices"]} != {
+        device.id for device in devices
+    }:
+        _LOGGER.debug("Device list changed since the last snapshot, reloading")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Drop the shared connection first so devices skip per-topic unsubscribes
+        if (mqtt_client := entry_data.get(MQTT_CLIENT)) is not None:
+            await mqtt_client.async_disconnect()
         for device in entry_data.get("devices", []):
             await device.async_shutdown()
+        if (recorder := entry_data.get(RECORDER)) is not None:
+            await hass.async_add_executor_job(recorder.close)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted credentials and snapshots when an entry is deleted."""
+    await credentials_store(hass, entry.entry_id).async_remove()
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
@@ -41,7 +41,7 @@ async def async_setup_entry(
         entities.append(MasterValveBinarySensor(device))
         entities.append(FlowSensorBinarySensor(device))
         entities.extend(
-            ScheduleActiveBinarySensor(device, sid) for sid in device.data["schedules"]
+            ScheduleActiveBinarySensor(device, sid) for sid in device.schedules
         )
     async_add_entities(entities)
 
@@ -50,6 +50,7 @@ class BinarySensor(MoenEntity, BinarySensorEntity):
     """Connected binary sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _data_paths = frozenset()
 
     @property
     def name(self) -> str:
@@ -64,13 +65,14 @@ class BinarySensor(MoenEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
-        return self._device.data.get("device", {}).get("connected", False)
+        return self._device.device.connected
 
 
 class WateringBinarySensor(MoenEntity, BinarySensorEntity):
     """Watering binary sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -92,6 +94,7 @@ class RainSensorBinarySensor(MoenEntity, BinarySensorEntity):
     """Rain sensor connected binary sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -113,6 +116,7 @@ class MasterValveBinarySensor(MoenEntity, BinarySensorEntity):
     """Master valve connected binary sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -135,6 +139,7 @@ class FlowSensorBinarySensor(MoenEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -157,6 +162,7 @@ class ScheduleActiveBinarySensor(MoenEntity, BinarySensorEntity):
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:calendar"
+    _data_paths = frozenset()
 
     def __init__(
         self, coordinator: MoenDataUpdateCoordinator, schedule_id: str
@@ -173,11 +179,8 @@ class ScheduleActiveBinarySensor(MoenEntity, BinarySensorEntity):
     @property
     def _schedule_name(self) -> str:
         """Return the schedule name from current data."""
-        return (
-            self._device.data.get("schedules", {})
-            .get(self._id, {})
-            .get("name", "Unknown")
-        )
+        schedule = self._device.schedules.get(self._id)
+        return schedule.name if schedule is not None else "Unknown"
 
     @property
     def name(self) -> str:
@@ -187,12 +190,11 @@ class ScheduleActiveBinarySensor(MoenEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict | None:
         """Return the state attributes of the device."""
-        return self._device.data.get("schedules", {}).get(self._id)
+        schedule = self._device.schedules.get(self._id)
+        return schedule.to_dict() if schedule is not None else None
 
     @property
     def is_on(self) -> bool:
         """Return true if the schedule is active."""
-        return (
-            self._device.data.get("schedules", {}).get(self._id, {}).get("status")
-            == "active"
-        )
+        schedule = self._device.schedules.get(self._id)
+        return schedule is not None and schedule.status == "active"
@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import CONF_REFRESH_TOKEN, DOMAIN
+from .const import (
+    CONF_DIAGNOSTICS_PROBE,
+    CONF_MQTT_COALESCE_MS,
+    CONF_REFRESH_TOKEN,
+    DEFAULT_MQTT_COALESCE_MS,
+    DOMAIN,
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_MQTT_COALESCE_MS, default=DEFAULT_MQTT_COALESCE_MS
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1000,
+                step=10,
+                unit_of_measurement="ms",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_DIAGNOSTICS_PROBE, default=False): selector.BooleanSelector(),
+    }
+)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -15,6 +41,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Return the options flow."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -46,3 +80,32 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=_errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Moen Smart Water Network."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the MQTT tuning and diagnostics options."""
+        if user_input is not None:
+            # Options not on the form, like zone run durations, are kept
+            options = {
+                key: value
+                for key, value in self.config_entry.options.items()
+                if key not in OPTIONS_SCHEMA.schema
+            }
+            if CONF_MQTT_COALESCE_MS in user_input:
+                user_input[CONF_MQTT_COALESCE_MS] = int(
+                    user_input[CONF_MQTT_COALESCE_MS]
+                )
+            return self.async_create_entry(data={**options, **user_input})
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
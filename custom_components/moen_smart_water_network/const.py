@@ -1,14 +1,38 @@
 """Constants for moen_smart_water_network."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
 
 NAME = "Moen Smart Water Network"
 CLIENT = "client"
+MQTT_CLIENT = "mqtt_client"
+RECORDER = "recorder"
 DOMAIN = "moen_smart_water_network"
 VERSION = "0.0.1"
 
 CONF_REFRESH_TOKEN = "refresh_token"  # noqa: S105
 CONF_ZONE_DURATIONS = "zone_durations"
+CONF_MQTT_COALESCE_MS = "mqtt_coalesce_ms"
+CONF_CAPTURE_FILE = "capture_file"
+# Re-fetch every device when diagnostics are downloaded and time each call
+CONF_DIAGNOSTICS_PROBE = "diagnostics_probe"
+# Point the integration at a stand-in cloud such as the bundled simulator
+CONF_API_URL = "api_url"
+CONF_MQTT_BROKER = "mqtt_broker"
 DEFAULT_MANUAL_RUN_DURATION = 5  # minutes
+
+# REST polling cadence. MQTT pushes shadow and run updates, so REST is only a
+# safety net while the subscription is healthy and tightens otherwise.
+UPDATE_INTERVAL = timedelta(seconds=30)
+UPDATE_INTERVAL_MQTT = timedelta(minutes=5)
+UPDATE_INTERVAL_WATERING = timedelta(seconds=15)
+# A device may stay quiet for a long time; after MQTT_STALE_AFTER without
+# messages its shadow is requested again, and only a get left unanswered for
+# MQTT_SHADOW_GET_TIMEOUT marks the subscription stale.
+MQTT_STALE_AFTER = timedelta(minutes=15)
+MQTT_SHADOW_GET_TIMEOUT = timedelta(seconds=30)
+
+# MQTT messages arriving within this window are applied as one batch
+DEFAULT_MQTT_COALESCE_MS = 50
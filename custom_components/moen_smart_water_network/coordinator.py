@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -16,42 +16,65 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_MQTT_COALESCE_MS,
+    DEFAULT_MQTT_COALESCE_MS,
+    DOMAIN,
+    LOGGER,
+    MQTT_SHADOW_GET_TIMEOUT,
+    MQTT_STALE_AFTER,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_MQTT,
+    UPDATE_INTERVAL_WATERING,
+)
+from .inbox import MessageInbox
 from .moen_api import (
     MoenApiAuthenticationError,
     MoenApiClient,
     MoenApiError,
     MoenMqttClient,
+    MqttState,
 )
+from .moen_api.metrics import Metrics
 from .moen_api.models import (
     CoordinatorData,
-    DeviceData,
+    Device,
+    DeviceSnapshot,
     IrrigationRunMessage,
+    Schedule,
 )
+from .moen_api.shadow import ShadowDocument, ShadowUpdate
+from .schedule import ScheduleIndex
+from .view import NO_RUN, RunView
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime, timedelta
+
     from homeassistant.config_entries import ConfigEntry
 
-    from .moen_api.models import ZoneData
+    from .moen_api.models import Zone
 
 _LOGGER = logging.getLogger(__name__)
 
+PollingReason = Literal["mqtt", "mqtt_down", "mqtt_stale", "watering"]
+
+ACTIVE_RUN_STATUSES = frozenset({"STARTING", "WATERING", "SOAKING", "PAUSED"})
+
+
+# Data paths entities subscribe to. MQTT updates only wake listeners whose
+# paths changed; REST refreshes still notify every listener.
+PATH_RUN = "run"
 
-def merge(a: dict, b: dict, path: list | None = None) -> dict:
-    """Merge b into a."""
-    if path is None:
-        path = []
-    for key, value in b.items():
-        if key in a:
-            if isinstance(a[key], dict) and isinstance(value, dict):
-                merge(a[key], value, [*path, str(key)])
-            elif a[key] == value:
-                pass  # same leaf value
-            else:
-                a[key] = value
-        else:
-            a[key] = value
-    return a
+
+def shadow_path(*keys: str) -> str:
+    """Return the data path for a key in the reported shadow."""
+    return ".".join(("shadow", *keys))
+
+
+def zone_path(client_id: int | str) -> str:
+    """Return the data path for state tied to a single zone."""
+    return f"zone.{client_id}"
 
 
 class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
@@ -63,8 +86,7 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         client: MoenApiClient,
         mqtt_client: MoenMqttClient,
         device_id: str,
-        data: DeviceData,
-        legacy_id: str,
+        data: Device,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize."""
@@ -73,120 +95,386 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self._mqtt_client: MoenMqttClient = mqtt_client
         self._manufacturer: str = "Moen"
         self._device_id: str = device_id
-        self._device_information: DeviceData = data
-        self._legacy_id: str = legacy_id
-        self._schedules: dict[str, Any] = {}
-        self._shadow_state: dict[str, Any] = {}
+        self._device_information: Device = data
+        self._zones_by_client_id: dict[str, Zone] = {}
+        self._zones_by_id: dict[str, Zone] = {}
+        self._zones_by_name: dict[str, Zone] = {}
+        self._index_zones()
+        self._schedules: dict[str, Schedule] = {}
+        self._schedule_index = ScheduleIndex.from_schedules(self._schedules)
+        self._shadow = ShadowDocument()
         self._irrigation_run: IrrigationRunMessage | None = None
+        self._run_view: RunView = NO_RUN
+        # When the last run message arrived, to tell a lagging REST from a
+        # run whose final message was lost
+        self._run_received: float | None = None
 
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=f"{DOMAIN}-{device_id}",
-            update_interval=timedelta(seconds=30),
+            update_interval=UPDATE_INTERVAL,
             config_entry=config_entry,
         )
 
         self._mqtt_task: asyncio.Task[None] | None = None
-        self._client_id = data["clientId"]
+        self._presence_task: asyncio.Task[None] | None = None
+        self._mqtt_subscribed = False
+        self._unsub_mqtt_state: Callable[[], None] | None = None
+        self._last_mqtt_message: float | None = None
+        self._shadow_get_task: asyncio.Task[None] | None = None
+        # When the last full shadow was requested; its reply counts as traffic
+        self._shadow_requested: float | None = None
+        self._polling_reason: PollingReason = "mqtt_down"
+        self._client_id = data.client_id
+        self._metrics = Metrics()
+        coalesce_ms = config_entry.options.get(
+            CONF_MQTT_COALESCE_MS, DEFAULT_MQTT_COALESCE_MS
+        )
+        self._inbox = MessageInbox(
+            hass.loop, self._apply_mqtt_batch, coalesce_ms / 1000
+        )
 
-    def _subscribe_update_cb(self, msg: Any) -> None:
+    def _subscribe_update_cb(self, update: ShadowUpdate) -> None:
         """Handle shadow MQTT messages (called from AWS CRT thread)."""
-        _LOGGER.debug("mqtt: received message of type %s: %s", type(msg).__name__, msg)
-
-        if hasattr(msg, "current"):
-            if hasattr(msg.current.state, "desired"):
-                _LOGGER.debug(
-                    "mqtt: current desired state: %s", msg.current.state.desired
-                )
-
-            if hasattr(msg.current.state, "reported"):
-                reported = msg.current.state.reported
-                _LOGGER.debug(
-                    "mqtt: current reported state: %s", msg.current.state.reported
-                )
-                self.hass.loop.call_soon_threadsafe(self._apply_shadow_update, reported)
-        if hasattr(msg, "state"):
-            if hasattr(msg.state, "desired"):
-                _LOGGER.debug("mqtt: state.desired state: %s", msg.state.desired)
-
-            if hasattr(msg.state, "reported") and msg.state.reported is not None:
-                reported = msg.state.reported
-                _LOGGER.debug("mqtt: state.reported state: %s", msg.state.reported)
-                self.hass.loop.call_soon_threadsafe(self._apply_shadow_update, reported)
+        self._inbox.put_shadow(update)
 
     async def async_start_mqtt(self) -> None:
-        """Start MQTT subscription task."""
+        """Subscribe this device on the account's shared MQTT connection."""
+        self._unsub_mqtt_state = self._mqtt_client.async_add_state_listener(
+            self._async_mqtt_state_changed
+        )
         self._mqtt_task = self.config_entry.async_create_background_task(
             self.hass,
-            self._mqtt_client.async_connect(
+            self._async_subscribe_mqtt(),
+            name=f"moen_mqtt_{self._device_id}",
+        )
+
+    async def _async_subscribe_mqtt(self) -> None:
+        """Subscribe to MQTT and relax polling once the subscription is live."""
+        try:
+            await self._mqtt_client.async_subscribe_device(
                 client_id=self._client_id,
                 duid=self._device_id,
-                legacy_id=self._legacy_id,
                 shadow_callback=self._subscribe_update_cb,
                 async_callback=self._async_message_cb,
-            ),
-            name=f"moen_mqtt_{self._device_id}",
+            )
+        except Exception as err:  # noqa: BLE001
+            # The device stays registered; the state listener marks it
+            # subscribed once a reconnect has resubscribed it
+            _LOGGER.debug("MQTT subscribe for %s failed: %s", self._device_id, err)
+            return
+        self._async_mqtt_subscribed()
+
+    @callback
+    def _async_mqtt_state_changed(self, state: MqttState) -> None:
+        """Tighten or relax polling as the shared connection goes down or up."""
+        LOGGER.debug("MQTT %s for %s", state, self._device_id)
+        # CONNECTED follows a resubscribe and re-get of every registered device
+        if state is MqttState.CONNECTED and self._mqtt_client.is_subscribed(
+            self._client_id
+        ):
+            self._async_mqtt_subscribed()
+        else:
+            self._async_adjust_polling()
+
+    @callback
+    def _async_mqtt_subscribed(self) -> None:
+        """Note a live subscription whose shadow was just requested."""
+        self._mqtt_subscribed = True
+        self._shadow_requested = self.hass.loop.time()
+        self._async_adjust_polling()
+
+    @callback
+    def _async_request_shadow_if_quiet(self) -> None:
+        """Re-get the shadow of a quiet device to tell idle from silent."""
+        if not (self._mqtt_subscribed and self._mqtt_client.connected):
+            return
+        if self._shadow_get_task is not None and not self._shadow_get_task.done():
+            return
+        now = self.hass.loop.time()
+        stale_after = MQTT_STALE_AFTER.total_seconds()
+        if self._last_mqtt_message is not None and (
+            now - self._last_mqtt_message <= stale_after
+        ):
+            return
+        if self._shadow_requested is not None and (
+            now - self._shadow_requested <= stale_after
+        ):
+            return
+        self._shadow_requested = now
+        self._shadow_get_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_request_shadow(),
+            name=f"moen_shadow_get_{self._device_id}",
         )
 
+    async def _async_request_shadow(self) -> None:
+        """Publish a shadow get, ignoring failures."""
+        try:
+            await self._mqtt_client.async_request_shadow(self._client_id)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Shadow get for %s failed: %s", self._device_id, err)
+
     async def async_shutdown(self) -> None:
-        """Cancel MQTT task and disconnect."""
-        if self._mqtt_task is not None:
+        """Cancel the MQTT subscription task and drop this device's topics."""
+        await super().async_shutdown()
+        self._inbox.async_close()
+        if self._unsub_mqtt_state is not None:
+            self._unsub_mqtt_state()
+            self._unsub_mqtt_state = None
+        if self._mqtt_task is None:
+            return
+        if not self._mqtt_task.done():
             self._mqtt_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._mqtt_task
-            self._mqtt_task = None
-        await self._mqtt_client.async_disconnect()
+        self._mqtt_task = None
+        self._mqtt_subscribed = False
+        try:
+            await self._mqtt_client.async_unsubscribe_device(
+                self._client_id, self._device_id
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Failed to unsubscribe %s from MQTT", self._device_id)
 
     @callback
-    def _apply_shadow_update(self, reported: dict) -> None:
-        """Apply shadow state update on the event loop."""
-        merge(self._shadow_state, reported)
-        self.async_update_listeners()
+    def _apply_mqtt_batch(
+        self,
+        updates: list[ShadowUpdate],
+        run: IrrigationRunMessage | None,
+        received: float | None = None,
+    ) -> None:
+        """
+        Apply a batch of MQTT messages and notify affected listeners once.
+
+        received is the monotonic time the batch's first message arrived; the
+        time until the listeners have written their state is recorded as
+        message_to_state latency.
+        """
+        self._metrics.increment("mqtt_batches")
+        self._metrics.increment("mqtt_messages", len(updates) + (run is not None))
+        previous_zone = self.hydra_overview.get("zoneID")
+        changed: set[tuple[str, ...]] = set()
+        for update in updates:
+            changed |= self._shadow.apply(
+                update.reported, update.version, full=update.full
+            )
+        paths = self._shadow_paths(changed, previous_zone) if changed else set()
+        if run is not None:
+            self._irrigation_run = run
+            self._run_view = RunView.from_message(run)
+            self._run_received = self.hass.loop.time()
+            paths.add(PATH_RUN)
+
+        self._last_mqtt_message = self.hass.loop.time()
+        self._async_adjust_polling()
+        if paths:
+            self.async_update_listeners_for(paths)
+        if received is not None:
+            self._metrics.observe("message_to_state", time.monotonic() - received)
+
+    def _shadow_paths(
+        self, changed: set[tuple[str, ...]], previous_zone: Any
+    ) -> set[str]:
+        """Translate changed shadow key paths into listener data paths."""
+        paths: set[str] = set()
+        for key_path in changed:
+            for depth in range(1, len(key_path) + 1):
+                paths.add(shadow_path(*key_path[:depth]))
+        if shadow_path("hydraOverview", "zoneID") in paths:
+            paths.add(zone_path(previous_zone))
+            paths.add(zone_path(self.hydra_overview.get("zoneID")))
+        return paths
+
+    @callback
+    def async_update_listeners_for(self, paths: set[str]) -> None:
+        """Notify listeners subscribed to any of the changed data paths."""
+        notified = 0
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not context.isdisjoint(paths):
+                update_callback()
+                notified += 1
+        self._metrics.increment("listener_updates")
+        self._metrics.increment("listener_notifications", notified)
 
     def _async_message_cb(self, message: dict[str, Any]) -> None:
         """Handle /async/{duid} MQTT messages (called from AWS CRT thread)."""
-        _LOGGER.debug("async mqtt: received message: %s", message)
-
         event = message.get("event")
         if event == "irrigation_run_update":
-            self.hass.loop.call_soon_threadsafe(self._apply_irrigation_run, message)
+            self._inbox.put_run(message)
         else:
             _LOGGER.debug("async mqtt: unhandled event type: %s", event)
 
-    @callback
-    def _apply_irrigation_run(self, message: dict[str, Any]) -> None:
-        """Apply irrigation run update on the event loop."""
-        self._irrigation_run = message
-        self.async_update_listeners()
-
     async def _async_update_data(self) -> CoordinatorData:
-        """Update data via library."""
+        """Update data via library, timing the refresh."""
+        self._metrics.increment("refreshes")
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_data()
+        except Exception:
+            self._metrics.increment("refresh_failures")
+            raise
+        finally:
+            self._metrics.observe("refresh", time.monotonic() - start)
+
+    async def _async_fetch_data(self) -> CoordinatorData:
+        """Fetch the device and its schedules."""
         LOGGER.debug("Updating data for %s", self._device_id)
 
+        self._async_send_presence()
+        self._async_request_shadow_if_quiet()
+
+        # Device and schedules are independent, so fetch them concurrently and
+        # let a schedules failure keep the fresh device payload.
+        requested = self.hass.loop.time()
+        device, schedules = await asyncio.gather(
+            self.client.async_get_device(self._device_id),
+            self.client.async_get_schedules(self._device_id),
+            return_exceptions=True,
+        )
+
+        for result in (device, schedules):
+            if isinstance(result, MoenApiAuthenticationError):
+                raise ConfigEntryAuthFailed(result) from result
+        if isinstance(device, MoenApiError):
+            raise UpdateFailed(device) from device
+        if isinstance(device, BaseException):
+            raise device
+
+        self._set_device_information(device)
+        self._expire_run_view(requested)
+        if isinstance(schedules, MoenApiError):
+            LOGGER.debug(
+                "Schedules update failed for %s, keeping previous: %s",
+                self._device_id,
+                schedules,
+            )
+        elif isinstance(schedules, BaseException):
+            raise schedules
+        else:
+            self._set_schedules({schedule.id: schedule for schedule in schedules})
+
+        self._async_adjust_polling()
+        return {"device": self._device_information, "schedules": self._schedules}
+
+    def _expire_run_view(self, requested: float) -> None:
+        """Drop an active MQTT run status that REST no longer backs up."""
+        # The final run message can be lost, e.g. during a reconnect. Keep the
+        # status only while REST agrees or a run message arrived after the
+        # request went out, so a lagging REST does not end a starting run.
+        if (
+            self._run_view.status in ACTIVE_RUN_STATUSES
+            and not self.is_watering
+            and (self._run_received is None or self._run_received < requested)
+        ):
+            self._irrigation_run = None
+            self._run_view = NO_RUN
+
+    @callback
+    def _async_send_presence(self) -> None:
+        """Fire a presence heartbeat without blocking the refresh."""
         # The presence "heartbeat" is a best-effort ping to tell Moen we are
-        # online. Moen's API has been returning 400/401 for it, and because it
-        # was the first call in the refresh, its failure aborted the whole
-        # update and marked every entity unavailable. Treat it as non-fatal so
-        # device/schedule data (and the MQTT shadow) keep flowing regardless.
+        # online. Moen's API has been returning 400/401 for it, so it must
+        # never fail or delay the refresh. Skip it while one is in flight.
+        if self._presence_task is not None and not self._presence_task.done():
+            return
+        self._presence_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_presence(),
+            name=f"moen_presence_{self._device_id}",
+        )
+
+    async def _async_presence(self) -> None:
+        """Send the presence heartbeat, ignoring failures."""
         try:
             await self.client.async_user_presence()
         except MoenApiError as exception:
             LOGGER.debug("User presence update failed (ignored): %s", exception)
 
-        try:
-            self._device_information = await self.client.async_get_device(
-                self._device_id
-            )
+    @callback
+    def async_restore_snapshot(self, snapshot: DeviceSnapshot) -> None:
+        """Seed device, schedule and shadow state from a warm-start snapshot."""
+        self._set_device_information(Device.from_api(snapshot["device"]))
+        self._set_schedules(
+            {
+                schedule_id: Schedule.from_api(schedule)
+                for schedule_id, schedule in snapshot["schedules"].items()
+            }
+        )
+        self._shadow = ShadowDocument(snapshot["shadow"])
+        self.data = {"device": self._device_information, "schedules": self._schedules}
+
+    def snapshot(self) -> DeviceSnapshot:
+        """Return the current state for the warm-start snapshot."""
+        return {
+            "device": self._device_information.to_dict(),
+            "schedules": {
+                schedule_id: schedule.to_dict()
+                for schedule_id, schedule in self._schedules.items()
+            },
+            "shadow": self._shadow.state,
+        }
+
+    def _polling_target(self) -> tuple[timedelta, PollingReason]:
+        """Return the REST interval suited to the current MQTT and run state."""
+        if self.is_watering or self.irrigation_run_status in ACTIVE_RUN_STATUSES:
+            return UPDATE_INTERVAL_WATERING, "watering"
+        if not (self._mqtt_subscribed and self._mqtt_client.connected):
+            return UPDATE_INTERVAL, "mqtt_down"
+        if self._shadow_unanswered():
+            return UPDATE_INTERVAL, "mqtt_stale"
+        return UPDATE_INTERVAL_MQTT, "mqtt"
+
+    def _shadow_unanswered(self) -> bool:
+        """Return True if the last shadow get got no reply in time."""
+        requested = self._shadow_requested
+        if requested is None:
+            return False
+        if self._last_mqtt_message is not None and self._last_mqtt_message >= requested:
+            return False
+        # A repeated get does not end staleness; only a reply does
+        return (
+            self._polling_reason == "mqtt_stale"
+            or self.hass.loop.time() - requested
+            > MQTT_SHADOW_GET_TIMEOUT.total_seconds()
+        )
 
-            schedules = await self.client.async_get_schedules(self._device_id)
-            self._schedules = {x["id"]: x for x in schedules["items"]}
-        except MoenApiAuthenticationError as exception:
-            raise ConfigEntryAuthFailed(exception) from exception
-        except MoenApiError as exception:
-            raise UpdateFailed(exception) from exception
+    @callback
+    def _async_adjust_polling(self) -> None:
+        """Stretch or tighten the REST interval based on MQTT health."""
+        interval, reason = self._polling_target()
+        self._polling_reason = reason
+        if interval == self.update_interval:
+            return
+        shorter = self.update_interval is None or interval < self.update_interval
+        LOGGER.debug("Polling %s every %s (%s)", self._device_id, interval, reason)
+        self.update_interval = interval
+        # A pending refresh on the old, longer interval would be late, so
+        # reschedule it now. Longer intervals apply from the next refresh.
+        if shorter and self._unsub_refresh is not None:
+            self._schedule_refresh()
 
-        return {"device": self._device_information, "schedules": self._schedules}
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Return device metrics.
+
+        Counters are mqtt_batches, mqtt_messages, listener_updates,
+        listener_notifications, refreshes and refresh_failures; latency is
+        observed for message_to_state and refresh.
+        """
+        return self._metrics
+
+    @property
+    def polling_interval(self) -> timedelta | None:
+        """Return the current REST polling interval."""
+        return self.update_interval
+
+    @property
+    def polling_reason(self) -> PollingReason:
+        """Return why the current REST polling interval was chosen."""
+        return self._polling_reason
 
     @property
     def id(self) -> str:
@@ -196,8 +484,9 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
     @property
     def device_name(self) -> str:
         """Return device name."""
-        return self._device_information.get(
-            "nickname", f"{self.manufacturer} {self.device_type}"
+        return (
+            self._device_information.nickname
+            or f"{self.manufacturer} {self.device_type}"
         )
 
     @property
@@ -206,68 +495,64 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         return self._manufacturer
 
     @property
-    def device_type(self) -> str:
+    def device_type(self) -> str | None:
         """Return type for device."""
-        return self._device_information["type"]
+        return self._device_information.type
+
+    @property
+    def device(self) -> Device:
+        """Return the decoded device payload."""
+        return self._device_information
+
+    @property
+    def run_view(self) -> RunView:
+        """Return values precomputed from the latest irrigation run message."""
+        return self._run_view
 
     @property
     def rssi(self) -> float | None:
         """Return rssi for device."""
-        return self._device_information.get("connectivity", {}).get("rssi")
+        return self._device_information.rssi
 
     @property
-    def firmware_version(self) -> str:
+    def firmware_version(self) -> str | None:
         """Return the firmware version for the device."""
-        return self._device_information["firmware"]["version"]
+        return self._device_information.firmware_version
 
     @property
-    def last_connect_time(self) -> str:
+    def last_connect_time(self) -> str | None:
         """Return lastConnect for device."""
-        return self._device_information["lastConnect"]
+        return self._device_information.last_connect
 
     @property
     def available(self) -> bool:
         """Return True if device is available."""
-        return self.last_update_success and self._device_information["connected"]
+        return self.last_update_success and self._device_information.connected
 
     @property
     def is_watering(self) -> bool:
         """Return True if device is watering."""
-        return bool(
-            self._device_information.get("irrigation", {})
-            .get("wateringState", {})
-            .get("running", False)
-        )
+        return self._device_information.is_watering
 
     @property
     def master_valve_connected(self) -> bool:
         """Return True if master valve connected."""
-        return self._device_information.get("irrigation", {}).get(
-            "masterValveConnected", False
-        )
+        return self._device_information.master_valve_connected
 
     @property
     def rain_sensor_connected(self) -> bool:
         """Return True if rain sensor connected."""
-        return (
-            self._device_information.get("irrigation", {})
-            .get("rainSensor", {})
-            .get("connected", False)
-        )
+        return self._device_information.rain_sensor_connected
 
     @property
     def flow_sensor_connected(self) -> bool:
         """Return True if flow sensor connected."""
-        return (
-            self._device_information.get("irrigation", {})
-            .get("flowSensor", {})
-            .get("connected", False)
-        )
+        return self._device_information.flow_sensor_connected
 
     @property
     def hydra_overview(self) -> dict:
         """Return shadow hydra overview state."""
-        return self._shadow_state.get("hydraOverview", {})
+        return self._shadow.state.get("hydraOverview", {})
 
     @property
     def irrigation_run(self) -> IrrigationRunMessage | None:
@@ -277,102 +562,72 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
     @property
     def irrigation_run_status(self) -> str | None:
         """Return the current irrigation run status."""
-        if self._irrigation_run is None:
-            return None
-        return self._irrigation_run.get("body", {}).get("state", {}).get("status")
+        return self._run_view.status
 
-    def zones(self) -> list[ZoneData]:
+    def zones(self) -> tuple[Zone, ...]:
         """Return zones."""
-        return self._device_information.get("irrigation", {}).get("zones", [])
+        return self._device_information.zones
 
-    def zone_from_client_id(self, client_id: int | str) -> ZoneData | None:
+    def zone_from_client_id(self, client_id: int | str) -> Zone | None:
         """Return zone from client id."""
-        return next(
-            (zone for zone in self.zones() if zone["clientId"] == str(client_id)), None
-        )
+        return self._zones_by_client_id.get(str(client_id))
+
+    def zone_from_id(self, zone_id: str) -> Zone | None:
+        """Return zone from its full id ({duid}_{clientId})."""
+        return self._zones_by_id.get(zone_id)
+
+    def zone_from_name(self, name: str) -> Zone | None:
+        """Return zone from its name."""
+        return self._zones_by_name.get(name)
+
+    def _set_device_information(self, data: Device) -> None:
+        """Replace device data, rebuilding zone indexes if it changed."""
+        if data == self._device_information:
+            return
+        self._device_information = data
+        self._index_zones()
+
+    def _set_schedules(self, schedules: dict[str, Schedule]) -> None:
+        """Replace schedules, recompiling them if they changed."""
+        if schedules == self._schedules:
+            return
+        self._schedules = schedules
+        self._schedule_index = ScheduleIndex.from_schedules(schedules)
+
+    def _index_zones(self) -> None:
+        """Index zones by client id, full id and name for O(1) lookups."""
+        zones = self.zones()
+        self._zones_by_client_id = {zone.client_id: zone for zone in zones}
+        self._zones_by_id = {zone.id: zone for zone in zones}
+        self._zones_by_name = {zone.name: zone for zone in zones}
 
     @property
     def watering_mode(self) -> str | None:
         """Return the current watering mode."""
-        return self._device_information.get("irrigation", {}).get("wateringMode")
+        return self._device_information.watering_mode
 
     @property
     def active_zone_duration_remaining(self) -> int | None:
         """Return duration remaining (s) for the active zone."""
-        if self._irrigation_run is None:
-            return None
-        planned = (
-            self._irrigation_run.get("body", {}).get("state", {}).get("planned", [])
-        )
-        for entry in planned:
-            if entry.get("isActive"):
-                return entry.get("durationRemaining")
-        return None
+        return self._run_view.active_zone_duration_remaining
 
     @property
     def active_zone_id(self) -> str | None:
         """Return zone id of the currently active zone from irrigation run."""
-        if self._irrigation_run is None:
-            return None
-        planned = (
-            self._irrigation_run.get("body", {}).get("state", {}).get("planned", [])
-        )
-        for entry in planned:
-            if entry.get("isActive"):
-                return entry.get("zoneId")
-        return None
-
-    @staticmethod
-    def matches_schedule_day(
-        candidate: datetime,
-        schedule: dict,
-    ) -> bool:
-        """Check if a candidate date matches a schedule's frequency."""
-        frequency = schedule.get("frequency")
-        if frequency == "daily":
-            return True
-        if frequency == "weekly":
-            days = schedule.get("daysOfWeek") or []
-            return candidate.strftime("%A").lower() in [d.lower() for d in days]
-        if frequency == "even":
-            return candidate.day % 2 == 0
-        if frequency == "odd":
-            return candidate.day % 2 == 1
-        return False
+        return self._run_view.active_zone_id
+
+    @property
+    def schedules(self) -> dict[str, Schedule]:
+        """Return schedules keyed by id."""
+        return self._schedules
+
+    @property
+    def schedule_index(self) -> ScheduleIndex:
+        """Return the compiled active schedules."""
+        return self._schedule_index
 
     @property
     def next_schedule_run(self) -> datetime | None:
-        """Compute the next scheduled run time from active schedules."""
-        now = dt_util.now()
-        next_run: datetime | None = None
-
-        for schedule in self._schedules.values():
-            if schedule.get("status") != "active":
-                continue
-            start_at = schedule.get("preferredTime", {}).get("startAt")
-            if not start_at:
-                continue
-            try:
-                time_parts = start_at.split(":")
-                run_hour = int(time_parts[0])
-                run_minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-            except (ValueError, IndexError):
-                continue
-
-            for day_offset in range(14):
-                candidate = now + timedelta(days=day_offset)
-                candidate = candidate.replace(
-                    hour=run_hour,
-                    minute=run_minute,
-                    second=0,
-                    microsecond=0,
-                )
-                if candidate <= now:
-                    continue
-                if not self.matches_schedule_day(candidate, schedule):
-                    continue
-                if next_run is None or candidate < next_run:
-                    next_run = candidate
-                break
-
-        return next_run
+        """Return the next scheduled run time from active schedules."""
+        occurrence = self._schedule_index.next_occurrence(dt_util.now())
+        return occurrence.start if occurrence is not None else None
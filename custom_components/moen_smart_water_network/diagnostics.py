@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
 
-from .const import CLIENT, DOMAIN
+from .const import CLIENT, CONF_DIAGNOSTICS_PROBE, DOMAIN, MQTT_CLIENT
+from .moen_api import MoenApiError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
-    from .moen_api import MoenApiClient
+    from .coordinator import MoenDataUpdateCoordinator
+    from .moen_api import MoenApiClient, MoenMqttClient
 
 TO_REDACT = {
     "access_token",
@@ -25,10 +31,94 @@ TO_REDACT = {
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
-    client: MoenApiClient = hass.data[DOMAIN][entry.entry_id][CLIENT]
+    """
+    Return diagnostics for a config entry.
+
+    Built from the state the coordinators already hold, so downloading them
+    makes no API calls unless the diagnostics_probe option is set.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client: MoenApiClient = entry_data[CLIENT]
+    mqtt_client: MoenMqttClient = entry_data[MQTT_CLIENT]
+    coordinators: list[MoenDataUpdateCoordinator] = entry_data["devices"]
+
+    diagnostics: dict[str, Any] = {
+        "devices": {
+            coordinator.id: _device_diagnostics(coordinator)
+            for coordinator in coordinators
+        },
+        "mqtt": {"state": mqtt_client.state, **mqtt_client.trace.as_dict()},
+        "metrics": {
+            "api": client.metrics.as_dict(),
+            "limiter": client.limiter.as_dict(),
+            "auth": client.auth.metrics.as_dict(),
+            "mqtt": mqtt_client.metrics.as_dict(),
+        },
+    }
+    if entry.options.get(CONF_DIAGNOSTICS_PROBE):
+        diagnostics["probe"] = await _async_probe(client, coordinators)
+
+    return async_redact_data(diagnostics, TO_REDACT)
+
+
+def _device_diagnostics(coordinator: MoenDataUpdateCoordinator) -> dict[str, Any]:
+    """Return what a coordinator holds for its device."""
+    interval = coordinator.polling_interval
+    return {
+        **coordinator.snapshot(),
+        "irrigation_run": coordinator.irrigation_run,
+        "last_update_success": coordinator.last_update_success,
+        "polling": {
+            "interval": interval.total_seconds() if interval is not None else None,
+            "reason": coordinator.polling_reason,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+    }
+
+
+async def _async_probe(
+    client: MoenApiClient, coordinators: list[MoenDataUpdateCoordinator]
+) -> dict[str, Any]:
+    """Fetch the device list and every device concurrently, timing each call."""
+    start = time.monotonic()
+    devices, *results = await asyncio.gather(
+        _async_timed(client.async_get_devices),
+        *(
+            _async_timed(call, coordinator.id)
+            for coordinator in coordinators
+            for call in (client.async_get_device, client.async_get_schedules)
+        ),
+    )
+    if (payload := devices.pop("result", None)) is not None:
+        devices["result"] = [device.get("duid") for device in payload["devices"]]
+    probe: dict[str, Any] = {
+        "duration_ms": _ms(time.monotonic() - start),
+        "device_list": devices,
+        "devices": {},
+    }
+    for coordinator, device, schedules in zip(
+        coordinators, results[::2], results[1::2], strict=True
+    ):
+        if (model := device.get("result")) is not None:
+            device["result"] = model.to_dict()
+        if (models := schedules.get("result")) is not None:
+            schedules["result"] = [schedule.to_dict() for schedule in models]
+        probe["devices"][coordinator.id] = {"device": device, "schedules": schedules}
+    return probe
+
+
+async def _async_timed(
+    call: Callable[..., Awaitable[Any]], *args: Any
+) -> dict[str, Any]:
+    """Run an API call and return its duration with its result or error."""
+    start = time.monotonic()
+    try:
+        result = await call(*args)
+    except MoenApiError as err:
+        return {"duration_ms": _ms(time.monotonic() - start), "error": str(err)}
+    return {"duration_ms": _ms(time.monotonic() - start), "result": result}
 
-    devices = await client.async_get_devices()
-    schedules = await client.async_get_schedules(devices["devices"][0]["duid"])
 
-    return async_redact_data({"devices": devices, "schedules": schedules}, TO_REDACT)
+def _ms(seconds: float) -> float:
+    """Convert seconds to rounded milliseconds."""
+    return round(seconds * 1000, 3)
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
     from .coordinator import MoenDataUpdateCoordinator
-    from .moen_api.models import ZoneData
+    from .moen_api.models import Zone
 
 
 class MoenEntity(Entity):
@@ -23,6 +23,10 @@ class MoenEntity(Entity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
+    # Coordinator data paths pushed over MQTT that this entity reads. None
+    # means every update; an empty set means REST refreshes only.
+    _data_paths: frozenset[str] | None = None
+
     def __init__(
         self,
         device: MoenDataUpdateCoordinator,
@@ -50,9 +54,16 @@ class MoenEntity(Entity):
         """Update Moen entity."""
         await self._device.async_request_refresh()
 
+    @property
+    def data_paths(self) -> frozenset[str] | None:
+        """Return the MQTT-driven data paths this entity depends on."""
+        return self._data_paths
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        self.async_on_remove(self._device.async_add_listener(self.async_write_ha_state))
+        self.async_on_remove(
+            self._device.async_add_listener(self.async_write_ha_state, self.data_paths)
+        )
 
 
 class MoenZoneEntity(MoenEntity):
@@ -61,13 +72,13 @@ class MoenZoneEntity(MoenEntity):
     def __init__(
         self,
         coordinator: MoenDataUpdateCoordinator,
-        data: ZoneData,
+        data: Zone,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize with zone data and config entry."""
-        self._zone_name = data["name"]
-        self._zone_number = data["clientId"]
-        self._zone_full_id = data["id"]
+        self._zone_name = data.name
+        self._zone_number = data.client_id
+        self._zone_full_id = data.id
         self._config_entry = config_entry
         super().__init__(coordinator)
 
@@ -0,0 +1,100 @@
+"""Batched hand-off of MQTT messages onto the Home Assistant event loop."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, TimerHandle
+    from collections.abc import Callable
+
+    from .moen_api.models import IrrigationRunMessage
+    from .moen_api.shadow import ShadowUpdate
+
+    BatchHandler = Callable[
+        [list[ShadowUpdate], IrrigationRunMessage | None, float | None], None
+    ]
+
+
+class MessageInbox:
+    """
+    Collect a device's MQTT messages on the AWS CRT thread.
+
+    The first message of a batch wakes the event loop once; further messages
+    arriving within the coalescing window join the same batch. Shadow updates
+    are kept in arrival order so they can be applied as successive deltas,
+    while only the latest irrigation run message is kept. The handler also
+    receives the monotonic time the batch's first message arrived.
+    """
+
+    def __init__(
+        self, loop: AbstractEventLoop, handler: BatchHandler, window: float
+    ) -> None:
+        """Initialize with the batch handler and coalescing window (seconds)."""
+        self._loop = loop
+        self._handler = handler
+        self._window = window
+        self._lock = threading.Lock()
+        self._shadow_updates: list[ShadowUpdate] = []
+        self._run: IrrigationRunMessage | None = None
+        self._received = 0.0
+        self._scheduled = False
+        self._closed = False
+        self._timer: TimerHandle | None = None
+
+    def put_shadow(self, update: ShadowUpdate) -> None:
+        """Queue a shadow update (any thread)."""
+        with self._lock:
+            self._shadow_updates.append(update)
+            self._wake()
+
+    def put_run(self, message: IrrigationRunMessage) -> None:
+        """Queue an irrigation run message, replacing any pending one."""
+        with self._lock:
+            self._run = message
+            self._wake()
+
+    def _wake(self) -> None:
+        """Schedule a flush unless one is pending (lock held)."""
+        if self._scheduled or self._closed:
+            return
+        self._received = time.monotonic()
+        self._scheduled = True
+        self._loop.call_soon_threadsafe(self._async_schedule_flush)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush now or at the end of the coalescing window."""
+        if self._closed:
+            return
+        if self._window <= 0:
+            self._async_flush()
+            return
+        self._timer = self._loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Hand the pending batch to the handler."""
+        self._timer = None
+        with self._lock:
+            updates, self._shadow_updates = self._shadow_updates, []
+            run, self._run = self._run, None
+            self._scheduled = False
+            received = self._received
+        if updates or run is not None:
+            self._handler(updates, run, received)
+
+    @callback
+    def async_close(self) -> None:
+        """Drop pending messages and stop accepting new ones."""
+        with self._lock:
+            self._closed = True
+            self._shadow_updates = []
+            self._run = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
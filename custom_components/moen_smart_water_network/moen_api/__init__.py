@@ -2,18 +2,24 @@
 
 from .auth import MoenAuth
 from .client import MoenApiClient
+from .endpoints import DEFAULT_ENDPOINTS, Endpoints
 from .exceptions import (
     MoenApiAuthenticationError,
     MoenApiCommunicationError,
     MoenApiError,
+    MoenApiRateLimitError,
 )
-from .mqtt import MoenMqttClient
+from .mqtt import MoenMqttClient, MqttState
 
 __all__ = [
+    "DEFAULT_ENDPOINTS",
+    "Endpoints",
     "MoenApiAuthenticationError",
     "MoenApiClient",
     "MoenApiCommunicationError",
     "MoenApiError",
+    "MoenApiRateLimitError",
     "MoenAuth",
     "MoenMqttClient",
+    "MqttState",
 ]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 import socket
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
@@ -13,14 +16,55 @@ import jwt
 from aiohttp import ClientSession
 from awscrt import auth, io
 
-from .const import COGNITO_ENDPOINT, OAUTH_CLIENT_ID, OAUTH_URL, USER_AGENT
+from .const import OAUTH_CLIENT_ID, USER_AGENT
+from .endpoints import DEFAULT_ENDPOINTS
 from .exceptions import (
     MoenApiAuthenticationError,
     MoenApiCommunicationError,
 )
+from .metrics import Metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .endpoints import Endpoints
+    from .models import StoredCredentials
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh cached credentials this long before they expire
+EXPIRY_MARGIN = datetime.timedelta(minutes=5)
+
+# Cognito temporary credentials are valid for one hour
+COGNITO_CREDENTIALS_TTL = datetime.timedelta(hours=1)
+
+
+def _token_expiration(token: str) -> datetime.datetime | None:
+    """Return the expiry encoded in a JWT access token, if readable."""
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+    except (jwt.PyJWTError, KeyError, TypeError):
+        return None
+    return datetime.datetime.fromtimestamp(exp, tz=datetime.UTC)
+
+
+def _expiring(expiration: datetime.datetime | None) -> bool:
+    """Return True if an expiry is unknown or within the refresh margin."""
+    return (
+        expiration is None
+        or datetime.datetime.now(tz=datetime.UTC) >= expiration - EXPIRY_MARGIN
+    )
+
+
+def _parse_datetime(value: str | None) -> datetime.datetime | None:
+    """Parse a persisted ISO timestamp."""
+    return datetime.datetime.fromisoformat(value) if value else None
+
+
+def _format_datetime(value: datetime.datetime | None) -> str | None:
+    """Format a timestamp for persistence."""
+    return value.isoformat() if value is not None else None
+
 
 class MoenAuth:
     """Manages OAuth2 tokens and AWS Cognito credentials for Moen API access."""
@@ -30,13 +74,42 @@ class MoenAuth:
         access_token: str,
         refresh_token: str,
         session: ClientSession,
+        on_update: Callable[[], None] | None = None,
+        endpoints: Endpoints = DEFAULT_ENDPOINTS,
     ) -> None:
-        """Initialize with OAuth2 tokens."""
+        """
+        Initialize with OAuth2 tokens.
+
+        on_update is called whenever tokens or AWS credentials change so they
+        can be persisted. It may be called from an AWS CRT thread.
+        """
         self._session = session
+        self._on_update = on_update
+        self._endpoints = endpoints
         self._token = access_token
         self._refresh_token = refresh_token
-        self._token_expiration: datetime.datetime | None = None
+        self._token_expiration = _token_expiration(access_token)
         self._id_token: str | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._aws_credentials: auth.AwsCredentials | None = None
+        self._aws_credentials_lock = threading.Lock()
+        self._tls_ctx: io.ClientTlsContext | None = None
+        self._metrics = Metrics()
+
+    @property
+    def endpoints(self) -> Endpoints:
+        """Return the service endpoints."""
+        return self._endpoints
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Return auth metrics.
+
+        Counters are token_refreshes, token_refresh_errors and
+        cognito_requests; latency is observed for token_refresh and cognito.
+        """
+        return self._metrics
 
     @property
     def access_token(self) -> str:
@@ -48,12 +121,53 @@ class MoenAuth:
         """Return the current ID token."""
         return self._id_token
 
-    async def async_refresh_token(self) -> None:
-        """Refresh tokens from the OAuth2 endpoint."""
+    async def async_refresh_token(self, stale_token: str | None = None) -> None:
+        """
+        Refresh tokens from the OAuth2 endpoint.
+
+        Concurrent callers share a single in-flight refresh. Passing the token
+        a failed request was sent with skips the refresh when another caller
+        has already replaced it.
+        """
+        if stale_token is not None and stale_token != self._token:
+            return
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._async_refresh_token()
+            )
+            self._refresh_task.add_done_callback(self._async_refresh_done)
+        # Shield so one cancelled caller does not abort everyone's refresh
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh_token(self) -> None:
+        """Perform the OAuth2 refresh request."""
+        self._metrics.increment("token_refreshes")
+        start = time.monotonic()
+        try:
+            await self._async_request_token()
+        except Exception:
+            self._metrics.increment("token_refresh_errors")
+            raise
+        finally:
+            self._metrics.observe("token_refresh", time.monotonic() - start)
+
+    def _async_refresh_done(self, task: asyncio.Task[None]) -> None:
+        """
+        Clear the finished refresh and retrieve its outcome.
+
+        Every caller may have been cancelled by then, in which case nobody
+        else retrieves a failure and asyncio would log it as never retrieved.
+        """
+        self._refresh_task = None
+        if not task.cancelled() and (err := task.exception()) is not None:
+            _LOGGER.debug("Token refresh failed: %s", err)
+
+    async def _async_request_token(self) -> None:
+        """Request and store new tokens."""
         _LOGGER.debug("Requesting new access token")
         auth_response: dict = await self._api_wrapper(
             method="post",
-            url=OAUTH_URL,
+            url=self._endpoints.oauth_url,
             data={
                 "client_id": OAUTH_CLIENT_ID,
                 "refresh_token": self._refresh_token,
@@ -72,12 +186,62 @@ class MoenAuth:
             auth_response["token"]["expires_in"],
             self._token_expiration,
         )
+        self._notify_update()
+
+    def restore(self, stored: StoredCredentials) -> None:
+        """Restore persisted tokens and AWS credentials."""
+        if stored.get("refresh_token") != self._refresh_token:
+            # The entry was re-authenticated; the stored tokens are stale
+            return
+        if access_token := stored.get("access_token"):
+            self._token = access_token
+            self._token_expiration = _parse_datetime(stored.get("token_expiration"))
+        self._id_token = stored.get("id_token") or self._id_token
+        if (access_key_id := stored.get("aws_access_key_id")) and (
+            secret_access_key := stored.get("aws_secret_access_key")
+        ):
+            self._aws_credentials = auth.AwsCredentials(
+                access_key_id,
+                secret_access_key,
+                stored.get("aws_session_token"),
+                _parse_datetime(stored.get("aws_expiration")),
+            )
+
+    def as_dict(self) -> StoredCredentials:
+        """Return tokens and AWS credentials for persistence."""
+        stored: StoredCredentials = {
+            "access_token": self._token,
+            "refresh_token": self._refresh_token,
+            "id_token": self._id_token,
+            "token_expiration": _format_datetime(self._token_expiration),
+        }
+        if (credentials := self._aws_credentials) is not None:
+            stored["aws_access_key_id"] = credentials.access_key_id
+            stored["aws_secret_access_key"] = credentials.secret_access_key
+            stored["aws_session_token"] = credentials.session_token
+            stored["aws_expiration"] = _format_datetime(credentials.expiration)
+        return stored
+
+    def _notify_update(self) -> None:
+        """Tell the owner that credentials changed."""
+        if self._on_update is not None:
+            self._on_update()
 
     async def async_ensure_token(self) -> None:
-        """Refresh the token if it is expired or about to expire."""
-        if self._token_expiration is None or datetime.datetime.now(
-            tz=datetime.UTC
-        ) >= self._token_expiration - datetime.timedelta(minutes=5):
+        """
+        Refresh the token if it is expired or about to expire.
+
+        Without a known expiry the token is used as-is and a 401 triggers the
+        refresh instead.
+        """
+        if self._token_expiration is None:
+            return
+        if _expiring(self._token_expiration):
+            await self.async_refresh_token(stale_token=self._token)
+
+    async def async_ensure_id_token(self) -> None:
+        """Refresh tokens if no ID token is available for Cognito logins."""
+        if self._id_token is None:
             await self.async_refresh_token()
 
     def get_auth_headers(self) -> dict[str, str]:
@@ -87,23 +251,53 @@ class MoenAuth:
     def create_cognito_credentials_provider(
         self, legacy_id: str
     ) -> auth.AwsCredentialsProvider:
-        """Create an AWS Cognito credentials provider for MQTT connections."""
+        """
+        Create an AWS Cognito credentials provider for MQTT connections.
+
+        Temporary credentials are cached (and persisted through on_update)
+        until they near expiry, so reconnects and restarts skip Cognito.
+        """
         vals = jwt.decode(self._token, options={"verify_signature": False})
         iss = vals["iss"].removeprefix("https://")
 
         def credentials_factory() -> auth.AwsCredentials:
-            _LOGGER.debug("credentials_factory was called")
-            cog = auth.AwsCredentialsProvider.new_cognito(
-                endpoint=COGNITO_ENDPOINT,
-                identity=legacy_id,
-                logins=[(iss, self._id_token)],
-                tls_ctx=io.ClientTlsContext(io.TlsContextOptions()),
-            )
-            f = cog.get_credentials()
-            return f.result()
+            with self._aws_credentials_lock:
+                cached = self._aws_credentials
+                if cached is not None and not _expiring(cached.expiration):
+                    return cached
+
+                _LOGGER.debug("Requesting AWS credentials from Cognito")
+                self._metrics.increment("cognito_requests")
+                start = time.monotonic()
+                if self._tls_ctx is None:
+                    self._tls_ctx = io.ClientTlsContext(io.TlsContextOptions())
+                cog = auth.AwsCredentialsProvider.new_cognito(
+                    endpoint=self._endpoints.cognito_endpoint,
+                    identity=legacy_id,
+                    logins=[(iss, self._id_token)],
+                    tls_ctx=self._tls_ctx,
+                )
+                credentials = cog.get_credentials().result()
+                self._metrics.observe("cognito", time.monotonic() - start)
+                if credentials.expiration is None:
+                    credentials = auth.AwsCredentials(
+                        credentials.access_key_id,
+                        credentials.secret_access_key,
+                        credentials.session_token,
+                        datetime.datetime.now(tz=datetime.UTC)
+                        + COGNITO_CREDENTIALS_TTL,
+                    )
+                self._aws_credentials = credentials
+            self._notify_update()
+            return credentials
 
         return auth.AwsCredentialsProvider.new_delegate(credentials_factory)
 
+    def invalidate_aws_credentials(self) -> None:
+        """Drop cached AWS credentials so the next connect fetches new ones."""
+        with self._aws_credentials_lock:
+            self._aws_credentials = None
+
     async def _api_wrapper(
         self,
         method: str,
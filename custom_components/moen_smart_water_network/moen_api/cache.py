@@ -0,0 +1,99 @@
+"""Conditional GET response cache for the Moen REST API."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .decoder import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A parsed response body plus the validators needed to revalidate it."""
+
+    value: Any
+    digest: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validator_headers(self) -> dict[str, str]:
+        """Return conditional request headers for this response."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache parsed GET responses keyed by URL and query parameters.
+
+    Responses carrying ETag/Last-Modified are revalidated with conditional
+    requests and served from the cache on 304. When the server sends no
+    validators, a digest of the raw body lets an unchanged 200 reuse the
+    previously parsed object instead of decoding the JSON again. An optional
+    decoder turns the JSON into a model, in which case only the model is kept.
+
+    Cached values are shared with callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize an empty cache."""
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None) -> CacheKey:
+        """Return the cache key for a URL and its query parameters."""
+        if not params:
+            return (url, ())
+        return (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Return the cached response for a key, if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def resolve(
+        self,
+        key: CacheKey,
+        body: bytes,
+        headers: Mapping[str, str],
+        decode: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Store a 200 response and return its parsed (and decoded) body."""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        entry = self._entries.get(key)
+        if entry is not None and entry.digest == digest:
+            value = entry.value
+        else:
+            value = loads(body)
+            if decode is not None:
+                value = decode(value)
+
+        self._entries[key] = CachedResponse(
+            value=value,
+            digest=digest,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
@@ -0,0 +1,90 @@
+"""Capture of MQTT and REST traffic to a line-delimited file."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class TrafficRecorder:
+    """
+    Append timestamped MQTT messages and REST responses to an NDJSON file.
+
+    Each line holds the seconds since capture started, the source ("mqtt" or
+    "rest") and the raw payload text, so a capture can be replayed exactly.
+    Records are queued from any thread and written by a dedicated writer
+    thread, keeping file I/O off the event loop and the AWS CRT threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Start a writer thread appending to path."""
+        self._path = Path(path)
+        self._start = time.monotonic()
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="moen_capture", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def path(self) -> Path:
+        """Return the capture file path."""
+        return self._path
+
+    def record_mqtt(self, topic: str, payload: bytes) -> None:
+        """Queue an MQTT message (any thread)."""
+        self._queue.put(
+            {
+                "t": round(time.monotonic() - self._start, 6),
+                "src": "mqtt",
+                "topic": topic,
+                "payload": payload.decode(errors="replace"),
+            }
+        )
+
+    def record_rest(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        status: int,
+        body: bytes,
+    ) -> None:
+        """Queue a REST response (any thread)."""
+        self._queue.put(
+            {
+                "t": round(time.monotonic() - self._start, 6),
+                "src": "rest",
+                "method": method,
+                "url": url,
+                "params": params,
+                "status": status,
+                "payload": body.decode(errors="replace"),
+            }
+        )
+
+    def close(self) -> None:
+        """Flush queued records and stop the writer thread (blocking)."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _write_loop(self) -> None:
+        """Write queued records until closed."""
+        try:
+            with self._path.open("a", encoding="utf-8") as file:
+                while (record := self._queue.get()) is not _STOP:
+                    file.write(json.dumps(record, separators=(",", ":")))
+                    file.write("\n")
+                    if self._queue.empty():
+                        file.flush()
+        except OSError:
+            _LOGGER.exception("Traffic capture to %s failed", self._path)
@@ -2,100 +2,183 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
 import socket
+import time
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
 
-from .const import API_BASE_URL_V1, API_BASE_URL_V3, API_USER_URL, LAMBDA_INVOKE_URL
+from .cache import ResponseCache
+from .const import (
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_RETRY_AFTER_DEFAULT,
+    API_RETRY_AFTER_MAX,
+)
+from .decoder import loads
+from .endpoints import DEFAULT_ENDPOINTS
 from .exceptions import (
     MoenApiAuthenticationError,
     MoenApiCommunicationError,
+    MoenApiRateLimitError,
 )
+from .limiter import RateLimiter, RequestPriority
+from .metrics import Metrics
+from .models import Device, Schedule
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from aiohttp import ClientSession
 
     from .auth import MoenAuth
-    from .models import DeviceData, DevicesResponse, SchedulesResponse, ZoneDuration
+    from .cache import CachedResponse, CacheKey
+    from .capture import TrafficRecorder
+    from .endpoints import Endpoints
+    from .models import DevicesResponse, ZoneDuration
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _retry_after(value: str | None) -> float:
+    """Return the seconds to wait from a Retry-After header (delay or date)."""
+    if not value:
+        return API_RETRY_AFTER_DEFAULT
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return API_RETRY_AFTER_DEFAULT
+    return max(0.0, (when - datetime.datetime.now(tz=datetime.UTC)).total_seconds())
+
+
 class MoenApiClient:
     """REST API client for Moen Smart Water Network devices."""
 
-    def __init__(self, auth: MoenAuth, session: ClientSession) -> None:
-        """Initialize with auth manager and aiohttp session."""
+    def __init__(
+        self,
+        auth: MoenAuth,
+        session: ClientSession,
+        endpoints: Endpoints = DEFAULT_ENDPOINTS,
+    ) -> None:
+        """Initialize with auth manager, aiohttp session and service endpoints."""
         self._auth = auth
         self._session = session
+        self._endpoints = endpoints
+        self._cache = ResponseCache()
+        self._recorder: TrafficRecorder | None = None
+        self._metrics = Metrics()
+        self._limiter = RateLimiter(API_RATE_LIMIT, API_RATE_BURST, self._metrics)
 
     @property
     def auth(self) -> MoenAuth:
         """Return the auth manager."""
         return self._auth
 
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Return request metrics.
+
+        Counters are requests.<endpoint>, errors.<endpoint>,
+        not_modified.<endpoint>, auth_retries, rate_limited, rate_limit_retries,
+        device_requests.<duid> (one per attempt, retries included) and
+        throttled.<priority>; latency is observed
+        per endpoint and as wait.<priority> for requests queued by the limiter.
+        """
+        return self._metrics
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """Return the account's request rate limiter."""
+        return self._limiter
+
+    def set_recorder(self, recorder: TrafficRecorder | None) -> None:
+        """Capture REST responses to recorder, or stop capturing."""
+        self._recorder = recorder
+
     async def async_get_alerts(self) -> Any:
         """Get alerts from the API."""
         return await self._request_with_refresh(
-            method="get", url=f"{API_BASE_URL_V3}/events/alerts"
+            method="get",
+            url=f"{self._endpoints.api_v3}/events/alerts",
+            endpoint="alerts",
         )
 
     async def async_app_shadow_get(self, client_id: str) -> dict:
         """Get app shadow data."""
         return await self._request_with_refresh(
             method="post",
-            url=LAMBDA_INVOKE_URL,
+            url=self._endpoints.lambda_invoke_url,
             data={
                 "escape": False,
                 "parse": False,
                 "fn": "smartwater-app-shadow-api-prod-get",
                 "body": {"shadow": False, "locale": "en_US", "clientId": client_id},
             },
+            endpoint="app_shadow",
         )
 
     async def async_get_user(self) -> dict:
         """Get user data from the API."""
-        return await self._request_with_refresh(method="get", url=API_USER_URL)
+        return await self._request_with_refresh(
+            method="get", url=self._endpoints.user_url, endpoint="user"
+        )
 
     async def async_user_presence(self, duration_seconds: int = 35) -> dict:
         """Send a presence update for the user."""
         return await self._request_with_refresh(
             method="post",
-            url=f"{API_BASE_URL_V1}/user/me/presence",
+            url=f"{self._endpoints.api_v1}/user/me/presence",
             data={"durationSeconds": duration_seconds},
+            endpoint="presence",
+            priority=RequestPriority.BACKGROUND,
         )
 
     async def async_get_devices(self) -> DevicesResponse:
         """Get all devices from the API."""
         return await self._request_with_refresh(
-            method="get", url=f"{API_BASE_URL_V3}/devices"
+            method="get", url=f"{self._endpoints.api_v3}/devices", endpoint="devices"
         )
 
-    async def async_get_device(self, device_id: str) -> DeviceData:
+    async def async_get_device(self, device_id: str) -> Device:
         """Get a single device from the API."""
         return await self._request_with_refresh(
             method="get",
-            url=f"{API_BASE_URL_V3}/device/{device_id}",
+            url=f"{self._endpoints.api_v3}/device/{device_id}",
             params={"expand": "addons"},
+            decode=Device.from_api,
+            endpoint="device",
+            device_id=device_id,
         )
 
-    async def async_get_schedules(self, device_id: str) -> SchedulesResponse:
+    async def async_get_schedules(self, device_id: str) -> tuple[Schedule, ...]:
         """Get irrigation schedules for a device."""
         return await self._request_with_refresh(
             method="get",
-            url=f"{API_BASE_URL_V3}/irrigation/schedules",
+            url=f"{self._endpoints.api_v3}/irrigation/schedules",
             params={"duid": device_id, "type": "scheduled"},
+            decode=Schedule.from_response,
+            endpoint="schedules",
+            device_id=device_id,
         )
 
     async def async_get_schedule_summary(self, device_id: str) -> dict:
         """Get schedule summary for a device."""
         return await self._request_with_refresh(
             method="get",
-            url=f"{API_BASE_URL_V3}/irrigation/schedules/summary",
+            url=f"{self._endpoints.api_v3}/irrigation/schedules/summary",
             params={"duid": device_id},
+            endpoint="schedule_summary",
+            device_id=device_id,
         )
 
     async def async_create_manual_plan(
@@ -104,66 +187,143 @@ class MoenApiClient:
         """Create a manual irrigation plan using the APK ZoneDuration format."""
         data = {"duid": device_id, "zones": zones, "name": name, "ttl": 0}
         return await self._request_with_refresh(
-            method="post", url=f"{API_BASE_URL_V3}/irrigation/manual", data=data
+            method="post",
+            url=f"{self._endpoints.api_v3}/irrigation/manual",
+            data=data,
+            endpoint="manual_plan",
+            device_id=device_id,
+            priority=RequestPriority.COMMAND,
         )
 
     async def async_enable_zone(self, device_id: str, zone_id: str) -> dict:
         """Enable a zone."""
         return await self._request_with_refresh(
             method="post",
-            url=f"{API_BASE_URL_V3}/device/{device_id}/zone/{device_id}_{zone_id}",
+            url=f"{self._endpoints.api_v3}/device/{device_id}/zone/{device_id}_{zone_id}",
             data={"enabled": True},
+            endpoint="zone",
+            device_id=device_id,
+            priority=RequestPriority.COMMAND,
         )
 
     async def async_disable_zone(self, device_id: str, zone_id: str) -> dict:
         """Disable a zone."""
         return await self._request_with_refresh(
             method="post",
-            url=f"{API_BASE_URL_V3}/device/{device_id}/zone/{device_id}_{zone_id}",
+            url=f"{self._endpoints.api_v3}/device/{device_id}/zone/{device_id}_{zone_id}",
             data={"enabled": False},
+            endpoint="zone",
+            device_id=device_id,
+            priority=RequestPriority.COMMAND,
         )
 
     async def async_update_zone(self, device_id: str, zone_id: str, data: dict) -> dict:
         """Update zone configuration."""
         return await self._request_with_refresh(
             method="post",
-            url=f"{API_BASE_URL_V3}/device/{device_id}/zone/{device_id}_{zone_id}",
+            url=f"{self._endpoints.api_v3}/device/{device_id}/zone/{device_id}_{zone_id}",
             data=data,
+            endpoint="zone",
+            device_id=device_id,
+            priority=RequestPriority.COMMAND,
         )
 
-    async def _request_with_refresh(
+    async def _request_with_refresh(  # noqa: PLR0913
         self,
         method: str,
         url: str,
         params: dict | None = None,
         data: dict | None = None,
+        decode: Callable[[Any], Any] | None = None,
+        *,
+        endpoint: str,
+        device_id: str | None = None,
+        priority: RequestPriority = RequestPriority.POLL,
     ) -> Any:
-        """Make a request, refreshing auth tokens on 401/403."""
-        refreshed = False
-        for _ in range(2):
+        """
+        Make a rate limited request, retrying once each after 401/403 and 429.
+
+        A 401/403 refreshes the auth tokens; a 429 pauses the account's
+        limiter for Retry-After and is not retried if that is too long.
+        """
+        await self._auth.async_ensure_token()
+        refreshed = throttled = False
+        for _ in range(3):
+            await self._limiter.async_acquire(priority)
+            # Counted per attempt so auth and rate-limit retries show up too
+            if device_id is not None:
+                self._metrics.increment(f"device_requests.{device_id}")
+            token = self._auth.access_token
             try:
                 return await self._api_wrapper(
-                    method=method, url=url, data=data, params=params
+                    method=method,
+                    url=url,
+                    data=data,
+                    params=params,
+                    decode=decode,
+                    endpoint=endpoint,
                 )
             except MoenApiAuthenticationError:
                 if not refreshed:
-                    await self._auth.async_refresh_token()
+                    self._metrics.increment("auth_retries")
+                    await self._auth.async_refresh_token(stale_token=token)
                     refreshed = True
                     continue
                 raise
+            except MoenApiRateLimitError as err:
+                # Cap the account-wide pause: a huge Retry-After fails this
+                # request below but must not hold back commands for an hour
+                self._limiter.pause(min(err.retry_after, API_RETRY_AFTER_MAX))
+                if throttled or err.retry_after > API_RETRY_AFTER_MAX:
+                    raise
+                self._metrics.increment("rate_limit_retries")
+                throttled = True
         return None  # unreachable, satisfies type checker
 
-    async def _api_wrapper(
+    async def _api_wrapper(  # noqa: PLR0913
         self,
         method: str,
         url: str,
         params: dict | None = None,
         data: dict | None = None,
+        decode: Callable[[Any], Any] | None = None,
+        *,
+        endpoint: str,
     ) -> Any:
         """Make a raw API request with current auth headers."""
-        headers = self._auth.get_auth_headers()
+        self._metrics.increment(f"requests.{endpoint}")
+        start = time.monotonic()
+        try:
+            return await self._api_request(method, url, params, data, decode, endpoint)
+        except Exception:
+            self._metrics.increment(f"errors.{endpoint}")
+            raise
+        finally:
+            self._metrics.observe(endpoint, time.monotonic() - start)
+
+    async def _api_request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+        decode: Callable[[Any], Any] | None,
+        endpoint: str,
+        *,
+        conditional: bool = True,
+    ) -> Any:
+        """Send the request and resolve its body against the cache."""
+        cache_key = self._cache.key(url, params) if method == "get" else None
+        headers, cached = self._request_headers(cache_key, conditional=conditional)
 
-        _LOGGER.debug("Making request to %s: params: %s \nbody: %s", url, params, data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s %s params=%s body_keys=%s",
+                method.upper(),
+                url,
+                params,
+                sorted(data) if data else None,
+            )
 
         try:
             async with async_timeout.timeout(10):
@@ -178,8 +338,28 @@ class MoenApiClient:
                     msg = "Invalid credentials"
                     raise MoenApiAuthenticationError(msg)
 
-                response.raise_for_status()
-                return await response.json()
+                if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    self._metrics.increment("rate_limited")
+                    retry_after = _retry_after(response.headers.get("Retry-After"))
+                    msg = f"Rate limited by {url}, retry after {retry_after:.0f} s"
+                    raise MoenApiRateLimitError(msg, retry_after)
+
+                if response.status == HTTPStatus.NOT_MODIFIED:
+                    if cached is not None:
+                        self._metrics.increment(f"not_modified.{endpoint}")
+                        self._record(method, url, params, response.status, b"")
+                        return cached.value
+                else:
+                    response.raise_for_status()
+                    body = await response.read()
+                    self._record(method, url, params, response.status, body)
+                    if not body.strip():
+                        return None
+                    if cache_key is None:
+                        return loads(body)
+                    return self._cache.resolve(
+                        cache_key, body, response.headers, decode
+                    )
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information from {url}: {exception}"
@@ -187,3 +367,39 @@ class MoenApiClient:
         except (aiohttp.ClientError, socket.gaierror) as exception:
             msg = f"Error fetching information from {url}: {exception}"
             raise MoenApiCommunicationError(msg) from exception
+        except ValueError as exception:
+            msg = f"Invalid JSON received from {url}: {exception}"
+            raise MoenApiCommunicationError(msg) from exception
+
+        # A 304 with no cached copy to serve is retried once unconditionally
+        if conditional:
+            _LOGGER.debug("304 from %s without a cached copy, fetching again", url)
+            return await self._api_request(
+                method, url, params, data, decode, endpoint, conditional=False
+            )
+        msg = f"Unexpected 304 from {url} for an unconditional request"
+        raise MoenApiCommunicationError(msg)
+
+    def _request_headers(
+        self, cache_key: CacheKey | None, *, conditional: bool
+    ) -> tuple[dict[str, str], CachedResponse | None]:
+        """Return auth headers plus cache validators, and the cached response."""
+        headers = self._auth.get_auth_headers()
+        if cache_key is None:
+            return headers, None
+        if not conditional:
+            headers["Cache-Control"] = "no-cache"
+            return headers, None
+        # GETs are revalidated against the cached copy so unchanged payloads
+        # skip the download (304) or at least the JSON decode (same digest).
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            headers.update(cached.validator_headers())
+        return headers, cached
+
+    def _record(
+        self, method: str, url: str, params: dict | None, status: int, body: bytes
+    ) -> None:
+        """Pass a response to the traffic recorder, if capturing."""
+        if self._recorder is not None:
+            self._recorder.record_rest(method, url, params, status, body)
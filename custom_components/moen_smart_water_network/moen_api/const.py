@@ -23,12 +23,29 @@ COGNITO_ENDPOINT = "cognito-identity.us-east-2.amazonaws.com"
 MQTT_REGION = "us-east-2"
 MQTT_ENDPOINT = "a1r2q5ic87novc-ats.iot.us-east-2.amazonaws.com"
 
+# Port of a plain local MQTT broker given without one
+MQTT_LOCAL_PORT = 1883
+
 # HTTP client
 USER_AGENT = "Moen/3 CFNetwork/1408.0.4 Darwin/22.5.0"
 
+# Client-side REST rate limit per account: a burst of requests, then a steady
+# rate (per second). A 429 pauses requests for its Retry-After (or the default)
+# and is retried once unless the server asks for more than the maximum.
+API_RATE_LIMIT = 2.0
+API_RATE_BURST = 10
+API_RETRY_AFTER_DEFAULT = 5.0
+API_RETRY_AFTER_MAX = 30.0
+
 # MQTT topic templates ({thing_name} = clientId, {duid} = device unique id)
 SHADOW_GET_TOPIC = "$aws/things/{thing_name}/shadow/get"
 SHADOW_GET_ACCEPTED_TOPIC = "$aws/things/{thing_name}/shadow/get/accepted"
 SHADOW_UPDATE_ACCEPTED_TOPIC = "$aws/things/{thing_name}/shadow/update/accepted"
 SHADOW_UPDATE_DOCUMENTS_TOPIC = "$aws/things/{thing_name}/shadow/update/documents"
 ASYNC_TOPIC = "/async/{duid}"
+
+# MQTT reconnect backoff (seconds) and how long to wait for the CRT to resume
+# an interrupted session before rebuilding the connection
+MQTT_RECONNECT_MIN_DELAY = 1.0
+MQTT_RECONNECT_MAX_DELAY = 300.0
+MQTT_RESUME_TIMEOUT = 60.0
@@ -0,0 +1,27 @@
+"""JSON decoding for Moen Smart Water Network payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Decode a JSON payload.
+
+    Raw bytes from aiohttp and awscrt are decoded directly, without first
+    being copied into a str. orjson is used when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -0,0 +1,84 @@
+"""Service endpoints used by the Moen API clients."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from .const import (
+    API_BASE_URL_V1,
+    API_BASE_URL_V3,
+    API_USER_URL,
+    COGNITO_ENDPOINT,
+    LAMBDA_INVOKE_URL,
+    MQTT_ENDPOINT,
+    MQTT_LOCAL_PORT,
+    MQTT_REGION,
+    OAUTH_URL,
+)
+
+
+def parse_broker(value: str) -> tuple[str, int]:
+    """Split "host[:port]" into host and port, raising ValueError if invalid."""
+    value = value.strip()
+    host, sep, port = value.rpartition(":")
+    if not sep or "]" in port:
+        # No port, or the colons belong to a bracketed IPv6 address
+        host, port = value, ""
+    host = host.removeprefix("[").removesuffix("]") or "localhost"
+    if not port:
+        return host, MQTT_LOCAL_PORT
+    if not port.isdigit() or not 0 < int(port) < 65536:  # noqa: PLR2004
+        msg = f"Invalid port in MQTT broker {value!r}; expected host[:port]"
+        raise ValueError(msg)
+    return host, int(port)
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoints:
+    """
+    Where the REST, OAuth and MQTT services live.
+
+    The defaults are Moen's production cloud. mqtt_port selects a plain TCP
+    broker at mqtt_endpoint (no TLS, no AWS signing), as used by the local
+    simulator.
+    """
+
+    api_v1: str = API_BASE_URL_V1
+    api_v3: str = API_BASE_URL_V3
+    user_url: str = API_USER_URL
+    lambda_invoke_url: str = LAMBDA_INVOKE_URL
+    oauth_url: str = OAUTH_URL
+    cognito_endpoint: str = COGNITO_ENDPOINT
+    mqtt_region: str = MQTT_REGION
+    mqtt_endpoint: str = MQTT_ENDPOINT
+    mqtt_port: int | None = None
+
+    @classmethod
+    def local(cls, base_url: str, mqtt_broker: str | None = None) -> Endpoints:
+        """
+        Return endpoints for a stand-in server laid out like Moen's cloud.
+
+        mqtt_broker is "host[:port]" of a plain MQTT broker (port 1883 by
+        default); without one the MQTT connection still goes to AWS IoT.
+        Raises ValueError for a malformed broker.
+        """
+        base_url = base_url.rstrip("/")
+        endpoints = cls(
+            api_v1=f"{base_url}/v1",
+            api_v3=f"{base_url}/v3",
+            user_url=f"{base_url}/prod/v1/users/me",
+            lambda_invoke_url=f"{base_url}/prod/v1/invoker",
+            oauth_url=f"{base_url}/prod/v1/oauth2/token",
+        )
+        if mqtt_broker:
+            host, port = parse_broker(mqtt_broker)
+            endpoints = replace(endpoints, mqtt_endpoint=host, mqtt_port=port)
+        return endpoints
+
+    @property
+    def local_mqtt(self) -> bool:
+        """Return True if MQTT goes to a plain local broker."""
+        return self.mqtt_port is not None
+
+
+DEFAULT_ENDPOINTS = Endpoints()
@@ -11,3 +11,12 @@ class MoenApiCommunicationError(MoenApiError):
 
 class MoenApiAuthenticationError(MoenApiError):
     """Exception to indicate an authentication error."""
+
+
+class MoenApiRateLimitError(MoenApiCommunicationError):
+    """Exception to indicate the API asked us to slow down (429)."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize with the number of seconds to wait before retrying."""
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,124 @@
+"""Client-side request rate limiting for the Moen REST API."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued requests are granted; lower goes first."""
+
+    COMMAND = 0
+    POLL = 1
+    BACKGROUND = 2
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request of an account.
+
+    Up to burst requests go out at once, after which tokens refill at rate
+    per second. Requests that find the bucket empty queue by priority, so a
+    user command overtakes a backlog of polls. A Retry-After answer pauses
+    the bucket for everyone.
+    """
+
+    def __init__(self, rate: float, burst: int, metrics: Metrics | None = None) -> None:
+        """Initialize a full bucket refilling at rate tokens per second."""
+        self._rate = rate
+        self._burst = burst
+        self._metrics = metrics
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._max_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    async def async_acquire(self, priority: RequestPriority) -> None:
+        """Wait until a request of the given priority may be sent."""
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and now >= self._paused_until and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._max_depth = max(self._max_depth, len(self._waiters))
+        name = priority.name.lower()
+        if self._metrics is not None:
+            self._metrics.increment(f"throttled.{name}")
+        self._async_release()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # Granted just before the cancellation; hand the token on
+                self._tokens += 1
+            future.cancel()
+            self._async_release()
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe(f"wait.{name}", time.monotonic() - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request back for seconds, e.g. after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket state for diagnostics."""
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "paused_for": round(max(0.0, self._paused_until - now), 3),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_depth,
+        }
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _async_release(self) -> None:
+        """Grant tokens to queued requests and schedule the next grant."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = time.monotonic()
+        self._refill(now)
+        waiters = self._waiters
+        while waiters and (waiters[0][2].done() or now >= self._paused_until):
+            if waiters[0][2].done():
+                # Cancelled while queued
+                heapq.heappop(waiters)
+                continue
+            if self._tokens < 1:
+                break
+            self._tokens -= 1
+            heapq.heappop(waiters)[2].set_result(None)
+        if not waiters:
+            return
+        delay = max(self._paused_until - now, (1 - self._tokens) / self._rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._async_release)
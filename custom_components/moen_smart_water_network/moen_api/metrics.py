@@ -0,0 +1,98 @@
+"""Performance counters for Moen Smart Water Network."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter
+from typing import Any
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Count, sum, max and fixed-bucket distribution of observed latencies."""
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # One extra bucket for observations above the last bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Add an observation."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean latency in seconds."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in milliseconds."""
+        bounds = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 3) if self.mean is not None else None,
+            "max_ms": round(self.max * 1000, 3),
+            "buckets": {
+                bound: count
+                for bound, count in zip(bounds, self.buckets, strict=True)
+                if count
+            },
+        }
+
+
+class Metrics:
+    """
+    Named counters and latency histograms.
+
+    Updates may come from the event loop or an AWS CRT thread, so they are
+    serialized with a lock; each is a handful of integer operations.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Add count to a counter."""
+        with self._lock:
+            self._counters[name] += count
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a latency observation."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def counter(self, name: str) -> int:
+        """Return the value of a counter."""
+        return self._counters[name]
+
+    def histogram(self, name: str) -> LatencyHistogram | None:
+        """Return a histogram, if anything was observed."""
+        return self._histograms.get(name)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every counter and histogram."""
+        with self._lock:
+            return {
+                "counters": dict(sorted(self._counters.items())),
+                "latency": {
+                    name: histogram.as_dict()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+            }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Literal, TypedDict
 
 # --- Device data ---
@@ -143,6 +144,19 @@ class AuthResponse(TypedDict):
     token: TokenData
 
 
+class StoredCredentials(TypedDict, total=False):
+    """Tokens and AWS credentials persisted between restarts."""
+
+    access_token: str
+    refresh_token: str
+    id_token: str | None
+    token_expiration: str | None
+    aws_access_key_id: str
+    aws_secret_access_key: str
+    aws_session_token: str | None
+    aws_expiration: str | None
+
+
 # --- Request types ---
 
 
@@ -306,11 +320,208 @@ class IrrigationRunMessage(TypedDict, total=False):
     body: IrrigationRunBody
 
 
+# --- Parsed models ---
+#
+# API payloads are decoded into these compact, immutable models so only the
+# fields the integration uses stay in memory. Equality compares every kept
+# field, which makes diffing consecutive payloads cheap.
+
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """An irrigation zone."""
+
+    id: str
+    client_id: str
+    name: str
+    enabled: bool = False
+    wired: bool | None = None
+    connected: bool = False
+    type: str | None = None
+    audit_status: str | None = None
+    fault: str | None = None
+
+    @classmethod
+    def from_api(cls, data: ZoneData) -> Zone:
+        """Decode a zone payload."""
+        return cls(
+            id=data.get("id", ""),
+            client_id=str(data.get("clientId", "")),
+            name=data.get("name", ""),
+            enabled=bool(data.get("enabled", False)),
+            wired=data.get("wired"),
+            connected=bool(data.get("connected", False)),
+            type=data.get("type"),
+            audit_status=data.get("auditStatus"),
+            fault=data.get("fault"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the zone in API form."""
+        return {
+            "id": self.id,
+            "clientId": self.client_id,
+            "name": self.name,
+            "enabled": self.enabled,
+            "wired": self.wired,
+            "connected": self.connected,
+            "type": self.type,
+            "auditStatus": self.audit_status,
+            "fault": self.fault,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Device:
+    """A Moen irrigation controller."""
+
+    duid: str
+    client_id: str
+    nickname: str | None = None
+    type: str | None = None
+    connected: bool = False
+    last_connect: str | None = None
+    firmware_version: str | None = None
+    rssi: float | None = None
+    watering_mode: str | None = None
+    is_watering: bool = False
+    master_valve_connected: bool = False
+    rain_sensor_connected: bool = False
+    flow_sensor_connected: bool = False
+    zones: tuple[Zone, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: DeviceData) -> Device:
+        """Decode a device payload."""
+        irrigation = data.get("irrigation", {})
+        return cls(
+            duid=data.get("duid", ""),
+            client_id=data.get("clientId", ""),
+            nickname=data.get("nickname"),
+            type=data.get("type"),
+            connected=bool(data.get("connected", False)),
+            last_connect=data.get("lastConnect"),
+            firmware_version=data.get("firmware", {}).get("version"),
+            rssi=data.get("connectivity", {}).get("rssi"),
+            watering_mode=irrigation.get("wateringMode"),
+            is_watering=bool(irrigation.get("wateringState", {}).get("running")),
+            master_valve_connected=bool(irrigation.get("masterValveConnected")),
+            rain_sensor_connected=bool(
+                irrigation.get("rainSensor", {}).get("connected")
+            ),
+            flow_sensor_connected=bool(
+                irrigation.get("flowSensor", {}).get("connected")
+            ),
+            zones=tuple(Zone.from_api(zone) for zone in irrigation.get("zones", [])),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the device in API form, limited to the decoded fields."""
+        return {
+            "duid": self.duid,
+            "clientId": self.client_id,
+            "nickname": self.nickname,
+            "type": self.type,
+            "connected": self.connected,
+            "lastConnect": self.last_connect,
+            "firmware": {"version": self.firmware_version},
+            "connectivity": {"rssi": self.rssi},
+            "irrigation": {
+                "wateringMode": self.watering_mode,
+                "wateringState": {"running": self.is_watering},
+                "masterValveConnected": self.master_valve_connected,
+                "rainSensor": {"connected": self.rain_sensor_connected},
+                "flowSensor": {"connected": self.flow_sensor_connected},
+                "zones": [zone.to_dict() for zone in self.zones],
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleZone:
+    """A zone and its run time within a schedule."""
+
+    id: str
+    client_id: str
+    duration: int = 0
+
+    @classmethod
+    def from_api(cls, data: ScheduleZoneData) -> ScheduleZone:
+        """Decode a schedule zone payload."""
+        return cls(
+            id=data.get("id", ""),
+            client_id=str(data.get("clientId", "")),
+            duration=data.get("duration", 0),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the schedule zone in API form."""
+        return {"id": self.id, "clientId": self.client_id, "duration": self.duration}
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    """An irrigation schedule."""
+
+    id: str
+    name: str = "Irrigation"
+    status: str | None = None
+    frequency: str | None = None
+    days_of_week: tuple[str, ...] = ()
+    start_at: str | None = None
+    zones: tuple[ScheduleZone, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: ScheduleData) -> Schedule:
+        """Decode a schedule payload."""
+        return cls(
+            id=data.get("id", ""),
+            name=data.get("name", "Irrigation"),
+            status=data.get("status"),
+            frequency=data.get("frequency"),
+            days_of_week=tuple(data.get("daysOfWeek") or ()),
+            start_at=data.get("preferredTime", {}).get("startAt"),
+            zones=tuple(ScheduleZone.from_api(zone) for zone in data.get("zones", [])),
+        )
+
+    @staticmethod
+    def from_response(response: SchedulesResponse) -> tuple[Schedule, ...]:
+        """Decode every schedule in a schedules response."""
+        return tuple(Schedule.from_api(item) for item in response.get("items", []))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the schedule in API form, limited to the decoded fields."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "frequency": self.frequency,
+            "daysOfWeek": list(self.days_of_week),
+            "preferredTime": {"startAt": self.start_at},
+            "zones": [zone.to_dict() for zone in self.zones],
+        }
+
+
 # --- Coordinator data ---
 
 
 class CoordinatorData(TypedDict):
     """Data structure returned by MoenDataUpdateCoordinator."""
 
+    device: Device
+    schedules: dict[str, Schedule]
+
+
+class DeviceSnapshot(TypedDict):
+    """Last-known state of a device persisted for warm starts."""
+
     device: DeviceData
     schedules: dict[str, ScheduleData]
+    shadow: dict[str, Any]
+
+
+class EntrySnapshot(TypedDict):
+    """Last-known state of a config entry persisted for warm starts."""
+
+    legacy_id: str
+    devices: list[DeviceSnapshot]
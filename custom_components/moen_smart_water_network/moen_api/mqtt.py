@@ -3,153 +3,579 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import logging
+import random
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from awscrt import io, mqtt
-from awsiot import iotshadow, mqtt_connection_builder
-
-from .const import ASYNC_TOPIC, MQTT_ENDPOINT, MQTT_REGION
+from awscrt.exceptions import AwsCrtError
+from awsiot import mqtt_connection_builder
+
+from .const import (
+    ASYNC_TOPIC,
+    MQTT_RECONNECT_MAX_DELAY,
+    MQTT_RECONNECT_MIN_DELAY,
+    MQTT_RESUME_TIMEOUT,
+    SHADOW_GET_ACCEPTED_TOPIC,
+    SHADOW_GET_TOPIC,
+    SHADOW_UPDATE_ACCEPTED_TOPIC,
+    SHADOW_UPDATE_DOCUMENTS_TOPIC,
+)
+from .decoder import loads
+from .endpoints import DEFAULT_ENDPOINTS
 from .exceptions import MoenApiError
+from .metrics import Metrics
+from .shadow import ShadowUpdate
+from .trace import MessageTrace
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from awscrt.auth import AwsCredentialsProvider
+
     from .auth import MoenAuth
+    from .capture import TrafficRecorder
+    from .endpoints import Endpoints
 
 _LOGGER = logging.getLogger(__name__)
 
 io.init_logging(io.LogLevel.Warn, "stderr")
 
 
+class MqttState(StrEnum):
+    """State of the shared MQTT connection."""
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+
+
+@dataclass(slots=True)
+class _DeviceSubscription:
+    """Topics and callbacks registered for one device."""
+
+    client_id: str
+    duid: str
+    shadow_callback: Callable[[ShadowUpdate], None]
+    async_callback: Callable[[dict[str, Any]], None] | None
+
+
+# Connect failures that can mean the signing credentials were rejected. A
+# rejected websocket upgrade does not say why, so it counts as one.
+AUTH_FAILURE_ERRORS = frozenset(
+    {"AWS_ERROR_HTTP_WEBSOCKET_UPGRADE_FAILURE", "AWS_ERROR_MQTT_INVALID_CREDENTIALS"}
+)
+AUTH_FAILURE_RETURN_CODES = frozenset(
+    {
+        mqtt.ConnectReturnCode.BAD_USERNAME_OR_PASSWORD,
+        mqtt.ConnectReturnCode.NOT_AUTHORIZED,
+    }
+)
+
+
+def _is_auth_failure(err: Exception) -> bool:
+    """Return True if a connect failure may be due to the credentials."""
+    if isinstance(err, AwsCrtError):
+        return err.name in AUTH_FAILURE_ERRORS
+    # The CRT raises Exception(return_code) when the broker refuses a connect
+    return any(
+        isinstance(arg, mqtt.ConnectReturnCode) and arg in AUTH_FAILURE_RETURN_CODES
+        for arg in err.args
+    )
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Return the exponential backoff delay, with jitter, for an attempt."""
+    delay = min(MQTT_RECONNECT_MAX_DELAY, MQTT_RECONNECT_MIN_DELAY * 2**attempt)
+    # Keep at least half the delay so clients never retry in lockstep at ~0s
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+
 class MoenMqttClient:
-    """MQTT client for shadow and async irrigation topic subscriptions."""
+    """
+    Shared MQTT connection for every device on a Moen account.
 
-    def __init__(self, auth: MoenAuth) -> None:
-        """Initialize with auth manager."""
-        self._auth = auth
-        self._mqtt_connection: mqtt.Connection | None = None
-        self._shadow_client: iotshadow.IotShadowClient | None = None
+    One signed websocket is opened per account and each device's shadow and
+    /async/{duid} topics are subscribed on it. Messages are routed to the
+    subscriber that registered the topic.
+
+    A supervisor task owns the connection. Short interruptions are left to
+    the CRT's own session resume; when the session was not kept every device
+    is resubscribed, and the shadows are requested again either way. If the
+    connection fails or does not resume in time it is rebuilt with fresh AWS
+    credentials after an exponential backoff with jitter.
+    """
 
-    async def async_connect(
+    def __init__(
         self,
-        client_id: str,
-        duid: str,
+        auth: MoenAuth,
         legacy_id: str,
-        shadow_callback: Callable,
-        async_callback: Callable[[dict[str, Any]], None] | None = None,
+        endpoints: Endpoints = DEFAULT_ENDPOINTS,
     ) -> None:
-        """Connect to MQTT and subscribe to shadow + async topics."""
-        credentials_provider = self._auth.create_cognito_credentials_provider(legacy_id)
+        """Initialize with auth manager, the account's legacy id and endpoints."""
+        self._auth = auth
+        self._legacy_id = legacy_id
+        self._endpoints = endpoints
+        self._mqtt_connection: mqtt.Connection | None = None
+        self._shadow_routes: dict[str, tuple[Callable[[ShadowUpdate], None], bool]] = {}
+        self._async_callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
+        self._devices: dict[str, _DeviceSubscription] = {}
+        self._subscribed: set[str] = set()
+        self._state = MqttState.DISCONNECTED
+        self._state_listeners: list[Callable[[MqttState], None]] = []
+        self._connected = asyncio.Event()
+        self._lost = asyncio.Event()
+        self._supervisor: asyncio.Task[None] | None = None
+        self._resume_timer: asyncio.TimerHandle | None = None
+        self._resubscribe_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._trace = MessageTrace(_LOGGER)
+        self._recorder: TrafficRecorder | None = None
+        self._metrics = Metrics()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the shared connection is established."""
+        return self._state is MqttState.CONNECTED
+
+    @property
+    def state(self) -> MqttState:
+        """Return the connection state."""
+        return self._state
+
+    @property
+    def trace(self) -> MessageTrace:
+        """Return the trace of recently received messages."""
+        return self._trace
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Return connection metrics.
+
+        Counters are messages.<topic>, dropped_messages, parse_errors,
+        connect_attempts, connect_failures, connections_lost, interruptions
+        and resumes; latency is observed for connect.
+        """
+        return self._metrics
+
+    def set_recorder(self, recorder: TrafficRecorder | None) -> None:
+        """Capture received messages to recorder, or stop capturing."""
+        self._recorder = recorder
+
+    def async_add_state_listener(
+        self, listener: Callable[[MqttState], None]
+    ) -> Callable[[], None]:
+        """Call listener on the event loop whenever the state changes."""
+        self._state_listeners.append(listener)
+
+        def _remove() -> None:
+            with contextlib.suppress(ValueError):
+                self._state_listeners.remove(listener)
+
+        return _remove
+
+    def _set_state(self, state: MqttState) -> None:
+        """Record a state change and notify listeners (event loop)."""
+        if state is self._state:
+            return
+        _LOGGER.debug("MQTT connection %s", state)
+        self._state = state
+        if state is MqttState.CONNECTED:
+            self._connected.set()
+        else:
+            self._connected.clear()
+        for listener in list(self._state_listeners):
+            listener(state)
+
+    async def async_connect(self) -> None:
+        """Start the connection supervisor and wait until connected."""
+        if self._supervisor is None:
+            self._loop = asyncio.get_running_loop()
+            self._supervisor = self._loop.create_task(
+                self._async_supervise(), name="moen_mqtt_supervisor"
+            )
+        await self._connected.wait()
+
+    async def _async_supervise(self) -> None:
+        """Keep the shared connection up, rebuilding it with backoff."""
+        attempt = 0
+        while True:
+            self._set_state(
+                MqttState.CONNECTING if attempt == 0 else MqttState.RECONNECTING
+            )
+            self._lost.clear()
+            self._metrics.increment("connect_attempts")
+            start = time.monotonic()
+            token = self._auth.access_token
+            try:
+                await self._async_open_connection()
+                await self._async_resubscribe()
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # noqa: BLE001
+                self._metrics.increment("connect_failures")
+                self._drop_connection()
+                # Cached credentials are reused across reconnects (and renewed
+                # by the provider near expiry); only drop them when they may
+                # have been rejected.
+                if _is_auth_failure(err):
+                    await self._async_renew_credentials(token)
+                delay = _reconnect_delay(attempt)
+                attempt += 1
+                _LOGGER.warning(
+                    "MQTT connection failed (%s), retrying in %.0f s", err, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            attempt = 0
+            self._metrics.observe("connect", time.monotonic() - start)
+            self._set_state(MqttState.CONNECTED)
+            await self._lost.wait()
+            _LOGGER.debug("MQTT connection lost, rebuilding")
+            self._metrics.increment("connections_lost")
+            # Report the outage now so coordinators poll and new subscribers
+            # wait for the rebuilt connection during the backoff below
+            self._set_state(MqttState.RECONNECTING)
+            self._drop_connection()
+            await asyncio.sleep(_reconnect_delay(attempt))
+            attempt += 1
+
+    async def _async_renew_credentials(self, token: str | None) -> None:
+        """Drop cached AWS credentials and the tokens they were issued for."""
+        self._auth.invalidate_aws_credentials()
+        if self._endpoints.local_mqtt:
+            return
+        # Cognito exchanges the id_token as-is, so a rejected, expired or
+        # restored one has to be replaced before the next attempt
+        try:
+            await self._auth.async_refresh_token(stale_token=token)
+        except MoenApiError as err:
+            _LOGGER.debug("Token refresh after MQTT auth failure failed: %s", err)
 
+    async def _async_open_connection(self) -> None:
+        """Build and connect the MQTT connection for the configured endpoints."""
         mqtt_client_id = str(uuid4())
         _LOGGER.debug("MQTT client id: %s", mqtt_client_id)
 
         loop = asyncio.get_running_loop()
-
-        def _create_mqtt_connection() -> mqtt.Connection:
-            return mqtt_connection_builder.websockets_with_default_aws_signing(
-                region=MQTT_REGION,
-                endpoint=MQTT_ENDPOINT,
-                credentials_provider=credentials_provider,
-                client_id=mqtt_client_id,
-                clean_session=False,
-                keep_alive_secs=30,
-                on_connection_interrupted=lambda connection, error, **kwargs: (
-                    _LOGGER.debug("MQTT connection interrupted: %s", error)
-                ),
-                on_connection_failure=lambda connection, callback_data, **kwargs: (
-                    _LOGGER.error("MQTT connection failure: %s", callback_data)
-                ),
-                on_connection_resumed=(
-                    lambda connection, return_code, session_present, **kwargs: (
-                        _LOGGER.debug("MQTT connection resumed: %s", return_code)
-                    )
-                ),
-                on_connection_success=lambda callback_data, **kwargs: _LOGGER.debug(
-                    "MQTT connection success: %s", callback_data
-                ),
-                on_connection_closed=lambda connection, callback_data, **kwargs: (
-                    _LOGGER.debug("MQTT connection closed: %s", callback_data)
-                ),
+        if self._endpoints.local_mqtt:
+            create = partial(self._create_local_connection, mqtt_client_id)
+        else:
+            await self._auth.async_ensure_id_token()
+            create = partial(
+                self._create_aws_connection,
+                mqtt_client_id,
+                self._auth.create_cognito_credentials_provider(self._legacy_id),
             )
 
-        self._mqtt_connection = await loop.run_in_executor(
-            None, _create_mqtt_connection
+        # Building the connection sets up TLS and the event loop group, which
+        # blocks; the CRT futures after that are awaited without a thread.
+        connection = await loop.run_in_executor(None, create)
+        self._mqtt_connection = connection
+        await asyncio.wrap_future(connection.connect())
+        _LOGGER.debug("Connected to MQTT")
+
+    def _create_aws_connection(
+        self,
+        mqtt_client_id: str,
+        credentials_provider: AwsCredentialsProvider,
+    ) -> mqtt.Connection:
+        """Build the SigV4-signed websocket connection to AWS IoT (blocking)."""
+        return mqtt_connection_builder.websockets_with_default_aws_signing(
+            region=self._endpoints.mqtt_region,
+            endpoint=self._endpoints.mqtt_endpoint,
+            credentials_provider=credentials_provider,
+            client_id=mqtt_client_id,
+            clean_session=False,
+            keep_alive_secs=30,
+            on_connection_interrupted=self._on_connection_interrupted,
+            on_connection_failure=lambda connection, callback_data, **kwargs: (
+                _LOGGER.debug("MQTT connection failure: %s", callback_data)
+            ),
+            on_connection_resumed=self._on_connection_resumed,
+            on_connection_success=lambda callback_data, **kwargs: _LOGGER.debug(
+                "MQTT connection success: %s", callback_data
+            ),
+            on_connection_closed=self._on_connection_closed,
         )
 
-        connected_future = self._mqtt_connection.connect()
-        self._shadow_client = iotshadow.IotShadowClient(self._mqtt_connection)
-        await loop.run_in_executor(None, connected_future.result)
-        _LOGGER.debug("Connected to MQTT")
+    def _create_local_connection(self, mqtt_client_id: str) -> mqtt.Connection:
+        """Build a plain TCP connection to a local broker (blocking)."""
+        return mqtt.Connection(
+            client=mqtt.Client(io.ClientBootstrap.get_or_create_static_default()),
+            host_name=self._endpoints.mqtt_endpoint,
+            port=self._endpoints.mqtt_port,
+            client_id=mqtt_client_id,
+            clean_session=False,
+            keep_alive_secs=30,
+            on_connection_interrupted=self._on_connection_interrupted,
+            on_connection_resumed=self._on_connection_resumed,
+            on_connection_closed=self._on_connection_closed,
+        )
+
+    def _drop_connection(self) -> None:
+        """Forget the current connection and its subscriptions (event loop)."""
+        self._cancel_resume_timer()
+        self._subscribed.clear()
+        connection, self._mqtt_connection = self._mqtt_connection, None
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                connection.disconnect()
+
+    def _on_connection_interrupted(
+        self, connection: mqtt.Connection, error: Exception, **_: Any
+    ) -> None:
+        """Note an interruption; the CRT tries to resume (AWS CRT thread)."""
+        _LOGGER.debug("MQTT connection interrupted: %s", error)
+        self._call_soon(self._async_interrupted, connection)
+
+    def _on_connection_resumed(
+        self,
+        connection: mqtt.Connection,
+        return_code: mqtt.ConnectReturnCode,
+        session_present: bool,  # noqa: FBT001
+        **_: Any,
+    ) -> None:
+        """Resubscribe and re-get state after a resume (AWS CRT thread)."""
+        _LOGGER.debug(
+            "MQTT connection resumed: %s (session present: %s)",
+            return_code,
+            session_present,
+        )
+        self._call_soon(self._async_resumed, connection, session_present)
 
-        # Subscribe to shadow topics
-        await self._subscribe_shadow_topics(client_id, shadow_callback, loop)
+    def _on_connection_closed(
+        self, connection: mqtt.Connection, callback_data: Any, **_: Any
+    ) -> None:
+        """Rebuild the connection if it closed unexpectedly (AWS CRT thread)."""
+        _LOGGER.debug("MQTT connection closed: %s", callback_data)
+        self._call_soon(self._async_connection_lost, connection)
+
+    def _call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run callback on the event loop from a CRT thread."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _async_interrupted(self, connection: mqtt.Connection) -> None:
+        """Wait for the CRT to resume, rebuilding if it takes too long."""
+        if connection is not self._mqtt_connection or self._loop is None:
+            return
+        self._metrics.increment("interruptions")
+        self._set_state(MqttState.RECONNECTING)
+        self._cancel_resume_timer()
+        self._resume_timer = self._loop.call_later(
+            MQTT_RESUME_TIMEOUT, self._async_connection_lost, connection
+        )
 
-        # Subscribe to /async/{duid} topic for irrigation run updates
-        if async_callback is not None:
-            await self._subscribe_async_topic(duid, async_callback, loop)
+    def _async_resumed(
+        self,
+        connection: mqtt.Connection,
+        session_present: bool,  # noqa: FBT001
+    ) -> None:
+        """Restore subscriptions and request fresh shadows after a resume."""
+        if connection is not self._mqtt_connection or self._loop is None:
+            return
+        self._metrics.increment("resumes")
+        self._cancel_resume_timer()
+        if not session_present:
+            # A new session has no subscriptions
+            self._subscribed.clear()
+        self._resubscribe_task = self._loop.create_task(
+            self._async_restore_after_resume(), name="moen_mqtt_resubscribe"
+        )
 
-        # Request current shadow state
-        await self._publish_get_shadow(client_id, loop)
+    async def _async_restore_after_resume(self) -> None:
+        """Resubscribe, re-get every shadow and mark the connection up."""
+        try:
+            await self._async_resubscribe()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("MQTT resubscribe after resume failed: %s", err)
+            self._lost.set()
+            return
+        self._set_state(MqttState.CONNECTED)
+
+    def _async_connection_lost(self, connection: mqtt.Connection) -> None:
+        """Hand a dead connection back to the supervisor."""
+        if connection is self._mqtt_connection:
+            self._lost.set()
+
+    def _cancel_resume_timer(self) -> None:
+        """Cancel a pending resume deadline."""
+        if self._resume_timer is not None:
+            self._resume_timer.cancel()
+            self._resume_timer = None
+
+    async def _async_resubscribe(self) -> None:
+        """Subscribe devices missing from the session and re-get every shadow."""
+        await asyncio.gather(
+            *(
+                self._async_subscribe(subscription, get_shadow=False)
+                for subscription in list(self._devices.values())
+                if subscription.client_id not in self._subscribed
+            )
+        )
+        await asyncio.gather(
+            *(self._publish_get_shadow(client_id) for client_id in self._devices)
+        )
 
-        # Keep connection alive until cancelled
-        disconnect_event = asyncio.Event()
+    async def async_subscribe_device(
+        self,
+        client_id: str,
+        duid: str,
+        shadow_callback: Callable[[ShadowUpdate], None],
+        async_callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Subscribe a device's shadow and async topics on the shared connection."""
+        subscription = _DeviceSubscription(
+            client_id, duid, shadow_callback, async_callback
+        )
+        self._devices[client_id] = subscription
+        await self.async_connect()
+        # The supervisor may already have subscribed it while connecting
+        if client_id not in self._subscribed:
+            await self._async_subscribe(subscription, get_shadow=True)
+
+    async def _async_subscribe(
+        self, subscription: _DeviceSubscription, *, get_shadow: bool
+    ) -> None:
+        """Subscribe one device's topics, optionally requesting its shadow."""
+        self._subscribed.add(subscription.client_id)
         try:
-            await disconnect_event.wait()
-        except asyncio.CancelledError:
-            _LOGGER.debug("MQTT subscription cancelled, disconnecting...")
-            self._mqtt_connection.disconnect()
+            # Subscribe to the shadow topics and the /async/{duid} topic for
+            # irrigation run updates in one round trip
+            subscriptions = [
+                self._subscribe_shadow_topics(
+                    subscription.client_id, subscription.shadow_callback
+                )
+            ]
+            if subscription.async_callback is not None:
+                subscriptions.append(
+                    self._subscribe_async_topic(
+                        subscription.duid, subscription.async_callback
+                    )
+                )
+            await asyncio.gather(*subscriptions)
+        except BaseException:
+            self._subscribed.discard(subscription.client_id)
             raise
 
+        # Request current shadow state once get/accepted is subscribed
+        if get_shadow:
+            await self._publish_get_shadow(subscription.client_id)
+
+    def is_subscribed(self, client_id: str) -> bool:
+        """Return True if a device's topics are subscribed on the connection."""
+        return client_id in self._subscribed
+
+    async def async_request_shadow(self, client_id: str) -> None:
+        """Ask for a device's full shadow; it arrives on get/accepted."""
+        await self._publish_get_shadow(client_id)
+
+    async def async_unsubscribe_device(self, client_id: str, duid: str) -> None:
+        """Stop routing messages for a device and drop its subscriptions."""
+        self._devices.pop(client_id, None)
+        self._subscribed.discard(client_id)
+        async_topic = ASYNC_TOPIC.format(duid=duid)
+        shadow_topics = [
+            template.format(thing_name=client_id)
+            for template in (
+                SHADOW_UPDATE_ACCEPTED_TOPIC,
+                SHADOW_GET_ACCEPTED_TOPIC,
+                SHADOW_UPDATE_DOCUMENTS_TOPIC,
+            )
+        ]
+        self._async_callbacks.pop(async_topic, None)
+        for topic in shadow_topics:
+            self._shadow_routes.pop(topic, None)
+
+        if self._mqtt_connection is None or not self.connected:
+            return
+
+        connection = self._mqtt_connection
+        await asyncio.gather(
+            *(
+                asyncio.wrap_future(connection.unsubscribe(topic)[0])
+                for topic in (*shadow_topics, async_topic)
+            )
+        )
+
     async def async_disconnect(self) -> None:
-        """Disconnect from MQTT."""
-        if self._mqtt_connection is not None:
-            self._mqtt_connection.disconnect()
-            self._mqtt_connection = None
-            self._shadow_client = None
+        """Stop the supervisor and disconnect the shared connection."""
+        for task in (self._supervisor, self._resubscribe_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._supervisor = None
+        self._resubscribe_task = None
+        self._devices.clear()
+        self._async_callbacks.clear()
+        self._shadow_routes.clear()
+        self._drop_connection()
+        self._set_state(MqttState.DISCONNECTED)
 
     async def _subscribe_shadow_topics(
         self,
         client_id: str,
-        callback: Callable,
-        loop: asyncio.AbstractEventLoop,
+        callback: Callable[[ShadowUpdate], None],
     ) -> None:
         """Subscribe to all shadow topics for a device."""
-        if self._shadow_client is None:
-            raise MoenApiError("Shadow client not initialized")
-
-        _LOGGER.debug("Subscribing to shadow update accepted...")
-        update_future, _ = self._shadow_client.subscribe_to_update_shadow_accepted(
-            request=iotshadow.UpdateShadowSubscriptionRequest(thing_name=client_id),
-            qos=mqtt.QoS.AT_LEAST_ONCE,
-            callback=callback,
-        )
-        await loop.run_in_executor(None, update_future.result)
-
-        _LOGGER.debug("Subscribing to shadow get accepted...")
-        get_future, _ = self._shadow_client.subscribe_to_get_shadow_accepted(
-            request=iotshadow.GetShadowSubscriptionRequest(thing_name=client_id),
-            qos=mqtt.QoS.AT_LEAST_ONCE,
-            callback=callback,
-        )
-        await loop.run_in_executor(None, get_future.result)
+        if self._mqtt_connection is None:
+            raise MoenApiError("MQTT connection not established")
 
-        _LOGGER.debug("Subscribing to shadow updated events...")
-        events_future, _ = self._shadow_client.subscribe_to_shadow_updated_events(
-            request=iotshadow.ShadowUpdatedSubscriptionRequest(thing_name=client_id),
-            qos=mqtt.QoS.AT_LEAST_ONCE,
-            callback=callback,
-        )
-        await loop.run_in_executor(None, events_future.result)
+        # Payloads are taken raw and decoded once in _on_shadow_message; only
+        # delta updates (update/accepted) are merged rather than replacing.
+        subscribe_futures = []
+        for template, full in (
+            (SHADOW_UPDATE_ACCEPTED_TOPIC, False),
+            (SHADOW_GET_ACCEPTED_TOPIC, True),
+            (SHADOW_UPDATE_DOCUMENTS_TOPIC, True),
+        ):
+            topic = template.format(thing_name=client_id)
+            _LOGGER.debug("Subscribing to shadow topic: %s", topic)
+            self._shadow_routes[topic] = (callback, full)
+            subscribe_future, _ = self._mqtt_connection.subscribe(
+                topic=topic,
+                qos=mqtt.QoS.AT_LEAST_ONCE,
+                callback=self._on_shadow_message,
+            )
+            subscribe_futures.append(asyncio.wrap_future(subscribe_future))
+        await asyncio.gather(*subscribe_futures)
+
+    def _on_shadow_message(self, topic: str, payload: bytes, **_: Any) -> None:
+        """Route a shadow message to its device (AWS CRT thread)."""
+        self._trace.record("shadow", topic, payload)
+        self._metrics.increment(f"messages.{topic}")
+        if (recorder := self._recorder) is not None:
+            recorder.record_mqtt(topic, payload)
+        route = self._shadow_routes.get(topic)
+        if route is None:
+            _LOGGER.debug("Dropping shadow message for unrouted topic %s", topic)
+            self._metrics.increment("dropped_messages")
+            return
+        callback, full = route
+        try:
+            document = loads(payload)
+            update = ShadowUpdate.from_document(document, full=full)
+            if update is not None:
+                callback(update)
+        except Exception:
+            self._metrics.increment("parse_errors")
+            _LOGGER.exception("Failed to parse shadow MQTT message")
 
     async def _subscribe_async_topic(
         self,
         duid: str,
         callback: Callable[[dict[str, Any]], None],
-        loop: asyncio.AbstractEventLoop,
     ) -> None:
         """Subscribe to the /async/{duid} topic for real-time irrigation updates."""
         if self._mqtt_connection is None:
@@ -158,33 +584,43 @@ class MoenMqttClient:
         topic = ASYNC_TOPIC.format(duid=duid)
         _LOGGER.debug("Subscribing to async topic: %s", topic)
 
-        def _on_message(topic: str, payload: bytes, **_: Any) -> None:
-            try:
-                message = json.loads(payload)
-                _LOGGER.debug("Received async message on %s: %s", topic, message)
-                callback(message)
-            except Exception:
-                _LOGGER.exception("Failed to parse async MQTT message")
-
+        self._async_callbacks[topic] = callback
         subscribe_future, _ = self._mqtt_connection.subscribe(
             topic=topic,
             qos=mqtt.QoS.AT_LEAST_ONCE,
-            callback=_on_message,
+            callback=self._on_async_message,
         )
-        await loop.run_in_executor(None, subscribe_future.result)
+        await asyncio.wrap_future(subscribe_future)
         _LOGGER.debug("Subscribed to async topic: %s", topic)
 
+    def _on_async_message(self, topic: str, payload: bytes, **_: Any) -> None:
+        """Route an /async/{duid} message to its device (AWS CRT thread)."""
+        self._trace.record("async", topic, payload)
+        self._metrics.increment(f"messages.{topic}")
+        if (recorder := self._recorder) is not None:
+            recorder.record_mqtt(topic, payload)
+        callback = self._async_callbacks.get(topic)
+        if callback is None:
+            _LOGGER.debug("Dropping async message for unrouted topic %s", topic)
+            self._metrics.increment("dropped_messages")
+            return
+        try:
+            callback(loads(payload))
+        except Exception:
+            self._metrics.increment("parse_errors")
+            _LOGGER.exception("Failed to parse async MQTT message")
+
     async def _publish_get_shadow(
         self,
         client_id: str,
-        loop: asyncio.AbstractEventLoop,
     ) -> None:
         """Publish a get shadow request to receive current state."""
-        if self._shadow_client is None:
-            raise MoenApiError("Shadow client not initialized")
+        if self._mqtt_connection is None:
+            raise MoenApiError("MQTT connection not established")
 
-        publish_future = self._shadow_client.publish_get_shadow(
-            request=iotshadow.GetShadowRequest(thing_name=client_id),
+        publish_future, _ = self._mqtt_connection.publish(
+            topic=SHADOW_GET_TOPIC.format(thing_name=client_id),
+            payload=b"{}",
             qos=mqtt.QoS.AT_LEAST_ONCE,
         )
-        await loop.run_in_executor(None, publish_future.result)
+        await asyncio.wrap_future(publish_future)
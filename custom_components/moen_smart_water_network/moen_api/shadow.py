@@ -0,0 +1,139 @@
+"""AWS IoT device shadow state for Moen Smart Water Network."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+KeyPath = tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ShadowUpdate:
+    """Reported state carried by a shadow topic message."""
+
+    reported: dict[str, Any]
+    version: int | None = None
+    full: bool = False
+
+    @classmethod
+    def from_document(
+        cls, document: Mapping[str, Any], *, full: bool
+    ) -> ShadowUpdate | None:
+        """
+        Extract reported state from a decoded shadow message.
+
+        update/documents nests the new document under "current"; get/accepted
+        and update/accepted carry state and version at the top level. Returns
+        None when the message has no reported section.
+        """
+        current = document.get("current", document)
+        reported = (current.get("state") or {}).get("reported")
+        if reported is None:
+            return None
+        return cls(reported, current.get("version"), full=full)
+
+
+class ShadowDocument:
+    """
+    Reported shadow state maintained with AWS IoT shadow semantics.
+
+    Deltas are merged key by key and a null value deletes its key. Documents
+    carry a version; anything not newer than the last applied version is a
+    duplicate or arrived out of order and is dropped. Every apply returns the
+    leaf key paths whose value was added, changed or removed.
+    """
+
+    __slots__ = ("_state", "_version")
+
+    def __init__(
+        self, state: dict[str, Any] | None = None, version: int | None = None
+    ) -> None:
+        """Initialize with an optional known state and version."""
+        self._state: dict[str, Any] = state if state is not None else {}
+        self._version = version
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return the reported state."""
+        return self._state
+
+    @property
+    def version(self) -> int | None:
+        """Return the version of the last applied document."""
+        return self._version
+
+    def apply(
+        self,
+        reported: Mapping[str, Any],
+        version: int | None = None,
+        *,
+        full: bool = False,
+    ) -> set[KeyPath]:
+        """
+        Apply reported state and return the changed key paths.
+
+        A full document (get/accepted, update/documents) replaces the state
+        and removes keys it does not contain; otherwise reported is a delta.
+        """
+        if version is not None:
+            if self._version is not None and version <= self._version:
+                return set()
+            self._version = version
+
+        changed: set[KeyPath] = set()
+        stack: list[tuple[dict[str, Any], Mapping[str, Any], KeyPath]] = [
+            (self._state, reported, ())
+        ]
+        while stack:
+            target, source, path = stack.pop()
+            for key, value in source.items():
+                current = target.get(key, _MISSING)
+                if value is None:
+                    if current is not _MISSING:
+                        del target[key]
+                        _collect_leaves(current, (*path, key), changed)
+                elif type(value) is dict and type(current) is dict:
+                    stack.append((current, value, (*path, key)))
+                elif current != value:
+                    target[key] = _without_nulls(value)
+                    key_path = (*path, key)
+                    if current is not _MISSING:
+                        _collect_leaves(current, key_path, changed)
+                    _collect_leaves(target[key], key_path, changed)
+            if full and len(target) > len(source) - _count_nulls(source):
+                for key in [key for key in target if key not in source]:
+                    _collect_leaves(target.pop(key), (*path, key), changed)
+        return changed
+
+
+_MISSING = object()
+
+
+def _count_nulls(source: Mapping[str, Any]) -> int:
+    """Return how many entries of source are null deletions."""
+    return sum(1 for value in source.values() if value is None)
+
+
+def _without_nulls(value: Any) -> Any:
+    """Return value with null entries dropped from nested objects."""
+    if not isinstance(value, dict):
+        return value
+    return {k: _without_nulls(v) for k, v in value.items() if v is not None}
+
+
+def _collect_leaves(value: Any, path: KeyPath, changed: set[KeyPath]) -> None:
+    """Record every leaf path under value."""
+    if type(value) is not dict or not value:
+        changed.add(path)
+        return
+    stack = [(value, path)]
+    while stack:
+        node, node_path = stack.pop()
+        if isinstance(node, dict) and node:
+            stack.extend((child, (*node_path, key)) for key, child in node.items())
+        else:
+            changed.add(node_path)
@@ -0,0 +1,82 @@
+"""Lightweight tracing of MQTT traffic for Moen Smart Water Network."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, NamedTuple
+
+from .decoder import loads
+
+DEFAULT_TRACE_SIZE = 50
+
+
+class TraceEntry(NamedTuple):
+    """A received message as recorded by MessageTrace."""
+
+    timestamp: float
+    kind: str
+    topic: str
+    payload: bytes
+
+
+class MessageTrace:
+    """
+    Ring buffer of the last raw MQTT messages plus per-kind counters.
+
+    Recording only stores a reference to the payload bytes the CRT already
+    allocated, so it is cheap enough to stay on for every message. Payloads
+    are decoded only when diagnostics are requested. Debug logging records
+    the message kind and size rather than the payload. Messages arrive on
+    AWS CRT threads while diagnostics read from the event loop, so the
+    buffer and counters are guarded by a lock.
+    """
+
+    def __init__(self, logger: logging.Logger, size: int = DEFAULT_TRACE_SIZE) -> None:
+        """Initialize an empty trace logging to logger."""
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._entries: deque[TraceEntry] = deque(maxlen=size)
+        self._counts: Counter[str] = Counter()
+        self._bytes: Counter[str] = Counter()
+
+    def record(self, kind: str, topic: str, payload: bytes) -> None:
+        """Record a received message (any thread)."""
+        entry = TraceEntry(time.time(), kind, topic, payload)
+        with self._lock:
+            self._entries.append(entry)
+            self._counts[kind] += 1
+            self._bytes[kind] += len(payload)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("mqtt %s on %s (%d bytes)", kind, topic, len(payload))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters and the buffered messages, decoded where possible."""
+        with self._lock:
+            counts = dict(self._counts)
+            sizes = dict(self._bytes)
+            entries = list(self._entries)
+        return {
+            "counts": counts,
+            "bytes": sizes,
+            "messages": [
+                {
+                    "timestamp": entry.timestamp,
+                    "kind": entry.kind,
+                    "topic": entry.topic,
+                    "size": len(entry.payload),
+                    "payload": _decode(entry.payload),
+                }
+                for entry in entries
+            ],
+        }
+
+
+def _decode(payload: bytes) -> Any:
+    """Decode a traced payload, falling back to text for invalid JSON."""
+    try:
+        return loads(payload)
+    except ValueError:
+        return payload.decode(errors="replace")
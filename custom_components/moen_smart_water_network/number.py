@@ -33,8 +33,8 @@ async def async_setup_entry(
 
     entities: list[NumberEntity] = []
     for device in devices:
-        for zone in device.data["device"]["irrigation"]["zones"]:
-            if zone.get("wired") is False:
+        for zone in device.zones():
+            if zone.wired is False:
                 continue
             entities.append(ZoneRunDurationNumber(device, zone, config_entry))
     async_add_entities(entities)
@@ -50,6 +50,7 @@ class ZoneRunDurationNumber(MoenZoneEntity, NumberEntity):
     _attr_mode = NumberMode.SLIDER
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_icon = "mdi:timer-outline"
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
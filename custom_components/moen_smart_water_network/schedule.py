@@ -0,0 +1,226 @@
+"""Compiled irrigation schedules for Moen Smart Water Network."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from .moen_api.models import Schedule
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+EVERY_DAY = 0b1111111
+
+# Used when a schedule's zones carry no durations
+DEFAULT_DURATION = timedelta(minutes=30)
+
+ONE_DAY = timedelta(days=1)
+
+# Materialized calendar windows kept per index
+MAX_CACHED_WINDOWS = 8
+
+
+def _parse_start_time(start_at: str) -> time | None:
+    """Parse a HH:MM time string."""
+    try:
+        parts = start_at.split(":")
+        return time(int(parts[0]), int(parts[1]) if len(parts) > 1 else 0)
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchedule:
+    """An active schedule reduced to what occurrence math needs."""
+
+    id: str
+    name: str
+    start: time
+    weekdays: int
+    parity: int | None
+    duration: timedelta
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule) -> CompiledSchedule | None:
+        """Compile a schedule, or return None if it can never run."""
+        if schedule.status != "active":
+            return None
+        start = _parse_start_time(schedule.start_at or "")
+        if start is None:
+            return None
+
+        frequency = schedule.frequency
+        weekdays, parity = EVERY_DAY, None
+        if frequency == "weekly":
+            days = {day.lower() for day in schedule.days_of_week}
+            weekdays = sum(
+                1 << index for index, name in enumerate(WEEKDAYS) if name in days
+            )
+        elif frequency in ("even", "odd"):
+            parity = 0 if frequency == "even" else 1
+        elif frequency != "daily":
+            return None
+        if not weekdays:
+            return None
+
+        minutes = sum(zone.duration for zone in schedule.zones)
+        return cls(
+            id=schedule.id,
+            name=schedule.name,
+            start=start,
+            weekdays=weekdays,
+            parity=parity,
+            duration=timedelta(minutes=minutes) if minutes > 0 else DEFAULT_DURATION,
+        )
+
+    def matches(self, day: date) -> bool:
+        """Return True if the schedule runs on day."""
+        if not (self.weekdays >> day.weekday()) & 1:
+            return False
+        return self.parity is None or day.day % 2 == self.parity
+
+    def following_date(self, day: date) -> date:
+        """Return the next run date after a day the schedule runs on."""
+        if self.parity is None:
+            return day + timedelta(days=_weekday_gap(self.weekdays, day.weekday()))
+        # Same parity is two days on, unless that crosses into a new month
+        following = day + timedelta(days=2)
+        if following.month == day.month:
+            return following
+        return self.next_date(day + ONE_DAY)
+
+    def next_date(self, day: date) -> date:
+        """Return the first date on or after day the schedule runs."""
+        if self.parity is not None:
+            # Odd/even days never need more than two steps (31 -> 1 -> 2)
+            while day.day % 2 != self.parity:
+                day += ONE_DAY
+            return day
+        if (self.weekdays >> day.weekday()) & 1:
+            return day
+        return day + timedelta(days=_weekday_gap(self.weekdays, day.weekday()))
+
+    def start_on(self, day: date, tz: tzinfo | None) -> datetime:
+        """Return the run start on day in the given timezone."""
+        return datetime.combine(day, self.start, tzinfo=tz)
+
+
+@dataclass(frozen=True, slots=True)
+class Occurrence:
+    """A single scheduled run."""
+
+    start: datetime
+    end: datetime
+    schedule: CompiledSchedule
+
+
+@dataclass(slots=True)
+class ScheduleIndex:
+    """Compiled active schedules with a cached next run."""
+
+    schedules: tuple[CompiledSchedule, ...]
+    _windows: dict[tuple[datetime, datetime], tuple[Occurrence, ...]] = field(
+        default_factory=dict, init=False
+    )
+    _next_run: Occurrence | None = field(default=None, init=False)
+    _next_run_day: date | None = field(default=None, init=False)
+
+    @classmethod
+    def from_schedules(cls, schedules: Mapping[str, Schedule]) -> ScheduleIndex:
+        """Compile every runnable schedule."""
+        return cls(
+            tuple(
+                compiled
+                for schedule in schedules.values()
+                if (compiled := CompiledSchedule.from_schedule(schedule)) is not None
+            )
+        )
+
+    def next_occurrence(self, now: datetime) -> Occurrence | None:
+        """
+        Return the next run starting after now.
+
+        The result is cached until it starts or the date changes; a new
+        index is built whenever the schedules change.
+        """
+        today = now.date()
+        cached = self._next_run
+        if self._next_run_day == today and (cached is None or cached.start > now):
+            return cached
+
+        next_run: Occurrence | None = None
+        for schedule in self.schedules:
+            day = schedule.next_date(today)
+            start = schedule.start_on(day, now.tzinfo)
+            if start <= now:
+                day = schedule.next_date(day + ONE_DAY)
+                start = schedule.start_on(day, now.tzinfo)
+            if next_run is None or start < next_run.start:
+                next_run = Occurrence(start, start + schedule.duration, schedule)
+
+        self._next_run = next_run
+        self._next_run_day = today
+        return next_run
+
+    def occurrences(self, start: datetime, end: datetime) -> tuple[Occurrence, ...]:
+        """
+        Return runs starting within [start, end], ordered by start.
+
+        Each schedule yields its runs already in order, so the streams are
+        merged rather than sorted. Recent windows are kept, which serves the
+        calendar card re-requesting the same view on every refresh.
+        """
+        key = (start, end)
+        if (cached := self._windows.get(key)) is not None:
+            return cached
+
+        events = tuple(
+            heapq.merge(
+                *(
+                    _schedule_occurrences(schedule, start, end)
+                    for schedule in self.schedules
+                ),
+                key=lambda occurrence: occurrence.start,
+            )
+        )
+        if len(self._windows) >= MAX_CACHED_WINDOWS:
+            del self._windows[next(iter(self._windows))]
+        self._windows[key] = events
+        return events
+
+
+def _weekday_gap(weekdays: int, weekday: int) -> int:
+    """Return the days from weekday to the next set day in the mask after it."""
+    # Rotate the mask so bit 0 is the day after weekday, then find the first set bit
+    shift = (weekday + 1) % 7
+    rotated = (weekdays >> shift | weekdays << (7 - shift)) & EVERY_DAY
+    return (rotated & -rotated).bit_length()
+
+
+def _schedule_occurrences(
+    schedule: CompiledSchedule, start: datetime, end: datetime
+) -> Iterator[Occurrence]:
+    """Yield a schedule's runs starting within [start, end]."""
+    day = schedule.next_date(start.date())
+    last = end.date()
+    tz = start.tzinfo
+    duration = schedule.duration
+    while day <= last:
+        run_start = schedule.start_on(day, tz)
+        if run_start > end:
+            return
+        if run_start >= start:
+            yield Occurrence(run_start, run_start + duration, schedule)
+        day = schedule.following_date(day)
@@ -8,17 +8,21 @@ from typing import TYPE_CHECKING
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorStateClass,
 )
 from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_time
 
 from .const import DOMAIN
+from .coordinator import PATH_RUN, shadow_path
 from .entity import MoenEntity
 
 if TYPE_CHECKING:
     from datetime import datetime
 
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import MoenDataUpdateCoordinator
@@ -45,6 +49,9 @@ async def async_setup_entry(
                 NextScheduleRunSensor(device),
                 RunRemainingSensor(device),
                 WateringModeSensor(device),
+                ApiRequestsSensor(device),
+                RefreshDurationSensor(device),
+                MessageLatencySensor(device),
             ]
         )
 
@@ -55,6 +62,7 @@ class DeviceSensor(MoenEntity, SensorEntity):
     """Device state sensor."""
 
     _attr_name = "State"
+    _data_paths = frozenset({shadow_path("hydraOverview", "status")})
 
     @property
     def unique_id(self) -> str:
@@ -71,6 +79,7 @@ class RunningZoneNameSensor(MoenEntity, SensorEntity):
     """Running zone name sensor."""
 
     _attr_name = "Running Zone"
+    _data_paths = frozenset({shadow_path("hydraOverview", "zoneID")})
 
     @property
     def unique_id(self) -> str:
@@ -95,7 +104,7 @@ class RunningZoneNameSensor(MoenEntity, SensorEntity):
         if zone is None:
             return "None"
 
-        return zone.get("name", "None")
+        return zone.name or "None"
 
 
 class RssiSensor(MoenEntity, SensorEntity):
@@ -105,6 +114,7 @@ class RssiSensor(MoenEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
     _attr_native_unit_of_measurement = "dBm"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -122,6 +132,8 @@ class NextScheduleRunSensor(MoenEntity, SensorEntity):
 
     _attr_name = "Next Schedule Run"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _data_paths = frozenset()
+    _unsub_next_run: CALLBACK_TYPE | None = None
 
     @property
     def unique_id(self) -> str:
@@ -133,6 +145,36 @@ class NextScheduleRunSensor(MoenEntity, SensorEntity):
         """Return the next scheduled run time."""
         return self._device.next_schedule_run
 
+    async def async_added_to_hass(self) -> None:
+        """Register for updates and cancel the next run timer on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_next_run)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and schedule a rewrite once the run starts."""
+        super().async_write_ha_state()
+        # The value moves on with the clock rather than with new data, and
+        # REST polls can be minutes apart while MQTT is healthy
+        self._async_cancel_next_run()
+        if (start := self.native_value) is not None:
+            self._unsub_next_run = async_track_point_in_time(
+                self.hass, self._async_next_run_started, start
+            )
+
+    @callback
+    def _async_next_run_started(self, _now: datetime) -> None:
+        """Move on to the following run."""
+        self._unsub_next_run = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_next_run(self) -> None:
+        """Cancel the pending next run timer."""
+        if self._unsub_next_run is not None:
+            self._unsub_next_run()
+            self._unsub_next_run = None
+
 
 class RunRemainingSensor(MoenEntity, SensorEntity):
     """Remaining duration for the active irrigation zone."""
@@ -140,6 +182,7 @@ class RunRemainingSensor(MoenEntity, SensorEntity):
     _attr_name = "Run Remaining"
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _data_paths = frozenset({PATH_RUN})
 
     @property
     def unique_id(self) -> str:
@@ -157,6 +200,7 @@ class WateringModeSensor(MoenEntity, SensorEntity):
 
     _attr_name = "Watering Mode"
     _attr_icon = "mdi:water-outline"
+    _data_paths = frozenset()
 
     @property
     def unique_id(self) -> str:
@@ -167,3 +211,77 @@ class WateringModeSensor(MoenEntity, SensorEntity):
     def native_value(self) -> str | None:
         """Return the current watering mode."""
         return self._device.watering_mode
+
+
+class ApiRequestsSensor(MoenEntity, SensorEntity):
+    """Number of REST requests made for the device."""
+
+    _attr_name = "API Requests"
+    _attr_icon = "mdi:counter"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _data_paths = frozenset()
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique id."""
+        return f"{self._device.id}_api_requests"
+
+    @property
+    def native_value(self) -> int:
+        """Return the request count."""
+        return self._device.client.metrics.counter(f"device_requests.{self._device.id}")
+
+
+class RefreshDurationSensor(MoenEntity, SensorEntity):
+    """Mean duration of REST refreshes."""
+
+    _attr_name = "Refresh Duration"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _data_paths = frozenset()
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique id."""
+        return f"{self._device.id}_refresh_duration"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean refresh duration."""
+        return _mean_ms(self._device, "refresh")
+
+
+class MessageLatencySensor(MoenEntity, SensorEntity):
+    """Mean time from an MQTT message arriving to its state being written."""
+
+    _attr_name = "Message Latency"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Refreshed with the REST polls rather than on every message it measures
+    _data_paths = frozenset()
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique id."""
+        return f"{self._device.id}_message_latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean message to state latency."""
+        return _mean_ms(self._device, "message_to_state")
+
+
+def _mean_ms(device: MoenDataUpdateCoordinator, name: str) -> float | None:
+    """Return the mean of a device latency histogram in milliseconds."""
+    histogram = device.metrics.histogram(name)
+    if histogram is None or histogram.mean is None:
+        return None
+    return round(histogram.mean * 1000, 1)
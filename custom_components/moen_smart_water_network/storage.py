@@ -0,0 +1,61 @@
+"""Persistent storage for Moen Smart Water Network."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .moen_api.models import EntrySnapshot, StoredCredentials
+
+STORAGE_VERSION = 1
+
+# Coalesce bursts of token/credential updates into one write
+CREDENTIALS_SAVE_DELAY = 10
+
+# Snapshots only need to be roughly current to warm-start entities
+SNAPSHOT_SAVE_DELAY = 60
+
+
+def credentials_store(hass: HomeAssistant, entry_id: str) -> Store[StoredCredentials]:
+    """Return the store holding an entry's tokens and AWS credentials."""
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.credentials", private=True
+    )
+
+
+class SnapshotStore(Store["EntrySnapshot"]):
+    """Last-known device state used to build entities before the cloud answers."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store for a config entry."""
+        super().__init__(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot", private=True
+        )
+        self._save_pending = False
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], EntrySnapshot]) -> None:
+        """
+        Write a snapshot within SNAPSHOT_SAVE_DELAY.
+
+        Unlike async_delay_save, a steady stream of updates does not keep
+        pushing the write back.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+
+        def _data() -> EntrySnapshot:
+            self._save_pending = False
+            return data_func()
+
+        self.async_delay_save(_data, SNAPSHOT_SAVE_DELAY)
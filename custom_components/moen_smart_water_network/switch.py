@@ -9,6 +9,7 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import EntityCategory
 
 from .const import DOMAIN
+from .coordinator import zone_path
 from .entity import MoenEntity, MoenZoneEntity
 
 if TYPE_CHECKING:
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import MoenDataUpdateCoordinator
-    from .moen_api.models import ZoneData
+    from .moen_api.models import Zone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,8 +34,8 @@ async def async_setup_entry(
 
     entities: list[Entity] = []
     for device in devices:
-        for zone in device.data["device"]["irrigation"]["zones"]:
-            if zone.get("wired") is False:
+        for zone in device.zones():
+            if zone.wired is False:
                 continue
             entities.append(ZoneEnableSwitch(device, zone))
             entities.append(ZoneRunSwitch(device, zone, entry))
@@ -45,11 +46,12 @@ class ZoneEnableSwitch(MoenEntity, SwitchEntity):
     """Switch to enable or disable an irrigation zone."""
 
     _attr_entity_category = EntityCategory.CONFIG
+    _data_paths = frozenset()
 
-    def __init__(self, coordinator: MoenDataUpdateCoordinator, data: ZoneData) -> None:
+    def __init__(self, coordinator: MoenDataUpdateCoordinator, data: Zone) -> None:
         """Initialize the switch class."""
-        self._zone_name = data["name"]
-        self._zone_id = data["clientId"]
+        self._zone_name = data.name
+        self._zone_id = data.client_id
         super().__init__(coordinator)
 
     def __str__(self) -> str:
@@ -67,16 +69,17 @@ class ZoneEnableSwitch(MoenEntity, SwitchEntity):
         return f"{self._zone_name} Zone Enabled"
 
     @property
-    def extra_state_attributes(self) -> ZoneData | None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes of the device."""
-        return self._device.zone_from_client_id(self._zone_id)
+        zone = self._device.zone_from_client_id(self._zone_id)
+        return zone.to_dict() if zone is not None else None
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
         zone = self._device.zone_from_client_id(self._zone_id)
         if zone is not None:
-            return zone.get("enabled")
+            return zone.enabled
         return False
 
     async def async_turn_on(self, **_: Any) -> None:
@@ -95,6 +98,11 @@ class ZoneRunSwitch(MoenZoneEntity, SwitchEntity):
 
     _attr_icon = "mdi:valve"
 
+    @property
+    def data_paths(self) -> frozenset[str]:
+        """Return the data path for this zone's run state."""
+        return frozenset({zone_path(self._zone_number)})
+
     @property
     def unique_id(self) -> str:
         """Return a unique id by combining controller id and zone number."""
@@ -106,9 +114,10 @@ class ZoneRunSwitch(MoenZoneEntity, SwitchEntity):
         return f"{self._zone_name} Zone Run"
 
     @property
-    def extra_state_attributes(self) -> ZoneData | None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes of the device."""
-        return self._device.zone_from_client_id(self._zone_number)
+        zone = self._device.zone_from_client_id(self._zone_number)
+        return zone.to_dict() if zone is not None else None
 
     @property
     def is_on(self) -> bool:
@@ -12,6 +12,7 @@ from homeassistant.components.valve import (
 )
 
 from .const import DOMAIN
+from .coordinator import zone_path
 from .entity import MoenZoneEntity
 
 if TYPE_CHECKING:
@@ -36,8 +37,8 @@ async def async_setup_entry(
 
     entities: list[ValveEntity] = []
     for device in devices:
-        for zone in device.data["device"]["irrigation"]["zones"]:
-            if zone.get("wired") is False:
+        for zone in device.zones():
+            if zone.wired is False:
                 continue
             entities.append(ZoneValve(device, zone, config_entry))
     async_add_entities(entities)
@@ -50,6 +51,11 @@ class ZoneValve(MoenZoneEntity, ValveEntity):
     _attr_supported_features = ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
     _attr_reports_position = False
 
+    @property
+    def data_paths(self) -> frozenset[str]:
+        """Return the data path for this zone's run state."""
+        return frozenset({zone_path(self._zone_number)})
+
     @property
     def unique_id(self) -> str:
         """Return a unique id."""
@@ -0,0 +1,40 @@
+"""Precomputed irrigation run state read by Moen Smart Water Network entities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .moen_api.models import IrrigationRunMessage
+
+
+@dataclass(frozen=True, slots=True)
+class RunView:
+    """Values derived from the latest irrigation run message."""
+
+    status: str | None = None
+    active_zone_id: str | None = None
+    active_zone_duration_remaining: int | None = None
+
+    @classmethod
+    def from_message(cls, message: IrrigationRunMessage | None) -> RunView:
+        """Build a view from an irrigation run message."""
+        if message is None:
+            return NO_RUN
+        state = message.get("body", {}).get("state", {})
+        # A single pass over planned finds the active zone for both fields
+        active = next(
+            (entry for entry in state.get("planned", []) if entry.get("isActive")),
+            None,
+        )
+        if active is None:
+            return cls(status=state.get("status"))
+        return cls(
+            status=state.get("status"),
+            active_zone_id=active.get("zoneId"),
+            active_zone_duration_remaining=active.get("durationRemaining"),
+        )
+
+
+NO_RUN = RunView()
@@ -0,0 +1 @@
+"""Benchmarks for the integration's hot paths."""
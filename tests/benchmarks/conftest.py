@@ -0,0 +1,86 @@
+"""Fixtures shared by the benchmarks."""
+
+import re
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.moen_smart_water_network.const import DOMAIN
+from custom_components.moen_smart_water_network.coordinator import (
+    MoenDataUpdateCoordinator,
+)
+from custom_components.moen_smart_water_network.moen_api.const import API_USER_URL
+from custom_components.moen_smart_water_network.moen_api.models import (
+    Device,
+    Schedule,
+)
+
+from .generators import device_payload, schedules_payload
+
+
+@pytest.fixture
+def bench(benchmark) -> Callable[..., Any]:
+    """
+    Benchmark func(*args) and record its allocations in extra_info.
+
+    A single untimed call runs under tracemalloc first so the timed rounds
+    are not slowed down by allocation tracing.
+    """
+
+    def _run(func: Callable[..., Any], *args: Any) -> Any:
+        tracemalloc.start()
+        try:
+            func(*args)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["alloc_peak_bytes"] = peak
+        benchmark.extra_info["alloc_retained_bytes"] = retained
+        return benchmark(func, *args)
+
+    return _run
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, config_entry):
+    """Return a coordinator for a 32 zone controller with dozens of schedules."""
+    device = Device.from_api(device_payload())
+    coordinator = MoenDataUpdateCoordinator(
+        hass,
+        MagicMock(),
+        MagicMock(),
+        device.duid,
+        device,
+        config_entry=config_entry,
+    )
+    schedules = Schedule.from_response(schedules_payload(36))
+    coordinator._set_schedules({schedule.id: schedule for schedule in schedules})
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+@pytest.fixture
+async def loaded_coordinator(hass: HomeAssistant, config_entry, aioclient_mock):
+    """Set up the integration for a 32 zone controller and return its coordinator."""
+    config_entry.add_to_hass(hass)
+    payload = device_payload()
+    aioclient_mock.get(API_USER_URL, json={"legacyId": "123"})
+    aioclient_mock.get(re.compile(r"/v3/devices$"), json={"devices": [payload]})
+    aioclient_mock.get(re.compile(r"/v3/device/"), json=payload)
+    aioclient_mock.get(
+        re.compile(r"/v3/irrigation/schedules"), json=schedules_payload(36)
+    )
+    aioclient_mock.post(re.compile(r"/v1/user/me/presence"), json={})
+
+    with patch(
+        "custom_components.moen_smart_water_network.MoenMqttClient.async_subscribe_device"
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    yield hass.data[DOMAIN][config_entry.entry_id]["devices"][0]
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,138 @@
+"""Realistic payload generators shared by the benchmarks."""
+
+import json
+
+from custom_components.moen_smart_water_network.moen_api.models import Schedule
+
+FREQUENCIES = ("daily", "odd", "even", "weekly")
+
+# Largest controller: base unit plus expansion modules
+ZONES = 32
+
+
+def device_payload(zones: int = ZONES) -> dict:
+    """Return a device payload shaped like the v3 device endpoint."""
+    return {
+        "duid": "0a1b2c3d",
+        "clientId": "100200",
+        "nickname": "Backyard",
+        "type": "irrigation",
+        "connected": True,
+        "lastConnect": "2026-10-17T06:00:00.000Z",
+        "connectivity": {"type": "wifi", "net": "home", "rssi": -61},
+        "firmware": {"version": "1.2.3", "upgradeUri": "https://example.invalid"},
+        "irrigation": {
+            "wateringMode": "auto",
+            "wateringState": {"running": False},
+            "seasonalAdjust": [100] * 12,
+            "rainSensor": {"connected": False, "type": "none"},
+            "flowSensor": {"connected": True, "unit": "gal", "kFactor": 1},
+            "soilSensors": [],
+            "zones": [
+                {
+                    "id": f"0a1b2c3d_{zone}",
+                    "clientId": str(zone),
+                    "name": f"Zone {zone}",
+                    "enabled": True,
+                    "wired": True,
+                    "media": [],
+                    "soilType": "loam",
+                    "sunExposure": "full",
+                    "sprinklerHead": "rotor",
+                    "cropCoefficient": 0.8,
+                    "rootDepth": 6,
+                }
+                for zone in range(1, zones + 1)
+            ],
+        },
+    }
+
+
+def schedules_payload(count: int = 20) -> dict:
+    """Return a schedules response with one entry per schedule."""
+    return {
+        "items": [
+            {
+                "id": f"schedule-{index}",
+                "name": f"Schedule {index}",
+                "status": "active",
+                "frequency": FREQUENCIES[index % len(FREQUENCIES)],
+                "daysOfWeek": ["monday", "wednesday", "friday"],
+                "preferredTime": {"startAt": "06:15"},
+                "zones": [
+                    {"id": f"0a1b2c3d_{zone}", "clientId": zone, "duration": 10}
+                    for zone in range(1, 9)
+                ],
+            }
+            for index in range(count)
+        ],
+        "total": count,
+    }
+
+
+def large_shadow(zones: int = ZONES, revision: int = 0) -> dict:
+    """Return a reported shadow shaped like a controller with expansion modules."""
+    return {
+        "hydraOverview": {
+            "status": "watering" if revision % 2 else "idle",
+            "zoneID": revision % zones + 1,
+            "runID": f"run-{revision}",
+            "remaining": 600 - revision,
+        },
+        "connectivity": {"rssi": -50 - revision % 10, "net": "wifi", "ssid": "home"},
+        "firmware": {"version": "1.2.3", "modules": {"main": "1.2.3", "exp": "0.9"}},
+        "zones": {
+            str(zone): {
+                "state": "on" if zone == revision % zones + 1 else "off",
+                "flow": {"rate": zone * 0.1, "total": zone * 10 + revision},
+                "fault": None if zone % 7 else "none",
+                "stats": {f"day{day}": day * zone for day in range(7)},
+            }
+            for zone in range(1, zones + 1)
+        },
+        "sensors": {
+            "rain": {"connected": True, "wet": False},
+            "flow": {"connected": True, "kFactor": 1, "offset": 0},
+        },
+    }
+
+
+def many_schedules(count: int = 20) -> dict:
+    """Return active schedules cycling through every frequency."""
+    return {
+        str(index): Schedule.from_api(
+            {
+                "id": str(index),
+                "name": f"Schedule {index}",
+                "status": "active",
+                "frequency": FREQUENCIES[index % len(FREQUENCIES)],
+                "daysOfWeek": ["monday", "wednesday", "friday"],
+                "preferredTime": {"startAt": f"{index % 24:02d}:15"},
+                "zones": [{"duration": 10}],
+            }
+        )
+        for index in range(count)
+    }
+
+
+def shadow_burst(count: int = 100, zones: int = ZONES) -> list[bytes]:
+    """Return raw update/accepted payloads for a burst of small deltas."""
+    return [
+        json.dumps(
+            {
+                "state": {
+                    "reported": {
+                        "hydraOverview": {
+                            "zoneID": index % zones + 1,
+                            "remaining": 600 - index,
+                        },
+                        "zones": {
+                            str(index % zones + 1): {"flow": {"total": 10 + index}}
+                        },
+                    }
+                },
+                "version": index + 2,
+            }
+        ).encode()
+        for index in range(count)
+    ]
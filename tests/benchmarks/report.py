@@ -0,0 +1,89 @@
+"""
+Compare two pytest-benchmark JSON result files.
+
+    python -m tests.benchmarks.report .benchmarks/baseline.json \
+        .benchmarks/current.json --fail-above 20
+
+Prints a markdown table of mean time and allocation changes per benchmark
+and exits non-zero if any mean regressed by more than --fail-above percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _load(path: Path) -> dict[str, dict[str, Any]]:
+    """Return benchmarks of a result file keyed by name."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {bench["name"]: bench for bench in data["benchmarks"]}
+
+
+def _change(before: float | None, after: float | None) -> float | None:
+    """Return the change from before to after in percent."""
+    if not before or after is None:
+        return None
+    return (after - before) / before * 100
+
+
+def _format_change(change: float | None) -> str:
+    return "n/a" if change is None else f"{change:+.1f}%"
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]]
+) -> tuple[list[str], dict[str, float | None]]:
+    """Return report lines and the mean time change of each benchmark."""
+    lines = [
+        "| benchmark | baseline mean | current mean | change | peak alloc change |",
+        "| --- | ---: | ---: | ---: | ---: |",
+    ]
+    changes: dict[str, float | None] = {}
+    for name in sorted(baseline.keys() | current.keys()):
+        before, after = baseline.get(name), current.get(name)
+        if before is None or after is None:
+            lines.append(f"| {name} | {'new' if before is None else 'removed'} ||||")
+            continue
+        changes[name] = _change(before["stats"]["mean"], after["stats"]["mean"])
+        alloc = _change(
+            before["extra_info"].get("alloc_peak_bytes"),
+            after["extra_info"].get("alloc_peak_bytes"),
+        )
+        lines.append(
+            f"| {name} | {before['stats']['mean'] * 1e6:.2f} µs"
+            f" | {after['stats']['mean'] * 1e6:.2f} µs"
+            f" | {_format_change(changes[name])} | {_format_change(alloc)} |"
+        )
+    return lines, changes
+
+
+def main() -> int:
+    """Print the comparison; return 1 on a regression above the threshold."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--fail-above", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    lines, changes = compare(baseline, current)
+    print("\n".join(lines))  # noqa: T201
+
+    if args.fail_above is None:
+        return 0
+    regressions = [
+        name
+        for name, change in changes.items()
+        if change is not None and change > args.fail_above
+    ]
+    for name in sorted(regressions):
+        print(f"REGRESSION: {name} slower than {args.fail_above}%")  # noqa: T201
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
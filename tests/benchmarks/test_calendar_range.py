@@ -0,0 +1,24 @@
+"""Benchmark calendar range queries over a year of schedules."""
+
+from datetime import UTC, datetime
+
+from custom_components.moen_smart_water_network.schedule import ScheduleIndex
+
+from .generators import many_schedules
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+END = datetime(2026, 12, 31, 23, 59, tzinfo=UTC)
+
+
+def test_year_view_uncached(bench) -> None:
+    schedules = many_schedules()
+    events = bench(
+        lambda: ScheduleIndex.from_schedules(schedules).occurrences(START, END)
+    )
+    assert events
+
+
+def test_year_view_cached(bench) -> None:
+    index = ScheduleIndex.from_schedules(many_schedules())
+    events = bench(index.occurrences, START, END)
+    assert events
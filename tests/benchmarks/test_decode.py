@@ -0,0 +1,27 @@
+"""Benchmark JSON decoding of device, schedule and shadow payloads."""
+
+import json
+
+import pytest
+
+from custom_components.moen_smart_water_network.moen_api import decoder
+
+from .generators import device_payload, large_shadow, schedules_payload
+
+PAYLOADS = {
+    "device": json.dumps(device_payload()).encode(),
+    "schedules": json.dumps(schedules_payload()).encode(),
+    "shadow": json.dumps(
+        {"state": {"reported": large_shadow(revision=1)}, "version": 2}
+    ).encode(),
+}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_stdlib_loads(bench, payload: str) -> None:
+    bench(json.loads, PAYLOADS[payload])
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_decoder_loads(bench, payload: str) -> None:
+    assert bench(decoder.loads, PAYLOADS[payload]) == json.loads(PAYLOADS[payload])
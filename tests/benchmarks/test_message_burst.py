@@ -0,0 +1,36 @@
+"""Benchmark a burst of MQTT shadow messages from decode to coordinator state."""
+
+from unittest.mock import MagicMock
+
+from custom_components.moen_smart_water_network.moen_api import MoenMqttClient
+from custom_components.moen_smart_water_network.moen_api.decoder import loads
+from custom_components.moen_smart_water_network.moen_api.shadow import ShadowUpdate
+
+from .generators import shadow_burst
+
+TOPIC = "$aws/things/100200/shadow/update/accepted"
+
+
+def test_decode_and_route_burst(bench) -> None:
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    received: list[ShadowUpdate] = []
+    mqtt_client._shadow_routes = {TOPIC: (received.append, False)}
+    payloads = shadow_burst()
+
+    def _deliver() -> None:
+        received.clear()
+        for payload in payloads:
+            mqtt_client._on_shadow_message(TOPIC, payload)
+
+    bench(_deliver)
+    assert len(received) == len(payloads)
+
+
+async def test_apply_burst_batch(bench, coordinator) -> None:
+    """One coalesced batch of 100 deltas applied to a 32 zone shadow."""
+    updates = [
+        ShadowUpdate.from_document(loads(payload), full=False)
+        for payload in shadow_burst()
+    ]
+    bench(coordinator._apply_mqtt_batch, updates, None)
+    assert coordinator.hydra_overview["remaining"] == 501
@@ -0,0 +1,32 @@
+"""Benchmark next-run calculation over dozens of schedules."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.moen_smart_water_network.schedule import ScheduleIndex
+
+from .generators import many_schedules
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=UTC)
+
+
+def test_next_occurrence_uncached(bench) -> None:
+    schedules = many_schedules(36)
+    occurrence = bench(
+        lambda: ScheduleIndex.from_schedules(schedules).next_occurrence(NOW)
+    )
+    assert occurrence is not None
+
+
+def test_next_occurrence_cached(bench) -> None:
+    index = ScheduleIndex.from_schedules(many_schedules(36))
+    assert bench(index.next_occurrence, NOW) is not None
+
+
+def test_month_view_uncached(bench) -> None:
+    schedules = many_schedules(36)
+    events = bench(
+        lambda: ScheduleIndex.from_schedules(schedules).occurrences(
+            NOW, NOW + timedelta(days=31)
+        )
+    )
+    assert events
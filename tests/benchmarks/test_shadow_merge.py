@@ -0,0 +1,56 @@
+"""Benchmark the shadow merge engine against the original recursive merge."""
+
+import copy
+
+from custom_components.moen_smart_water_network.moen_api.shadow import (
+    ShadowDocument,
+)
+
+from .generators import large_shadow
+
+
+def legacy_merge(a: dict, b: dict, path: list | None = None) -> dict:
+    """Merge b into a (the coordinator's original implementation)."""
+    if path is None:
+        path = []
+    for key, value in b.items():
+        if key in a:
+            if isinstance(a[key], dict) and isinstance(value, dict):
+                legacy_merge(a[key], value, [*path, str(key)])
+            elif a[key] == value:
+                pass  # same leaf value
+            else:
+                a[key] = value
+        else:
+            a[key] = value
+    return a
+
+
+def _merge_rounds(benchmark, merge) -> object:
+    """Benchmark merge(state, update) on a fresh copy of the base each round."""
+    base = large_shadow()
+    update = large_shadow(revision=1)
+    return benchmark.pedantic(
+        merge,
+        setup=lambda: ((copy.deepcopy(base), update), {}),
+        rounds=500,
+    )
+
+
+def test_legacy_merge(benchmark) -> None:
+    _merge_rounds(benchmark, legacy_merge)
+
+
+def test_shadow_document_apply(benchmark) -> None:
+    changed = _merge_rounds(
+        benchmark, lambda state, update: ShadowDocument(state).apply(update)
+    )
+
+    assert ("hydraOverview", "status") in changed
+
+
+def test_shadow_document_apply_full(benchmark) -> None:
+    _merge_rounds(
+        benchmark,
+        lambda state, update: ShadowDocument(state).apply(update, version=2, full=True),
+    )
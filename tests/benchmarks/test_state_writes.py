@@ -0,0 +1,45 @@
+"""Benchmark MQTT updates fanning out to entity state writes."""
+
+from itertools import cycle
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.moen_smart_water_network.moen_api.shadow import ShadowUpdate
+
+from .generators import large_shadow
+
+
+async def test_shadow_update_state_writes(
+    bench, hass: HomeAssistant, loaded_coordinator
+) -> None:
+    """Apply alternating full shadows to a set-up 32 zone controller."""
+    updates = cycle([ShadowUpdate(large_shadow(revision=rev)) for rev in (1, 2)])
+    writes = 0
+
+    @callback
+    def _count(_event) -> None:
+        nonlocal writes
+        writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+    bench(lambda: loaded_coordinator._apply_mqtt_batch([next(updates)], None))
+    await hass.async_block_till_done()
+    unsub()
+
+    assert writes
+    assert hass.states.async_entity_ids()
+
+
+async def test_run_update_state_writes(
+    bench, hass: HomeAssistant, loaded_coordinator
+) -> None:
+    """Apply alternating irrigation run messages to a set-up controller."""
+    runs = cycle(
+        [
+            {"event": "irrigation_run_update", "body": {"state": {"status": s}}}
+            for s in ("WATERING", "SOAKING")
+        ]
+    )
+    bench(lambda: loaded_coordinator._apply_mqtt_batch([], next(runs)))
+    await hass.async_block_till_done()
@@ -0,0 +1,37 @@
+"""Benchmark zone lookups and device decoding on a 32 zone controller."""
+
+from itertools import cycle
+
+from custom_components.moen_smart_water_network.moen_api.models import Device
+
+from .generators import ZONES, device_payload
+
+
+def test_zone_from_client_id(bench, coordinator) -> None:
+    client_ids = [str(zone) for zone in range(1, ZONES + 1)]
+    zones = bench(lambda: [coordinator.zone_from_client_id(i) for i in client_ids])
+    assert None not in zones
+
+
+def test_zone_from_name(bench, coordinator) -> None:
+    names = [f"Zone {zone}" for zone in range(1, ZONES + 1)]
+    zones = bench(lambda: [coordinator.zone_from_name(name) for name in names])
+    assert None not in zones
+
+
+def test_device_from_api(bench) -> None:
+    payload = device_payload()
+    device = bench(Device.from_api, payload)
+    assert len(device.zones) == ZONES
+
+
+def test_device_update_reindexes_zones(bench, coordinator) -> None:
+    """Alternate between two payloads so every round replaces the device."""
+    devices = cycle(
+        [
+            Device.from_api({**device_payload(), "nickname": "Renamed"}),
+            Device.from_api(device_payload()),
+        ]
+    )
+    bench(lambda: coordinator._set_device_information(next(devices)))
+    assert coordinator.zone_from_client_id("32") is not None
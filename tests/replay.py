@@ -0,0 +1,268 @@
+"""
+Replay captured MQTT and REST traffic into a coordinator.
+
+A capture written by TrafficRecorder is fed through the real MoenApiClient
+and MoenMqttClient, backed by a session and connection that serve the
+recorded payloads instead of the network. REST responses become what the
+next refresh sees; MQTT messages are delivered as the CRT would deliver
+them. Per-message CPU time, listener notifications, state writes and
+message-to-notification latency are collected, so runs can be compared
+across versions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import callback
+
+from custom_components.moen_smart_water_network.moen_api import (
+    MoenApiClient,
+    MoenMqttClient,
+    MqttState,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.moen_smart_water_network.coordinator import (
+        MoenDataUpdateCoordinator,
+    )
+
+
+class CapturedRecord(NamedTuple):
+    """One line of a traffic capture."""
+
+    t: float
+    src: str
+    key: str
+    payload: bytes
+    method: str | None = None
+    status: int | None = None
+
+
+def load_capture(path: Path) -> list[CapturedRecord]:
+    """Read a capture file, ordered by capture time."""
+    records = []
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            raw = json.loads(line)
+            records.append(
+                CapturedRecord(
+                    t=raw["t"],
+                    src=raw["src"],
+                    key=raw["topic"] if raw["src"] == "mqtt" else raw["url"],
+                    payload=raw["payload"].encode(),
+                    method=raw.get("method"),
+                    status=raw.get("status"),
+                )
+            )
+    records.sort(key=lambda record: record.t)
+    return records
+
+
+class _ReplayResponse:
+    """Minimal aiohttp response serving a recorded body."""
+
+    def __init__(self, body: bytes) -> None:
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        """Accept the response; only successful ones are recorded."""
+
+    async def read(self) -> bytes:
+        """Return the recorded body."""
+        return self._body
+
+
+class ReplaySession:
+    """aiohttp session stand-in answering with the latest recorded body."""
+
+    def __init__(self) -> None:
+        """Start with no recorded bodies; unknown URLs answer {}."""
+        self._bodies: dict[tuple[str, str], bytes] = {}
+        self.requests = 0
+
+    def serve(self, record: CapturedRecord) -> None:
+        """Serve record's body for its URL from now on."""
+        # A 304 was captured without a body: keep serving the previous one
+        if record.status != 304:
+            self._bodies[(record.method or "get", record.key)] = record.payload
+
+    async def request(self, method: str, url: str, **_: Any) -> _ReplayResponse:
+        """Answer a request from the recorded bodies."""
+        self.requests += 1
+        return _ReplayResponse(self._bodies.get((method, url), b"{}"))
+
+
+def _completed(*_: Any, **__: Any) -> tuple[Future, int]:
+    """Return an already acknowledged CRT request."""
+    future: Future = Future()
+    future.set_result(None)
+    return future, 0
+
+
+def replay_clients(
+    legacy_id: str = "replay",
+) -> tuple[MoenApiClient, MoenMqttClient, ReplaySession]:
+    """Return REST and MQTT clients that never touch the network."""
+    auth = MagicMock()
+    auth.async_ensure_token = AsyncMock()
+    auth.get_auth_headers.return_value = {}
+    session = ReplaySession()
+    client = MoenApiClient(auth=auth, session=session)
+
+    connection = MagicMock()
+    connection.subscribe.side_effect = _completed
+    connection.unsubscribe.side_effect = _completed
+    connection.publish.side_effect = _completed
+    connection.disconnect.side_effect = _completed
+    mqtt_client = MoenMqttClient(auth=auth, legacy_id=legacy_id)
+    mqtt_client._mqtt_connection = connection
+    mqtt_client._supervisor = MagicMock()
+    mqtt_client._set_state(MqttState.CONNECTED)
+    return client, mqtt_client, session
+
+
+@dataclass
+class ReplayStats:
+    """Measurements collected over one replay."""
+
+    messages: int = 0
+    refreshes: int = 0
+    notifications: int = 0
+    state_writes: int = 0
+    cpu: list[float] = field(default_factory=list)
+    latency: list[float] = field(default_factory=list)
+    wall: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary suitable for logging or comparing runs."""
+        return {
+            "messages": self.messages,
+            "refreshes": self.refreshes,
+            "notifications": self.notifications,
+            "state_writes": self.state_writes,
+            "cpu_per_message_us": _mean_us(self.cpu),
+            "latency_mean_ms": _mean_us(self.latency) / 1000,
+            "latency_max_ms": max(self.latency, default=0.0) * 1000,
+            "wall_s": self.wall,
+        }
+
+
+def _mean_us(values: list[float]) -> float:
+    """Return the mean of values in microseconds."""
+    return statistics.fmean(values) * 1e6 if values else 0.0
+
+
+@callback
+def _any_event(_event_data: Any) -> bool:
+    """Accept every event (state_reported listeners require a filter)."""
+    return True
+
+
+class ReplayDriver:
+    """Feed a capture into a coordinator built on replay_clients()."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: MoenDataUpdateCoordinator,
+        mqtt_client: MoenMqttClient,
+        session: ReplaySession,
+    ) -> None:
+        """Initialize for a started coordinator."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._mqtt_client = mqtt_client
+        self._session = session
+        self._device_path = f"/device/{coordinator.id}"
+        self._pending: list[float] = []
+        self._stats = ReplayStats()
+
+    async def async_run(
+        self, records: list[CapturedRecord], speed: float | None = None
+    ) -> ReplayStats:
+        """
+        Replay records and return the collected measurements.
+
+        speed=1 keeps the recorded timing, larger values replay faster and
+        None replays back to back.
+        """
+        stats = self._stats = ReplayStats()
+        self._pending = []
+        unsubs = [
+            self._coordinator.async_add_listener(self._async_notified),
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_written, _any_event
+            ),
+            self._hass.bus.async_listen(
+                EVENT_STATE_REPORTED, self._async_written, _any_event
+            ),
+        ]
+        started = time.perf_counter()
+        previous = records[0].t if records else 0.0
+        try:
+            for record in records:
+                if speed is not None and record.t > previous:
+                    await asyncio.sleep((record.t - previous) / speed)
+                previous = record.t
+                if record.src == "mqtt":
+                    self._deliver(record)
+                else:
+                    await self._async_serve(record)
+            # Let the last batch out of the coalescing window
+            await asyncio.sleep(self._coordinator._inbox._window)
+            await self._hass.async_block_till_done()
+        finally:
+            for unsub in unsubs:
+                unsub()
+        stats.wall = time.perf_counter() - started
+        return stats
+
+    def _deliver(self, record: CapturedRecord) -> None:
+        """Deliver an MQTT message the way the CRT callback would."""
+        on_message = (
+            self._mqtt_client._on_async_message
+            if record.key.startswith("/async/")
+            else self._mqtt_client._on_shadow_message
+        )
+        self._pending.append(time.perf_counter())
+        cpu = time.process_time()
+        on_message(record.key, record.payload)
+        self._stats.cpu.append(time.process_time() - cpu)
+        self._stats.messages += 1
+
+    async def _async_serve(self, record: CapturedRecord) -> None:
+        """Serve a REST response, refreshing when it is the device's own."""
+        self._session.serve(record)
+        if record.key.endswith(self._device_path):
+            await self._coordinator.async_refresh()
+            self._stats.refreshes += 1
+
+    @callback
+    def _async_notified(self) -> None:
+        """Count a notification and the latency of the messages it covers."""
+        now = time.perf_counter()
+        self._stats.notifications += 1
+        self._stats.latency.extend(now - fed for fed in self._pending)
+        self._pending.clear()
+
+    @callback
+    def _async_written(self, _event: Any) -> None:
+        """Count an entity state write."""
+        self._stats.state_writes += 1
@@ -0,0 +1,5 @@
+"""Local Moen cloud simulator for end-to-end, load and latency testing."""
+
+from .server import MoenSimulator, SimulatorStats, refresh_token_for
+
+__all__ = ["MoenSimulator", "SimulatorStats", "refresh_token_for"]
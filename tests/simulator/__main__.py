@@ -0,0 +1,84 @@
+"""
+Run the Moen cloud simulator.
+
+    python -m tests.simulator --accounts 2 --devices 100 --zones 8 \
+        --mqtt-broker localhost:1883
+
+Then set the entry options api_url (printed below) and mqtt_broker, and
+configure each account with its refresh token.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from aiohttp import web
+
+from .publisher import BrokerPublisher
+from .server import MoenSimulator, refresh_token_for
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--accounts", type=int, default=1)
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=8)
+    parser.add_argument("--schedules", type=int, default=2)
+    parser.add_argument("--token-ttl", type=float, default=3600)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--minute", type=float, default=60.0, help="real seconds per watering minute"
+    )
+    parser.add_argument("--mqtt-broker", help="host:port of a local MQTT broker")
+    parser.add_argument("--seed", type=int)
+    return parser
+
+
+def main() -> None:
+    """Serve the simulator until interrupted."""
+    args = _parser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    publisher = None
+    if args.mqtt_broker:
+        host, _, port = args.mqtt_broker.rpartition(":")
+        publisher = BrokerPublisher(host or "localhost", int(port))
+        publisher.connect()
+
+    simulator = MoenSimulator(
+        accounts=args.accounts,
+        devices=args.devices,
+        zones=args.zones,
+        schedules=args.schedules,
+        token_ttl=args.token_ttl,
+        latency=args.latency,
+        jitter=args.jitter,
+        unauthorized_rate=args.unauthorized_rate,
+        minute=args.minute,
+        publish=publisher.publish if publisher is not None else None,
+        seed=args.seed,
+    )
+    _LOGGER.info("api_url: http://%s:%s", args.host, args.port)
+    for account in simulator.accounts:
+        _LOGGER.info(
+            "account %s: refresh token %s, %d devices",
+            account.index,
+            refresh_token_for(account.index),
+            len(account.devices),
+        )
+    try:
+        web.run_app(simulator.app(), host=args.host, port=args.port, print=None)
+    finally:
+        if publisher is not None:
+            publisher.disconnect()
+
+
+if __name__ == "__main__":
+    main()
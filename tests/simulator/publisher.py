@@ -0,0 +1,39 @@
+"""Publish simulator messages to a plain local MQTT broker."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from awscrt import io, mqtt
+
+
+class BrokerPublisher:
+    """
+    Publish to a local broker (such as mosquitto) over plain TCP.
+
+    The integration subscribes to the same broker when its mqtt_broker
+    option is set, so simulated runs reach it as they would from AWS IoT.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """Prepare a connection to host:port."""
+        self._connection = mqtt.Connection(
+            client=mqtt.Client(io.ClientBootstrap.get_or_create_static_default()),
+            host_name=host,
+            port=port,
+            client_id=f"moen-simulator-{uuid4()}",
+        )
+
+    def connect(self) -> None:
+        """Connect to the broker (blocking)."""
+        self._connection.connect().result()
+
+    def publish(self, topic: str, payload: bytes) -> None:
+        """Publish a message (any thread)."""
+        self._connection.publish(
+            topic=topic, payload=payload, qos=mqtt.QoS.AT_LEAST_ONCE
+        )
+
+    def disconnect(self) -> None:
+        """Disconnect from the broker (blocking)."""
+        self._connection.disconnect().result()
@@ -0,0 +1,396 @@
+"""
+Local stand-in for the Moen cloud.
+
+The aiohttp application serves the REST and OAuth endpoints the integration
+uses, laid out as Endpoints.local() expects, for N accounts x M devices x Z
+zones. Access tokens are short-lived JWTs, requests can be slowed down or
+randomly rejected with 401, and manual runs walk through their zones while
+publishing /async/{duid} run updates and shadow updates through a publish
+callback (a local MQTT broker or an in-process MoenMqttClient).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import jwt
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    Publish = Callable[[str, bytes], None]
+
+TOKEN_SECRET = "moen-simulator"
+TOKEN_ISSUER = "https://simulator.invalid"
+
+# Routes that are reachable without an access token
+_PUBLIC_PATHS = frozenset({"/prod/v1/oauth2/token"})
+
+
+def refresh_token_for(account: int) -> str:
+    """Return the refresh token the simulator accepts for an account."""
+    return f"sim-refresh-{account}"
+
+
+@dataclass
+class SimDevice:
+    """A simulated irrigation controller."""
+
+    duid: str
+    client_id: str
+    nickname: str
+    zones: list[dict[str, Any]]
+    schedules: list[dict[str, Any]]
+    running: bool = False
+    shadow_version: int = 0
+    run_task: asyncio.Task[None] | None = None
+
+    def payload(self) -> dict[str, Any]:
+        """Return the device as the v3 device endpoint does."""
+        return {
+            "duid": self.duid,
+            "clientId": self.client_id,
+            "nickname": self.nickname,
+            "type": "irrigation",
+            "connected": True,
+            "lastConnect": "2026-10-17T06:00:00.000Z",
+            "connectivity": {"type": "wifi", "rssi": -60},
+            "firmware": {"version": "1.0.0-sim"},
+            "irrigation": {
+                "wateringMode": "auto",
+                "wateringState": {"running": self.running},
+                "rainSensor": {"connected": False},
+                "flowSensor": {"connected": False},
+                "zones": self.zones,
+            },
+        }
+
+
+@dataclass
+class SimAccount:
+    """A simulated Moen account and its devices."""
+
+    index: int
+    legacy_id: str
+    devices: dict[str, SimDevice] = field(default_factory=dict)
+
+
+@dataclass
+class SimulatorStats:
+    """Requests served, rejected and messages published."""
+
+    requests: int = 0
+    unauthorized: int = 0
+    refreshes: int = 0
+    published: int = 0
+
+
+class MoenSimulator:
+    """Simulated Moen cloud for load and latency testing."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        accounts: int = 1,
+        devices: int = 1,
+        zones: int = 8,
+        schedules: int = 2,
+        token_ttl: float = 3600,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        unauthorized_rate: float = 0.0,
+        minute: float = 60.0,
+        publish: Publish | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Build accounts x devices x zones of simulated state.
+
+        latency (+ up to jitter) seconds are added to every request, a
+        fraction unauthorized_rate of authenticated requests answers 401, and
+        minute is how many real seconds one minute of watering takes.
+        """
+        self._token_ttl = token_ttl
+        self._latency = latency
+        self._jitter = jitter
+        self._unauthorized_rate = unauthorized_rate
+        self._minute = minute
+        self._publish = publish
+        self._random = random.Random(seed)  # noqa: S311
+        self._tokens: dict[str, tuple[SimAccount, float]] = {}
+        self.stats = SimulatorStats()
+        self.accounts = [
+            self._build_account(index, devices, zones, schedules)
+            for index in range(accounts)
+        ]
+        self._refresh_tokens = {
+            refresh_token_for(account.index): account for account in self.accounts
+        }
+        self._devices = {
+            duid: (account, device)
+            for account in self.accounts
+            for duid, device in account.devices.items()
+        }
+
+    @staticmethod
+    def _build_account(
+        index: int, devices: int, zones: int, schedules: int
+    ) -> SimAccount:
+        """Create one account's devices, zones and schedules."""
+        account = SimAccount(index=index, legacy_id=f"sim-{index}")
+        for number in range(devices):
+            duid = f"sim{index:03d}{number:04d}"
+            account.devices[duid] = SimDevice(
+                duid=duid,
+                client_id=str(100000 + index * 10000 + number),
+                nickname=f"Controller {index}-{number}",
+                zones=[
+                    {
+                        "id": f"{duid}_{zone}",
+                        "clientId": str(zone),
+                        "name": f"Zone {zone}",
+                        "enabled": True,
+                        "wired": True,
+                        "connected": True,
+                        "type": "lawn",
+                    }
+                    for zone in range(1, zones + 1)
+                ],
+                schedules=[
+                    {
+                        "id": f"{duid}-schedule-{schedule}",
+                        "name": f"Schedule {schedule}",
+                        "status": "active",
+                        "frequency": ("daily", "odd", "even")[schedule % 3],
+                        "preferredTime": {"startAt": f"{5 + schedule % 4:02d}:00"},
+                        "zones": [
+                            {"id": f"{duid}_{zone}", "clientId": str(zone)}
+                            for zone in range(1, zones + 1)
+                        ],
+                    }
+                    for schedule in range(schedules)
+                ],
+            )
+        return account
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application serving the simulated cloud."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/prod/v1/oauth2/token", self._token)
+        app.router.add_get("/prod/v1/users/me", self._user)
+        app.router.add_post("/prod/v1/invoker", self._empty)
+        app.router.add_post("/v1/user/me/presence", self._empty)
+        app.router.add_get("/v3/events/alerts", self._alerts)
+        app.router.add_get("/v3/devices", self._devices_list)
+        app.router.add_get("/v3/device/{duid}", self._device)
+        app.router.add_post("/v3/device/{duid}/zone/{zone_id}", self._zone)
+        app.router.add_get("/v3/irrigation/schedules", self._schedules)
+        app.router.add_get("/v3/irrigation/schedules/summary", self._empty)
+        app.router.add_post("/v3/irrigation/manual", self._manual)
+        app.on_shutdown.append(self._async_stop_runs)
+        return app
+
+    def issue_token(self, account: SimAccount) -> str:
+        """Issue an access token for account."""
+        expires = time.time() + self._token_ttl
+        token = jwt.encode(
+            {
+                "sub": account.legacy_id,
+                "iss": TOKEN_ISSUER,
+                "exp": int(expires),
+                "jti": f"{account.index}-{self._random.getrandbits(32)}",
+            },
+            TOKEN_SECRET,
+            algorithm="HS256",
+        )
+        self._tokens[token] = (account, expires)
+        return token
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Inject latency and authenticate requests."""
+        self.stats.requests += 1
+        if self._latency or self._jitter:
+            await asyncio.sleep(self._latency + self._random.uniform(0, self._jitter))
+        if request.path not in _PUBLIC_PATHS:
+            account = self._authenticate(request)
+            if account is None or self._random.random() < self._unauthorized_rate:
+                self.stats.unauthorized += 1
+                raise web.HTTPUnauthorized
+            request["account"] = account
+        return await handler(request)
+
+    def _authenticate(self, request: web.Request) -> SimAccount | None:
+        """Return the account of a valid, unexpired bearer token."""
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        entry = self._tokens.get(token)
+        if entry is None:
+            return None
+        account, expires = entry
+        if time.time() >= expires:
+            del self._tokens[token]
+            return None
+        return account
+
+    def _owned_device(self, request: web.Request, duid: str) -> SimDevice:
+        """Return device duid if it belongs to the caller."""
+        account, device = self._devices.get(duid, (None, None))
+        if device is None or account is not request["account"]:
+            raise web.HTTPNotFound
+        return device
+
+    async def _token(self, request: web.Request) -> web.Response:
+        """Exchange a refresh token for new tokens."""
+        body = await request.json()
+        account = self._refresh_tokens.get(body.get("refresh_token"))
+        if account is None:
+            raise web.HTTPUnauthorized
+        self.stats.refreshes += 1
+        token = self.issue_token(account)
+        return web.json_response(
+            {
+                "token": {
+                    "access_token": token,
+                    "id_token": token,
+                    "expires_in": int(self._token_ttl),
+                }
+            }
+        )
+
+    async def _user(self, request: web.Request) -> web.Response:
+        account: SimAccount = request["account"]
+        return web.json_response({"legacyId": account.legacy_id})
+
+    async def _empty(self, _request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    async def _alerts(self, _request: web.Request) -> web.Response:
+        return web.json_response([])
+
+    async def _devices_list(self, request: web.Request) -> web.Response:
+        account: SimAccount = request["account"]
+        return web.json_response(
+            {"devices": [device.payload() for device in account.devices.values()]}
+        )
+
+    async def _device(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            self._owned_device(request, request.match_info["duid"]).payload()
+        )
+
+    async def _schedules(self, request: web.Request) -> web.Response:
+        device = self._owned_device(request, request.query.get("duid", ""))
+        return web.json_response({"items": device.schedules})
+
+    async def _zone(self, request: web.Request) -> web.Response:
+        device = self._owned_device(request, request.match_info["duid"])
+        zone_id = request.match_info["zone_id"]
+        zone = next((zone for zone in device.zones if zone["id"] == zone_id), None)
+        if zone is None:
+            raise web.HTTPNotFound
+        zone.update(await request.json())
+        return web.json_response(zone)
+
+    async def _manual(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        device = self._owned_device(request, str(body.get("duid", "")))
+        self.start_run(device, body.get("zones", []))
+        return web.json_response({"id": f"{device.duid}-manual"})
+
+    def start_run(self, device: SimDevice, zones: list[dict[str, Any]]) -> None:
+        """Start (or restart) a run over zones of {id, duration} entries."""
+        if device.run_task is not None:
+            device.run_task.cancel()
+        device.run_task = asyncio.get_running_loop().create_task(
+            self._async_run(device, zones)
+        )
+
+    async def _async_run(self, device: SimDevice, zones: list[dict[str, Any]]) -> None:
+        """Walk a run through its zones, publishing MQTT updates."""
+        device.running = True
+        try:
+            self._publish_run(device, "STARTING", zones, None)
+            for index, zone in enumerate(zones):
+                remaining = int(zone.get("duration", 1)) * 60
+                self._publish_run(device, "WATERING", zones, index, remaining)
+                self._publish_shadow(device, "watering", zone["id"])
+                await asyncio.sleep(remaining / 60 * self._minute)
+            self._publish_run(device, "COMPLETED", zones, None)
+        finally:
+            device.running = False
+            self._publish_shadow(device, "idle", None)
+
+    def _publish_run(
+        self,
+        device: SimDevice,
+        status: str,
+        zones: list[dict[str, Any]],
+        active: int | None,
+        remaining: int | None = None,
+    ) -> None:
+        """Publish an irrigation_run_update to /async/{duid}."""
+        planned = [
+            {
+                "zoneId": zone["id"],
+                "duration": int(zone.get("duration", 1)) * 60,
+                "isActive": index == active,
+                **({"durationRemaining": remaining} if index == active else {}),
+            }
+            for index, zone in enumerate(zones)
+        ]
+        self._send(
+            f"/async/{device.duid}",
+            {
+                "event": "irrigation_run_update",
+                "body": {"state": {"status": status, "planned": planned}},
+            },
+        )
+
+    def _publish_shadow(
+        self, device: SimDevice, status: str, zone_id: str | None
+    ) -> None:
+        """Publish a reported shadow delta for the device."""
+        device.shadow_version += 1
+        zone_number = zone_id.rpartition("_")[2] if zone_id else None
+        self._send(
+            f"$aws/things/{device.client_id}/shadow/update/accepted",
+            {
+                "state": {
+                    "reported": {
+                        "hydraOverview": {"status": status, "zoneID": zone_number}
+                    }
+                },
+                "version": device.shadow_version,
+            },
+        )
+
+    def _send(self, topic: str, message: dict[str, Any]) -> None:
+        """Hand a message to the publish callback, if any."""
+        if self._publish is None:
+            return
+        self.stats.published += 1
+        self._publish(topic, json.dumps(message).encode())
+
+    async def _async_stop_runs(self, _app: web.Application) -> None:
+        """Cancel runs still in progress."""
+        tasks = [
+            device.run_task
+            for _account, device in self._devices.values()
+            if device.run_task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,116 @@
+"""Tests for Moen OAuth token management."""
+
+import asyncio
+import gc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from custom_components.moen_smart_water_network.moen_api import MoenAuth
+from custom_components.moen_smart_water_network.moen_api.const import OAUTH_URL
+
+TOKEN_RESPONSE = {
+    "token": {"access_token": "new", "expires_in": 3600, "id_token": "id"}
+}
+
+
+async def test_concurrent_refreshes_share_one_request(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Concurrent callers await a single OAuth refresh."""
+    aioclient_mock.post(OAUTH_URL, json=TOKEN_RESPONSE)
+    auth = MoenAuth(
+        access_token="old",
+        refresh_token="refresh",
+        session=async_get_clientsession(hass),
+    )
+
+    await asyncio.gather(
+        *(auth.async_refresh_token(stale_token="old") for _ in range(10))
+    )
+
+    assert aioclient_mock.call_count == 1
+    assert auth.access_token == "new"
+
+
+async def test_failed_refresh_without_callers_is_not_left_unretrieved(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A refresh that fails after every caller was cancelled is still consumed."""
+    release = asyncio.Event()
+
+    async def _answer(*_: object) -> AiohttpClientMockResponse:
+        await release.wait()
+        return AiohttpClientMockResponse("POST", OAUTH_URL, status=400)
+
+    aioclient_mock.post(OAUTH_URL, side_effect=_answer)
+    auth = MoenAuth(
+        access_token="old",
+        refresh_token="refresh",
+        session=async_get_clientsession(hass),
+    )
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict] = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    caller = loop.create_task(auth.async_refresh_token())
+    await asyncio.sleep(0)
+    refresh = auth._refresh_task
+    caller.cancel()
+    await asyncio.wait([caller])
+    release.set()
+    await asyncio.wait([refresh])
+    del refresh
+    gc.collect()
+
+    assert auth._refresh_task is None
+    assert auth.metrics.counter("token_refresh_errors") == 1
+    assert not unhandled
+
+
+async def test_refresh_skipped_when_token_already_replaced(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 401 on an already-replaced token does not refresh again."""
+    aioclient_mock.post(OAUTH_URL, json=TOKEN_RESPONSE)
+    auth = MoenAuth(
+        access_token="old",
+        refresh_token="refresh",
+        session=async_get_clientsession(hass),
+    )
+    await auth.async_refresh_token()
+
+    await auth.async_refresh_token(stale_token="old")
+
+    assert aioclient_mock.call_count == 1
+
+
+async def test_refreshed_tokens_round_trip_through_storage(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Persisted tokens are restored only for the same refresh token."""
+    aioclient_mock.post(OAUTH_URL, json=TOKEN_RESPONSE)
+    session = async_get_clientsession(hass)
+    updates = []
+    auth = MoenAuth(
+        access_token="old",
+        refresh_token="refresh",
+        session=session,
+        on_update=lambda: updates.append(True),
+    )
+    await auth.async_refresh_token()
+    stored = auth.as_dict()
+
+    restored = MoenAuth(access_token="old", refresh_token="refresh", session=session)
+    restored.restore(stored)
+    reauthed = MoenAuth(access_token="old", refresh_token="other", session=session)
+    reauthed.restore(stored)
+
+    assert updates == [True]
+    assert restored.access_token == "new"
+    assert restored.id_token == "id"
+    assert reauthed.access_token == "old"
@@ -0,0 +1,22 @@
+"""Tests for the benchmark comparison report."""
+
+import pytest
+
+from .benchmarks.report import compare
+
+
+def _result(mean: float, peak: int | None = None) -> dict:
+    extra_info = {} if peak is None else {"alloc_peak_bytes": peak}
+    return {"stats": {"mean": mean}, "extra_info": extra_info}
+
+
+def test_compare_reports_time_and_allocation_changes() -> None:
+    lines, changes = compare(
+        {"test_a": _result(1e-6, 1000), "test_gone": _result(1e-6)},
+        {"test_a": _result(1.5e-6, 500), "test_new": _result(1e-6)},
+    )
+
+    assert changes == {"test_a": pytest.approx(50.0)}
+    assert "| test_a | 1.00 µs | 1.50 µs | +50.0% | -50.0% |" in lines
+    assert any(line.startswith("| test_gone | removed") for line in lines)
+    assert any(line.startswith("| test_new | new") for line in lines)
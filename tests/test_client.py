@@ -0,0 +1,216 @@
+"""Tests for the Moen REST API client."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from custom_components.moen_smart_water_network.moen_api import (
+    DEFAULT_ENDPOINTS,
+    MoenApiAuthenticationError,
+    MoenApiClient,
+    MoenApiCommunicationError,
+    MoenApiRateLimitError,
+    MoenAuth,
+)
+from custom_components.moen_smart_water_network.moen_api.const import (
+    API_BASE_URL_V3,
+    API_RETRY_AFTER_MAX,
+)
+
+DEVICE_URL = f"{API_BASE_URL_V3}/device/dev-1"
+DEVICE = {"duid": "dev-1", "clientId": "1", "nickname": "Backyard"}
+
+
+def _build_client(hass: HomeAssistant) -> MoenApiClient:
+    session = async_get_clientsession(hass)
+    auth = MoenAuth(access_token="a", refresh_token="b", session=session)
+    return MoenApiClient(auth=auth, session=session)
+
+
+async def test_etag_revalidation_returns_cached_object(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 304 answer returns the previously parsed payload."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, json=DEVICE, headers={"ETag": '"v1"'})
+    first = await client.async_get_device("dev-1")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(DEVICE_URL, status=304)
+    second = await client.async_get_device("dev-1")
+
+    assert second is first
+    _, _, _, headers = aioclient_mock.mock_calls[0]
+    assert headers["If-None-Match"] == '"v1"'
+
+
+async def test_unchanged_body_without_validators_reuses_parsed_object(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Without validators an identical body is not decoded again."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, json=DEVICE)
+
+    first = await client.async_get_device("dev-1")
+    second = await client.async_get_device("dev-1")
+
+    assert second is first
+    _, _, _, headers = aioclient_mock.mock_calls[1]
+    assert "If-None-Match" not in headers
+
+
+async def test_changed_body_is_decoded(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A different body replaces the cached payload."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, json=DEVICE)
+    await client.async_get_device("dev-1")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(DEVICE_URL, json={**DEVICE, "nickname": "Front"})
+
+    assert (await client.async_get_device("dev-1")).nickname == "Front"
+
+
+async def test_requests_are_counted_and_timed(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Requests, 304s, errors and auth retries are tracked per endpoint."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, json=DEVICE, headers={"ETag": '"v1"'})
+    await client.async_get_device("dev-1")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(DEVICE_URL, status=304)
+    await client.async_get_device("dev-1")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(DEVICE_URL, status=500)
+    with pytest.raises(MoenApiCommunicationError):
+        await client.async_get_device("dev-1")
+
+    metrics = client.metrics
+    assert metrics.counter("requests.device") == 3
+    assert metrics.counter("not_modified.device") == 1
+    assert metrics.counter("errors.device") == 1
+    assert metrics.counter("device_requests.dev-1") == 3
+    assert metrics.histogram("device").count == 3
+    assert metrics.as_dict()["latency"]["device"]["count"] == 3
+
+
+async def test_auth_retry_is_counted(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 401 answer counts a retry and a timed token refresh."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, status=401)
+    aioclient_mock.post(
+        DEFAULT_ENDPOINTS.oauth_url,
+        json={"token": {"access_token": "c", "expires_in": 3600, "id_token": "i"}},
+    )
+
+    with pytest.raises(MoenApiAuthenticationError):
+        await client.async_get_device("dev-1")
+
+    assert client.metrics.counter("auth_retries") == 1
+    assert client.metrics.counter("errors.device") == 2
+    assert client.metrics.counter("device_requests.dev-1") == 2
+    assert client.auth.metrics.counter("token_refreshes") == 1
+    assert client.auth.metrics.histogram("token_refresh").count == 1
+
+
+async def test_rate_limited_request_is_retried_after_retry_after(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 429 pauses the limiter for Retry-After and is retried once."""
+    client = _build_client(hass)
+    answers = [
+        AiohttpClientMockResponse(
+            "GET", DEVICE_URL, status=429, headers={"Retry-After": "0"}
+        ),
+        AiohttpClientMockResponse("GET", DEVICE_URL, json=DEVICE),
+    ]
+
+    async def _answer(*_: object) -> AiohttpClientMockResponse:
+        return answers.pop(0)
+
+    aioclient_mock.get(DEVICE_URL, side_effect=_answer)
+
+    assert (await client.async_get_device("dev-1")).duid == "dev-1"
+    assert client.metrics.counter("rate_limited") == 1
+    assert client.metrics.counter("rate_limit_retries") == 1
+    assert client.metrics.counter("device_requests.dev-1") == 2
+
+
+async def test_long_retry_after_is_not_retried(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A Retry-After beyond the maximum fails fast and pauses the limiter."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, status=429, headers={"Retry-After": "120"})
+
+    with pytest.raises(MoenApiRateLimitError) as err:
+        await client.async_get_device("dev-1")
+
+    assert err.value.retry_after == 120
+    assert aioclient_mock.call_count == 1
+    assert 0 < client.limiter.as_dict()["paused_for"] <= API_RETRY_AFTER_MAX
+
+
+async def test_huge_retry_after_does_not_block_commands(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A command still goes out once the capped pause of a huge Retry-After ends."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, status=429, headers={"Retry-After": "3600"})
+    aioclient_mock.post(f"{DEVICE_URL}/zone/dev-1_z1", json={"enabled": True})
+
+    with patch(
+        "custom_components.moen_smart_water_network.moen_api.client.API_RETRY_AFTER_MAX",
+        0.05,
+    ):
+        with pytest.raises(MoenApiRateLimitError):
+            await client.async_get_device("dev-1")
+        async with asyncio.timeout(1):
+            assert await client.async_enable_zone("dev-1", "z1") == {"enabled": True}
+
+
+async def test_empty_body_returns_none(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """An empty 200 GET body resolves to None rather than a decode error."""
+    client = _build_client(hass)
+    aioclient_mock.get(DEVICE_URL, text="")
+
+    assert await client.async_get_device("dev-1") is None
+    assert client.metrics.counter("errors.device") == 0
+
+
+async def test_not_modified_without_cached_copy_is_fetched_again(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 304 with nothing cached is retried once without validators."""
+    client = _build_client(hass)
+    answers = [
+        AiohttpClientMockResponse("GET", DEVICE_URL, status=304),
+        AiohttpClientMockResponse("GET", DEVICE_URL, json=DEVICE),
+    ]
+
+    async def _answer(*_: object) -> AiohttpClientMockResponse:
+        return answers.pop(0)
+
+    aioclient_mock.get(DEVICE_URL, side_effect=_answer)
+
+    assert (await client.async_get_device("dev-1")).duid == "dev-1"
+    assert aioclient_mock.call_count == 2
+    _, _, _, headers = aioclient_mock.mock_calls[1]
+    assert headers["Cache-Control"] == "no-cache"
+    assert "If-None-Match" not in headers
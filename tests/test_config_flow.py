@@ -0,0 +1,41 @@
+"""Tests for the options flow."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.moen_smart_water_network.const import (
+    CONF_CAPTURE_FILE,
+    CONF_DIAGNOSTICS_PROBE,
+    CONF_MQTT_COALESCE_MS,
+    CONF_ZONE_DURATIONS,
+)
+
+
+async def test_options_flow_keeps_other_options(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """Saving the form keeps zone run durations and developer overrides."""
+    config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_ZONE_DURATIONS: {"1": 10}, CONF_CAPTURE_FILE: "old.ndjson"},
+    )
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert set(result["data_schema"].schema) == {
+        CONF_MQTT_COALESCE_MS,
+        CONF_DIAGNOSTICS_PROBE,
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MQTT_COALESCE_MS: 100.0, CONF_DIAGNOSTICS_PROBE: True},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {
+        CONF_ZONE_DURATIONS: {"1": 10},
+        CONF_CAPTURE_FILE: "old.ndjson",
+        CONF_MQTT_COALESCE_MS: 100,
+        CONF_DIAGNOSTICS_PROBE: True,
+    }
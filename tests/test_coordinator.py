@@ -1,23 +1,42 @@
 """Tests for the MoenDataUpdateCoordinator update flow."""
 
+from dataclasses import replace
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
+from custom_components.moen_smart_water_network.const import (
+    MQTT_SHADOW_GET_TIMEOUT,
+    MQTT_STALE_AFTER,
+    UPDATE_INTERVAL_MQTT,
+    UPDATE_INTERVAL_WATERING,
+)
 from custom_components.moen_smart_water_network.coordinator import (
     MoenDataUpdateCoordinator,
+    shadow_path,
+    zone_path,
 )
 from custom_components.moen_smart_water_network.moen_api import (
     MoenApiAuthenticationError,
     MoenApiCommunicationError,
+    MqttState,
+)
+from custom_components.moen_smart_water_network.moen_api.models import (
+    Device,
+    Schedule,
 )
+from custom_components.moen_smart_water_network.moen_api.shadow import ShadowUpdate
 
 DEVICE_ID = "dev-1"
-DEVICE_DATA = {"duid": DEVICE_ID, "clientId": "client-1"}
-SCHEDULES = {"items": [{"id": "sched-1"}, {"id": "sched-2"}]}
+DEVICE_PAYLOAD = {"duid": DEVICE_ID, "clientId": "client-1"}
+DEVICE_DATA = Device.from_api(DEVICE_PAYLOAD)
+SCHEDULES = Schedule.from_response({"items": [{"id": "sched-1"}, {"id": "sched-2"}]})
 
 
 def _build_coordinator(hass: HomeAssistant, config_entry) -> MoenDataUpdateCoordinator:
@@ -33,7 +52,6 @@ def _build_coordinator(hass: HomeAssistant, config_entry) -> MoenDataUpdateCoord
         mqtt_client=MagicMock(),
         device_id=DEVICE_ID,
         data=DEVICE_DATA,
-        legacy_id="123",
         config_entry=config_entry,
     )
 
@@ -90,3 +108,312 @@ async def test_device_communication_failure_still_raises_update_failed(
 
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+
+async def test_schedules_failure_keeps_device_payload(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """A schedules failure keeps the fresh device and the previous schedules."""
+    coordinator = _build_coordinator(hass, config_entry)
+    await coordinator._async_update_data()
+
+    updated = replace(DEVICE_DATA, connected=True)
+    coordinator.client.async_get_device.return_value = updated
+    coordinator.client.async_get_schedules.side_effect = MoenApiCommunicationError(
+        "boom"
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert data["device"] == updated
+    assert set(data["schedules"]) == {"sched-1", "sched-2"}
+
+
+async def test_schedules_auth_failure_raises_reauth(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """An auth failure on either concurrent call triggers reauth."""
+    coordinator = _build_coordinator(hass, config_entry)
+    coordinator.client.async_get_schedules.side_effect = MoenApiAuthenticationError(
+        "Invalid credentials"
+    )
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_update_data()
+
+
+async def test_polling_relaxes_while_mqtt_flows(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """Healthy MQTT stretches REST polling; an active run tightens it."""
+    coordinator = _build_coordinator(hass, config_entry)
+    coordinator._mqtt_client.async_subscribe_device = AsyncMock()
+    assert coordinator.polling_reason == "mqtt_down"
+
+    # The subscribe requested the shadow, so its reply is awaited, not missed
+    await coordinator._async_subscribe_mqtt()
+    assert coordinator.polling_reason == "mqtt"
+
+    coordinator._apply_mqtt_batch(
+        [ShadowUpdate({"hydraOverview": {"status": "idle"}})], None
+    )
+    assert coordinator.polling_reason == "mqtt"
+    assert coordinator.polling_interval == UPDATE_INTERVAL_MQTT
+
+    coordinator._apply_mqtt_batch(
+        [],
+        {"event": "irrigation_run_update", "body": {"state": {"status": "WATERING"}}},
+    )
+    assert coordinator.polling_reason == "watering"
+    assert coordinator.polling_interval == UPDATE_INTERVAL_WATERING
+
+
+async def test_stale_run_status_is_dropped_when_rest_is_idle(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """A run whose final message was lost stops pinning watering polls."""
+    coordinator = _build_coordinator(hass, config_entry)
+    run = {"event": "irrigation_run_update", "body": {"state": {"status": "WATERING"}}}
+
+    async def _lagging_rest(_: str) -> Device:
+        # A run message arriving mid-request is newer than the REST payload
+        coordinator._apply_mqtt_batch([], run)
+        return DEVICE_DATA
+
+    coordinator.client.async_get_device.side_effect = _lagging_rest
+    await coordinator._async_update_data()
+    assert coordinator.irrigation_run_status == "WATERING"
+    assert coordinator.polling_reason == "watering"
+
+    coordinator.client.async_get_device.side_effect = None
+    await coordinator._async_update_data()
+    assert coordinator.irrigation_run_status is None
+    assert coordinator.irrigation_run is None
+    assert coordinator.polling_reason == "mqtt_down"
+
+
+async def test_failed_subscribe_polls_until_resubscribed(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """A failed subscribe keeps fast polling until a reconnect resubscribes."""
+    coordinator = _build_coordinator(hass, config_entry)
+    mqtt_client = coordinator._mqtt_client
+    mqtt_client.async_subscribe_device = AsyncMock(
+        side_effect=MoenApiCommunicationError("subscribe timed out")
+    )
+    mqtt_client.is_subscribed.return_value = False
+
+    await coordinator._async_subscribe_mqtt()
+    assert coordinator.polling_reason == "mqtt_down"
+
+    coordinator._async_mqtt_state_changed(MqttState.CONNECTED)
+    assert coordinator.polling_reason == "mqtt_down"
+
+    mqtt_client.is_subscribed.return_value = True
+    coordinator._async_mqtt_state_changed(MqttState.CONNECTED)
+    assert coordinator.polling_reason == "mqtt"
+
+
+async def test_quiet_device_is_stale_only_after_unanswered_get(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """A quiet device is re-got; only a get without reply counts as stale."""
+    coordinator = _build_coordinator(hass, config_entry)
+    mqtt_client = coordinator._mqtt_client
+    mqtt_client.async_subscribe_device = AsyncMock()
+    mqtt_client.async_request_shadow = AsyncMock()
+    await coordinator._async_subscribe_mqtt()
+    reply = [ShadowUpdate({"hydraOverview": {"status": "idle"}}, full=True)]
+    coordinator._apply_mqtt_batch(reply, None)
+
+    quiet = MQTT_STALE_AFTER.total_seconds() + 1
+    coordinator._last_mqtt_message -= quiet
+    coordinator._shadow_requested -= quiet
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    mqtt_client.async_request_shadow.assert_awaited_once_with("client-1")
+    assert coordinator.polling_reason == "mqtt"
+
+    coordinator._shadow_requested -= MQTT_SHADOW_GET_TIMEOUT.total_seconds() + 1
+    coordinator._async_adjust_polling()
+    assert coordinator.polling_reason == "mqtt_stale"
+
+    coordinator._apply_mqtt_batch(reply, None)
+    assert coordinator.polling_reason == "mqtt"
+    await coordinator.async_shutdown()
+
+
+async def test_shadow_update_notifies_only_affected_listeners(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """MQTT shadow changes only wake listeners whose data paths changed."""
+    coordinator = _build_coordinator(hass, config_entry)
+    status, zone_1, zone_2, rest_only, everything = (MagicMock() for _ in range(5))
+    coordinator.async_add_listener(
+        status, frozenset({shadow_path("hydraOverview", "status")})
+    )
+    coordinator.async_add_listener(zone_1, frozenset({zone_path(1)}))
+    coordinator.async_add_listener(zone_2, frozenset({zone_path(2)}))
+    coordinator.async_add_listener(rest_only, frozenset())
+    coordinator.async_add_listener(everything)
+
+    coordinator._apply_mqtt_batch(
+        [ShadowUpdate({"hydraOverview": {"status": "idle"}})], None
+    )
+    assert status.call_count == 1
+    assert everything.call_count == 1
+
+    coordinator._apply_mqtt_batch(
+        [ShadowUpdate({"hydraOverview": {"zoneID": 1}})], None
+    )
+    assert zone_1.call_count == 1
+    assert status.call_count == 1
+
+    coordinator._apply_mqtt_batch(
+        [ShadowUpdate({"hydraOverview": {"zoneID": 1}})], None
+    )
+    assert everything.call_count == 2
+
+    coordinator._apply_mqtt_batch(
+        [ShadowUpdate({"hydraOverview": {"zoneID": 2}})], None
+    )
+    assert zone_1.call_count == 2
+    assert zone_2.call_count == 1
+    rest_only.assert_not_called()
+
+    await coordinator.async_shutdown()
+
+
+async def test_zone_lookups_follow_device_updates(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """Zone indexes are rebuilt whenever the device payload changes."""
+    coordinator = _build_coordinator(hass, config_entry)
+    coordinator.client.async_get_device.return_value = Device.from_api(
+        {
+            **DEVICE_PAYLOAD,
+            "irrigation": {
+                "zones": [{"id": f"{DEVICE_ID}_3", "clientId": 3, "name": "Lawn"}]
+            },
+        }
+    )
+
+    assert coordinator.zone_from_client_id(3) is None
+    await coordinator._async_update_data()
+
+    (zone,) = coordinator.zones()
+
+    assert coordinator.zone_from_client_id(3) is zone
+    assert coordinator.zone_from_client_id("3") is zone
+    assert coordinator.zone_from_id(f"{DEVICE_ID}_3") is zone
+    assert coordinator.zone_from_name("Lawn") is zone
+
+
+async def test_models_are_replaced_only_on_changed_payloads(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """An equal decoded payload keeps the current model and zone indexes."""
+    coordinator = _build_coordinator(hass, config_entry)
+    payload = {
+        **DEVICE_PAYLOAD,
+        "connected": True,
+        "irrigation": {
+            "wateringMode": "auto",
+            "wateringState": {"running": True},
+            "rainSensor": {"connected": True},
+        },
+    }
+    coordinator.client.async_get_device.return_value = Device.from_api(payload)
+
+    await coordinator._async_update_data()
+    device = coordinator.device
+    coordinator.client.async_get_device.return_value = Device.from_api(payload)
+    await coordinator._async_update_data()
+
+    assert coordinator.device is device
+    assert coordinator.is_watering
+    assert coordinator.rain_sensor_connected
+    assert not coordinator.flow_sensor_connected
+    assert coordinator.watering_mode == "auto"
+
+    coordinator._apply_mqtt_batch(
+        [],
+        {
+            "event": "irrigation_run_update",
+            "body": {
+                "state": {
+                    "status": "WATERING",
+                    "planned": [
+                        {"zoneId": "z1", "isActive": False},
+                        {"zoneId": "z2", "isActive": True, "durationRemaining": 90},
+                    ],
+                }
+            },
+        },
+    )
+
+    assert coordinator.irrigation_run_status == "WATERING"
+    assert coordinator.active_zone_id == "z2"
+    assert coordinator.active_zone_duration_remaining == 90
+    await coordinator.async_shutdown()
+
+
+async def test_mqtt_messages_coalesced_into_one_notification(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """A burst of messages from the CRT thread wakes listeners once."""
+    coordinator = _build_coordinator(hass, config_entry)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    def _burst() -> None:
+        for status in ("watering", "soaking", "watering"):
+            coordinator._subscribe_update_cb(
+                ShadowUpdate({"hydraOverview": {"status": status}})
+            )
+        for status in ("STARTING", "WATERING"):
+            coordinator._async_message_cb(
+                {
+                    "event": "irrigation_run_update",
+                    "body": {"state": {"status": status}},
+                }
+            )
+
+    await hass.async_add_executor_job(_burst)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert listener.call_count == 1
+    assert coordinator.hydra_overview == {"status": "watering"}
+    assert coordinator.irrigation_run_status == "WATERING"
+    await coordinator.async_shutdown()
+
+
+async def test_mqtt_batches_record_fan_out_and_latency(
+    hass: HomeAssistant, config_entry
+) -> None:
+    """Applied batches count notified listeners and message to state latency."""
+    coordinator = _build_coordinator(hass, config_entry)
+    status, rest_only = MagicMock(), MagicMock()
+    coordinator.async_add_listener(
+        status, frozenset({shadow_path("hydraOverview", "status")})
+    )
+    coordinator.async_add_listener(rest_only, frozenset())
+
+    await hass.async_add_executor_job(
+        coordinator._subscribe_update_cb,
+        ShadowUpdate({"hydraOverview": {"status": "watering"}}),
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    metrics = coordinator.metrics
+    assert metrics.counter("mqtt_batches") == 1
+    assert metrics.counter("listener_updates") == 1
+    assert metrics.counter("listener_notifications") == 1
+    assert metrics.histogram("message_to_state").count == 1
+
+    await coordinator.async_refresh()
+    assert metrics.counter("refreshes") == 1
+    assert metrics.histogram("refresh").count == 1
+    await coordinator.async_shutdown()
@@ -0,0 +1,68 @@
+"""Tests for config entry diagnostics."""
+
+import re
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.moen_smart_water_network.const import CONF_DIAGNOSTICS_PROBE
+from custom_components.moen_smart_water_network.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.moen_smart_water_network.moen_api.const import API_USER_URL
+
+DEVICES = [{"duid": "a", "clientId": "1"}, {"duid": "b", "clientId": "2"}]
+
+
+def _mock_api(aioclient_mock: AiohttpClientMocker, device_b: dict | None) -> None:
+    """Serve both devices, answering 500 for device b when device_b is None."""
+    aioclient_mock.get(API_USER_URL, json={"legacyId": "123"})
+    aioclient_mock.get(re.compile(r"/v3/devices$"), json={"devices": DEVICES})
+    aioclient_mock.get(re.compile(r"/v3/device/a"), json=DEVICES[0])
+    if device_b is None:
+        aioclient_mock.get(re.compile(r"/v3/device/b"), status=500)
+    else:
+        aioclient_mock.get(re.compile(r"/v3/device/b"), json=device_b)
+    aioclient_mock.get(re.compile(r"/v3/irrigation/schedules"), json={"items": []})
+    aioclient_mock.post(re.compile(r"/v1/user/me/presence"), json={})
+
+
+async def test_diagnostics_cover_every_device_without_api_calls(
+    hass: HomeAssistant, config_entry, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Diagnostics come from coordinator state; the probe re-fetches and times."""
+    config_entry.add_to_hass(hass)
+    _mock_api(aioclient_mock, DEVICES[1])
+    with patch(
+        "custom_components.moen_smart_water_network.MoenMqttClient.async_subscribe_device"
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    calls = aioclient_mock.call_count
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert aioclient_mock.call_count == calls
+    assert set(diagnostics["devices"]) == {"a", "b"}
+    assert diagnostics["devices"]["a"]["device"]["duid"] == "a"
+    assert diagnostics["devices"]["a"]["irrigation_run"] is None
+    assert "probe" not in diagnostics
+
+    aioclient_mock.clear_requests()
+    _mock_api(aioclient_mock, None)
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_DIAGNOSTICS_PROBE: True}
+    )
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    probe = diagnostics["probe"]
+    assert probe["device_list"]["result"] == ["a", "b"]
+    assert probe["devices"]["a"]["device"]["result"]["duid"] == "a"
+    assert probe["devices"]["a"]["schedules"]["result"] == []
+    assert "error" in probe["devices"]["b"]["device"]
+    assert probe["devices"]["b"]["device"]["duration_ms"] >= 0
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -1,16 +1,25 @@
 """Test init."""
 
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import (
     AiohttpClientMocker,
 )
+from yarl import URL
 
 from custom_components.moen_smart_water_network import (
     CONF_ACCESS_TOKEN,
     CONF_REFRESH_TOKEN,
     DOMAIN,
 )
+from custom_components.moen_smart_water_network.const import (
+    CONF_API_URL,
+    CONF_MQTT_BROKER,
+)
 from custom_components.moen_smart_water_network.moen_api.const import API_USER_URL
 
 # from pytest_homeassistant_custom_component.common import (
@@ -46,3 +55,63 @@ async def test_setup_entry(
     assert len(hass.data[DOMAIN][config_entry.entry_id]["devices"]) == 2
 
     assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_setup_entry_warm_start_from_snapshot(
+    hass: HomeAssistant,
+    config_entry,
+    aioclient_mock: AiohttpClientMocker,
+    hass_storage,
+) -> None:
+    """A stored snapshot builds devices without waiting on the user endpoint."""
+    config_entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{config_entry.entry_id}.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{config_entry.entry_id}.snapshot",
+        "data": {
+            "legacy_id": "123",
+            "devices": [
+                {
+                    "device": {"duid": "a", "clientId": "1", "connected": True},
+                    "schedules": {},
+                    "shadow": {"hydraOverview": {"status": "idle"}},
+                }
+            ],
+        },
+    }
+    aioclient_mock.get(
+        "https://api.prod.iot.moen.com/v3/devices",
+        status=200,
+        json={"devices": [{"duid": "a", "clientId": "1"}]},
+    )
+
+    with patch(
+        "custom_components.moen_smart_water_network.MoenMqttClient.async_subscribe_device"
+    ):
+        assert await async_setup_component(
+            hass, DOMAIN, {CONF_ACCESS_TOKEN: "a", CONF_REFRESH_TOKEN: "b"}
+        )
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    devices = hass.data[DOMAIN][config_entry.entry_id]["devices"]
+    assert [device.id for device in devices] == ["a"]
+    assert devices[0].hydra_overview == {"status": "idle"}
+    assert not any(call[1] == URL(API_USER_URL) for call in aioclient_mock.mock_calls)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_setup_entry_rejects_invalid_mqtt_broker(hass: HomeAssistant) -> None:
+    """A malformed broker option fails setup with a clear error, not a traceback."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_ACCESS_TOKEN: "a", CONF_REFRESH_TOKEN: "b"},
+        options={CONF_API_URL: "http://127.0.0.1:8099", CONF_MQTT_BROKER: "host:x"},
+    )
+    entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    assert "Invalid port" in entry.reason
@@ -0,0 +1,63 @@
+"""Tests for the client-side request rate limiter."""
+
+import asyncio
+import time
+
+from custom_components.moen_smart_water_network.moen_api.limiter import (
+    RateLimiter,
+    RequestPriority,
+)
+from custom_components.moen_smart_water_network.moen_api.metrics import Metrics
+
+
+async def test_commands_overtake_queued_polls() -> None:
+    """Once the burst is spent, queued requests are granted by priority."""
+    metrics = Metrics()
+    limiter = RateLimiter(rate=200, burst=1, metrics=metrics)
+    granted: list[str] = []
+
+    async def _request(name: str, priority: RequestPriority) -> None:
+        await limiter.async_acquire(priority)
+        granted.append(name)
+
+    await _request("first", RequestPriority.POLL)
+    polls = [
+        asyncio.create_task(_request(f"poll-{i}", RequestPriority.POLL))
+        for i in range(3)
+    ]
+    presence = asyncio.create_task(_request("presence", RequestPriority.BACKGROUND))
+    command = asyncio.create_task(_request("command", RequestPriority.COMMAND))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 5
+
+    await asyncio.gather(*polls, presence, command)
+
+    assert granted == ["first", "command", "poll-0", "poll-1", "poll-2", "presence"]
+    assert limiter.queue_depth == 0
+    assert limiter.as_dict()["max_queue_depth"] == 5
+    assert metrics.counter("throttled.poll") == 3
+    assert metrics.histogram("wait.command").count == 1
+
+
+async def test_pause_holds_back_requests() -> None:
+    """A Retry-After pause delays the next grant even with tokens left."""
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.pause(0.05)
+
+    start = time.monotonic()
+    await limiter.async_acquire(RequestPriority.COMMAND)
+
+    assert time.monotonic() - start >= 0.04
+
+
+async def test_cancelled_waiter_is_skipped() -> None:
+    """A request cancelled while queued does not consume a token."""
+    limiter = RateLimiter(rate=100, burst=1)
+    await limiter.async_acquire(RequestPriority.POLL)
+    waiter = asyncio.create_task(limiter.async_acquire(RequestPriority.POLL))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    await limiter.async_acquire(RequestPriority.POLL)
+    assert limiter.queue_depth == 0
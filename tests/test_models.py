@@ -0,0 +1,52 @@
+"""Tests for the parsed API models."""
+
+from custom_components.moen_smart_water_network.moen_api.models import (
+    Device,
+    Schedule,
+)
+
+DEVICE = {
+    "duid": "dev-1",
+    "clientId": "1",
+    "nickname": "Backyard",
+    "connected": True,
+    "firmware": {"version": "1.2.3", "upgradeUri": "https://example.invalid"},
+    "connectivity": {"rssi": -61, "net": "wifi"},
+    "irrigation": {
+        "wateringMode": "auto",
+        "wateringState": {"running": False},
+        "flowSensor": {"connected": True, "kFactor": 1},
+        "soilSensors": [],
+        "zones": [
+            {"id": "dev-1_1", "clientId": 1, "name": "Lawn", "media": [], "slope": ""}
+        ],
+    },
+}
+
+
+def test_device_round_trips_through_to_dict() -> None:
+    device = Device.from_api(DEVICE)
+
+    assert device.firmware_version == "1.2.3"
+    assert device.flow_sensor_connected
+    assert device.zones[0].client_id == "1"
+    assert "media" not in device.zones[0].to_dict()
+    assert Device.from_api(device.to_dict()) == device
+
+
+def test_schedule_round_trips_through_to_dict() -> None:
+    schedule = Schedule.from_api(
+        {
+            "id": "s1",
+            "name": "Morning",
+            "status": "active",
+            "frequency": "weekly",
+            "daysOfWeek": ["monday"],
+            "preferredTime": {"startAt": "06:00"},
+            "zones": [{"id": "dev-1_1", "clientId": 1, "duration": 10}],
+            "waterSense": True,
+        }
+    )
+
+    assert schedule.days_of_week == ("monday",)
+    assert Schedule.from_api(schedule.to_dict()) == schedule
@@ -0,0 +1,363 @@
+"""Tests for the shared MQTT connection manager."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from awscrt import mqtt
+from awscrt.exceptions import AwsCrtError
+
+from custom_components.moen_smart_water_network.moen_api import (
+    Endpoints,
+    MoenMqttClient,
+    MqttState,
+)
+from custom_components.moen_smart_water_network.moen_api.trace import MessageTrace
+
+
+async def test_connection_opened_once_for_concurrent_devices() -> None:
+    """Concurrent device subscriptions share a single connection."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+
+    async def _open() -> None:
+        await asyncio.sleep(0)
+        mqtt_client._mqtt_connection = MagicMock()
+
+    with (
+        patch.object(
+            mqtt_client, "_async_open_connection", side_effect=_open
+        ) as open_connection,
+        patch.object(mqtt_client, "_subscribe_shadow_topics", AsyncMock()),
+        patch.object(mqtt_client, "_subscribe_async_topic", AsyncMock()),
+        patch.object(mqtt_client, "_publish_get_shadow", AsyncMock()),
+    ):
+        await asyncio.gather(
+            *(
+                mqtt_client.async_subscribe_device(
+                    client_id=str(i), duid=f"duid-{i}", shadow_callback=MagicMock()
+                )
+                for i in range(5)
+            )
+        )
+        await mqtt_client.async_disconnect()
+
+    assert open_connection.call_count == 1
+
+
+async def _drain_loop() -> None:
+    """Let pending callbacks and future chains on the loop run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_async_messages_routed_by_topic() -> None:
+    """Each /async/{duid} message reaches only the device that owns the topic."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    first, second = MagicMock(), MagicMock()
+    mqtt_client._async_callbacks = {"/async/a": first, "/async/b": second}
+
+    mqtt_client._on_async_message("/async/b", b'{"event": "irrigation_run_update"}')
+    mqtt_client._on_async_message("/async/unknown", b"{}")
+
+    first.assert_not_called()
+    second.assert_called_once_with({"event": "irrigation_run_update"})
+
+
+def test_shadow_messages_decoded_once_and_routed() -> None:
+    """Raw shadow payloads are decoded and tagged as delta or full documents."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    callback = MagicMock()
+    mqtt_client._shadow_routes = {
+        "$aws/things/1/shadow/update/accepted": (callback, False),
+        "$aws/things/1/shadow/update/documents": (callback, True),
+    }
+
+    mqtt_client._on_shadow_message(
+        "$aws/things/1/shadow/update/accepted",
+        b'{"state": {"reported": {"hydraOverview": {"status": "watering"}}},'
+        b' "version": 7}',
+    )
+    mqtt_client._on_shadow_message(
+        "$aws/things/1/shadow/update/documents",
+        b'{"previous": {}, "current": {"state": {"reported": {"a": 1}}, "version": 8}}',
+    )
+    mqtt_client._on_shadow_message(
+        "$aws/things/1/shadow/update/accepted", b'{"state": {"desired": {}}}'
+    )
+
+    delta, document = (call.args[0] for call in callback.call_args_list)
+    assert (delta.reported, delta.version, delta.full) == (
+        {"hydraOverview": {"status": "watering"}},
+        7,
+        False,
+    )
+    assert (document.reported, document.version, document.full) == ({"a": 1}, 8, True)
+
+
+async def test_device_subscriptions_issued_concurrently() -> None:
+    """All topics are subscribed before any acknowledgement is awaited."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    pending: list[Future] = []
+
+    def _request(*_: object, **__: object) -> tuple[Future, int]:
+        future: Future = Future()
+        pending.append(future)
+        return future, len(pending)
+
+    connection = MagicMock()
+    connection.subscribe.side_effect = _request
+    connection.publish.side_effect = _request
+    mqtt_client._mqtt_connection = connection
+    mqtt_client._supervisor = MagicMock()
+    mqtt_client._set_state(MqttState.CONNECTED)
+
+    task = asyncio.create_task(
+        mqtt_client.async_subscribe_device(
+            client_id="1",
+            duid="a",
+            shadow_callback=MagicMock(),
+            async_callback=MagicMock(),
+        )
+    )
+    await _drain_loop()
+
+    assert connection.subscribe.call_count == 4
+    connection.publish.assert_not_called()
+
+    for future in pending:
+        future.set_result(None)
+    await _drain_loop()
+    connection.publish.assert_called_once()
+    pending[-1].set_result(None)
+    await task
+
+    assert connection.publish.call_args.kwargs["topic"] == "$aws/things/1/shadow/get"
+
+
+async def test_failed_connect_retries_with_fresh_credentials() -> None:
+    """A rejected connect is retried after backoff with fresh credentials."""
+    auth = MagicMock(access_token="old")
+    auth.async_refresh_token = AsyncMock()
+    mqtt_client = MoenMqttClient(auth=auth, legacy_id="123")
+    states: list[MqttState] = []
+    mqtt_client.async_add_state_listener(states.append)
+    attempts = 0
+
+    async def _open() -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise AwsCrtError(
+                0, "AWS_ERROR_HTTP_WEBSOCKET_UPGRADE_FAILURE", "upgrade failed"
+            )
+        mqtt_client._mqtt_connection = MagicMock()
+
+    with (
+        patch.object(mqtt_client, "_async_open_connection", side_effect=_open),
+        patch(
+            "custom_components.moen_smart_water_network.moen_api.mqtt._reconnect_delay",
+            return_value=0,
+        ),
+    ):
+        await mqtt_client.async_connect()
+
+    assert states == [MqttState.CONNECTING, MqttState.RECONNECTING, MqttState.CONNECTED]
+    auth.invalidate_aws_credentials.assert_called_once()
+    auth.async_refresh_token.assert_awaited_once_with(stale_token="old")
+    await mqtt_client.async_disconnect()
+    assert states[-1] is MqttState.DISCONNECTED
+
+
+async def test_not_authorized_refreshes_tokens_before_retrying() -> None:
+    """A broker NOT_AUTHORIZED renews the id_token before the next attempt."""
+    auth = MagicMock(access_token="old")
+    mqtt_client = MoenMqttClient(auth=auth, legacy_id="123")
+    events: list[str] = []
+
+    async def _refresh(stale_token: str | None = None) -> None:
+        events.append(f"refresh {stale_token}")
+        auth.access_token = "new"
+
+    auth.async_refresh_token = AsyncMock(side_effect=_refresh)
+
+    async def _open() -> None:
+        events.append(f"connect {auth.access_token}")
+        if len(events) == 1:
+            raise Exception(mqtt.ConnectReturnCode.NOT_AUTHORIZED)  # noqa: TRY002
+        mqtt_client._mqtt_connection = MagicMock()
+
+    with (
+        patch.object(mqtt_client, "_async_open_connection", side_effect=_open),
+        patch(
+            "custom_components.moen_smart_water_network.moen_api.mqtt._reconnect_delay",
+            return_value=0,
+        ),
+    ):
+        await mqtt_client.async_connect()
+
+    assert events == ["connect old", "refresh old", "connect new"]
+    await mqtt_client.async_disconnect()
+
+
+async def test_network_failures_keep_cached_credentials() -> None:
+    """Plain network failures and lost connections reuse cached credentials."""
+    auth = MagicMock()
+    mqtt_client = MoenMqttClient(auth=auth, legacy_id="123")
+    connection = MagicMock()
+    attempts = 0
+
+    async def _open() -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OSError("network unreachable")
+        mqtt_client._mqtt_connection = connection
+
+    with (
+        patch.object(mqtt_client, "_async_open_connection", side_effect=_open),
+        patch(
+            "custom_components.moen_smart_water_network.moen_api.mqtt._reconnect_delay",
+            return_value=0,
+        ),
+    ):
+        await mqtt_client.async_connect()
+        mqtt_client._async_connection_lost(connection)
+        await _drain_loop()
+        await mqtt_client.async_connect()
+
+    assert attempts == 3
+    auth.invalidate_aws_credentials.assert_not_called()
+    await mqtt_client.async_disconnect()
+
+
+async def test_local_broker_connects_without_cognito() -> None:
+    """A local broker endpoint skips Cognito and AWS request signing."""
+    auth = MagicMock()
+    auth.async_ensure_id_token = AsyncMock()
+    mqtt_client = MoenMqttClient(
+        auth=auth,
+        legacy_id="123",
+        endpoints=Endpoints.local("http://127.0.0.1:8099", "127.0.0.1:1883"),
+    )
+    connected: Future = Future()
+    connected.set_result(None)
+    connection = MagicMock()
+    connection.connect.return_value = connected
+
+    with patch.object(
+        mqtt_client, "_create_local_connection", return_value=connection
+    ) as create:
+        await mqtt_client._async_open_connection()
+
+    create.assert_called_once()
+    auth.async_ensure_id_token.assert_not_awaited()
+    auth.create_cognito_credentials_provider.assert_not_called()
+    assert mqtt_client._mqtt_connection is connection
+
+
+async def test_resume_without_session_resubscribes_and_regets() -> None:
+    """A resumed connection without its session resubscribes every device."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    connection = MagicMock()
+
+    async def _open() -> None:
+        mqtt_client._mqtt_connection = connection
+
+    with (
+        patch.object(mqtt_client, "_async_open_connection", side_effect=_open),
+        patch.object(
+            mqtt_client, "_subscribe_shadow_topics", AsyncMock()
+        ) as subscribe_shadow,
+        patch.object(mqtt_client, "_subscribe_async_topic", AsyncMock()),
+        patch.object(mqtt_client, "_publish_get_shadow", AsyncMock()) as get_shadow,
+    ):
+        await mqtt_client.async_subscribe_device(
+            client_id="1", duid="a", shadow_callback=MagicMock()
+        )
+        assert subscribe_shadow.call_count == 1
+        assert get_shadow.call_count == 1
+
+        mqtt_client._async_interrupted(connection)
+        assert mqtt_client.state is MqttState.RECONNECTING
+
+        mqtt_client._async_resumed(connection, session_present=False)
+        await _drain_loop()
+
+        assert mqtt_client.state is MqttState.CONNECTED
+        assert subscribe_shadow.call_count == 2
+        assert get_shadow.call_count == 2
+        await mqtt_client.async_disconnect()
+
+
+async def test_lost_connection_reported_before_backoff() -> None:
+    """A lost connection stops counting as connected while backing off."""
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+    connection = MagicMock()
+
+    async def _open() -> None:
+        mqtt_client._mqtt_connection = connection
+
+    with (
+        patch.object(mqtt_client, "_async_open_connection", side_effect=_open),
+        patch(
+            "custom_components.moen_smart_water_network.moen_api.mqtt._reconnect_delay",
+            return_value=60,
+        ),
+    ):
+        await mqtt_client.async_connect()
+        assert mqtt_client.connected
+
+        mqtt_client._async_connection_lost(connection)
+        await _drain_loop()
+
+        assert mqtt_client.state is MqttState.RECONNECTING
+        assert not mqtt_client.connected
+        assert not mqtt_client._connected.is_set()
+        await mqtt_client.async_disconnect()
+
+
+def test_trace_keeps_last_messages_and_counts() -> None:
+    """The trace ring buffer keeps the newest raw messages and running totals."""
+    trace = MessageTrace(logging.getLogger(__name__), size=2)
+
+    trace.record("shadow", "$aws/things/1/shadow/update/accepted", b'{"a": 1}')
+    trace.record("async", "/async/a", b'{"event": "x"}')
+    trace.record("async", "/async/a", b"not json")
+
+    data = trace.as_dict()
+    assert data["counts"] == {"shadow": 1, "async": 2}
+    assert data["bytes"] == {"shadow": 8, "async": 22}
+    assert [message["payload"] for message in data["messages"]] == [
+        {"event": "x"},
+        "not json",
+    ]
+
+
+def test_received_messages_are_traced() -> None:
+    mqtt_client = MoenMqttClient(auth=MagicMock(), legacy_id="123")
+
+    mqtt_client._on_async_message("/async/unknown", b"{}")
+
+    assert mqtt_client.trace.as_dict()["counts"] == {"async": 1}
+
+
+def test_trace_snapshot_is_consistent_under_concurrent_records() -> None:
+    """Recording from several threads keeps the counters and buffer in step."""
+    trace = MessageTrace(logging.getLogger(__name__), size=10)
+
+    def _record() -> None:
+        for _ in range(500):
+            trace.record("async", "/async/a", b"{}")
+
+    threads = [threading.Thread(target=_record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    data = trace.as_dict()
+    assert data["counts"] == {"async": 2000}
+    assert data["bytes"] == {"async": 4000}
+    assert len(data["messages"]) == 10
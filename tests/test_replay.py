@@ -0,0 +1,95 @@
+"""Tests for traffic capture and replay into the coordinator."""
+
+import json
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.moen_smart_water_network.coordinator import (
+    MoenDataUpdateCoordinator,
+)
+from custom_components.moen_smart_water_network.moen_api.capture import (
+    TrafficRecorder,
+)
+from custom_components.moen_smart_water_network.moen_api.const import API_BASE_URL_V3
+from custom_components.moen_smart_water_network.moen_api.models import Device
+
+from .replay import ReplayDriver, load_capture, replay_clients
+
+DEVICE_ID = "dev-1"
+DEVICE_URL = f"{API_BASE_URL_V3}/device/{DEVICE_ID}"
+SHADOW_TOPIC = "$aws/things/client-1/shadow/update/accepted"
+
+
+def _shadow(status: str) -> bytes:
+    return json.dumps(
+        {"state": {"reported": {"hydraOverview": {"status": status}}}}
+    ).encode()
+
+
+def test_recorder_writes_timestamped_lines(tmp_path) -> None:
+    """Captured messages and responses are written one JSON object per line."""
+    recorder = TrafficRecorder(tmp_path / "capture.ndjson")
+    recorder.record_rest("get", DEVICE_URL, {"expand": "addons"}, 200, b'{"a":1}')
+    recorder.record_mqtt(SHADOW_TOPIC, _shadow("idle"))
+    recorder.close()
+
+    lines = (tmp_path / "capture.ndjson").read_text().splitlines()
+    rest, mqtt = map(json.loads, lines)
+    assert rest["src"] == "rest"
+    assert rest["params"] == {"expand": "addons"}
+    assert rest["payload"] == '{"a":1}'
+    assert mqtt["src"] == "mqtt"
+    assert mqtt["topic"] == SHADOW_TOPIC
+    assert mqtt["t"] >= rest["t"]
+
+
+async def test_replay_drives_coordinator(hass: HomeAssistant, config_entry, tmp_path):
+    """A capture replays through the real clients without network access."""
+    path = tmp_path / "capture.ndjson"
+    recorder = TrafficRecorder(path)
+    recorder.record_rest(
+        "get",
+        DEVICE_URL,
+        {"expand": "addons"},
+        200,
+        json.dumps(
+            {"duid": DEVICE_ID, "clientId": "client-1", "nickname": "Yard"}
+        ).encode(),
+    )
+    for status in ("watering", "soaking", "watering"):
+        recorder.record_mqtt(SHADOW_TOPIC, _shadow(status))
+    recorder.record_mqtt(
+        f"/async/{DEVICE_ID}",
+        b'{"event": "irrigation_run_update", "body": {"state": {"status": "WATERING"}}}',
+    )
+    recorder.close()
+
+    client, mqtt_client, session = replay_clients()
+    coordinator = MoenDataUpdateCoordinator(
+        hass,
+        client,
+        mqtt_client,
+        DEVICE_ID,
+        Device.from_api({"duid": DEVICE_ID, "clientId": "client-1"}),
+        config_entry=config_entry,
+    )
+    await coordinator.async_start_mqtt()
+    await coordinator._mqtt_task
+
+    stats = await ReplayDriver(hass, coordinator, mqtt_client, session).async_run(
+        load_capture(path)
+    )
+
+    assert coordinator.device.nickname == "Yard"
+    assert coordinator.hydra_overview == {"status": "watering"}
+    assert coordinator.irrigation_run_status == "WATERING"
+    assert stats.refreshes == 1
+    assert stats.messages == 4
+    assert len(stats.cpu) == 4
+    # The MQTT burst is coalesced into a single notification
+    assert stats.notifications == 2
+    assert len(stats.latency) == 4
+    assert stats.as_dict()["messages"] == 4
+
+    await coordinator.async_shutdown()
+    await mqtt_client.async_disconnect()
@@ -0,0 +1,119 @@
+"""Tests for compiled irrigation schedules."""
+
+from datetime import UTC, date, datetime
+
+from custom_components.moen_smart_water_network.moen_api.models import Schedule
+from custom_components.moen_smart_water_network.schedule import (
+    CompiledSchedule,
+    ScheduleIndex,
+)
+
+
+def _schedule(schedule_id: str, frequency: str, **extra: object) -> Schedule:
+    return Schedule.from_api(
+        {
+            "id": schedule_id,
+            "name": f"Schedule {schedule_id}",
+            "status": "active",
+            "frequency": frequency,
+            "preferredTime": {"startAt": "06:30"},
+            "zones": [{"duration": 10}, {"duration": 5}],
+            **extra,
+        }
+    )
+
+
+def test_weekly_next_date_wraps_the_week() -> None:
+    compiled = CompiledSchedule.from_schedule(
+        _schedule("1", "weekly", daysOfWeek=["Monday", "Thursday"])
+    )
+    assert compiled is not None
+
+    # 2026-10-16 is a Friday
+    assert compiled.next_date(date(2026, 10, 16)) == date(2026, 10, 19)
+    assert compiled.next_date(date(2026, 10, 19)) == date(2026, 10, 19)
+    assert compiled.next_date(date(2026, 10, 20)) == date(2026, 10, 22)
+
+
+def test_parity_next_date_across_month_boundary() -> None:
+    odd = CompiledSchedule.from_schedule(_schedule("1", "odd"))
+    even = CompiledSchedule.from_schedule(_schedule("2", "even"))
+    assert odd is not None
+    assert even is not None
+
+    assert odd.next_date(date(2026, 10, 30)) == date(2026, 10, 31)
+    assert even.next_date(date(2026, 10, 31)) == date(2026, 11, 2)
+    assert odd.next_date(date(2026, 11, 2)) == date(2026, 11, 3)
+
+
+def test_inactive_and_unknown_schedules_are_skipped() -> None:
+    index = ScheduleIndex.from_schedules(
+        {
+            "1": _schedule("1", "daily", status="inactive"),
+            "2": _schedule("2", "monthly"),
+            "3": _schedule("3", "weekly", daysOfWeek=[]),
+            "4": _schedule("4", "daily"),
+        }
+    )
+
+    assert [schedule.id for schedule in index.schedules] == ["4"]
+
+
+def test_next_occurrence_rolls_over_once_started() -> None:
+    index = ScheduleIndex.from_schedules({"1": _schedule("1", "daily")})
+
+    before = index.next_occurrence(datetime(2026, 10, 16, 6, 0, tzinfo=UTC))
+    assert before is not None
+    assert before.start == datetime(2026, 10, 16, 6, 30, tzinfo=UTC)
+    assert before.end == datetime(2026, 10, 16, 6, 45, tzinfo=UTC)
+    assert index.next_occurrence(datetime(2026, 10, 16, 6, 10, tzinfo=UTC)) is before
+
+    after = index.next_occurrence(datetime(2026, 10, 16, 6, 30, tzinfo=UTC))
+    assert after is not None
+    assert after.start == datetime(2026, 10, 17, 6, 30, tzinfo=UTC)
+
+
+def test_occurrences_are_ordered_within_range() -> None:
+    index = ScheduleIndex.from_schedules(
+        {
+            "1": _schedule("1", "even"),
+            "2": _schedule("2", "daily", preferredTime={"startAt": "05:00"}),
+        }
+    )
+
+    events = index.occurrences(
+        datetime(2026, 10, 30, 6, 0, tzinfo=UTC),
+        datetime(2026, 11, 2, 6, 0, tzinfo=UTC),
+    )
+
+    assert [(event.schedule.id, event.start.day) for event in events] == [
+        ("1", 30),
+        ("2", 31),
+        ("2", 1),
+        ("2", 2),
+    ]
+
+
+def test_following_date_steps_without_probing() -> None:
+    weekly = CompiledSchedule.from_schedule(
+        _schedule("1", "weekly", daysOfWeek=["sunday"])
+    )
+    odd = CompiledSchedule.from_schedule(_schedule("2", "odd"))
+    assert weekly is not None
+    assert odd is not None
+
+    assert weekly.following_date(date(2026, 10, 18)) == date(2026, 10, 25)
+    assert odd.following_date(date(2026, 10, 29)) == date(2026, 10, 31)
+    assert odd.following_date(date(2026, 10, 31)) == date(2026, 11, 1)
+    assert odd.following_date(date(2026, 11, 29)) == date(2026, 12, 1)
+
+
+def test_occurrence_windows_are_cached() -> None:
+    index = ScheduleIndex.from_schedules({"1": _schedule("1", "daily")})
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    end = datetime(2026, 12, 31, tzinfo=UTC)
+
+    events = index.occurrences(start, end)
+
+    assert len(events) == 364
+    assert index.occurrences(start, end) is events
@@ -1,7 +1,12 @@
 """Test sensors."""
 
+from datetime import timedelta
+from unittest.mock import MagicMock
+
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from pytest_homeassistant_custom_component.test_util.aiohttp import (
     AiohttpClientMocker,
 )
@@ -12,6 +17,7 @@ from custom_components.moen_smart_water_network import (
     DOMAIN,
 )
 from custom_components.moen_smart_water_network.moen_api.const import API_USER_URL
+from custom_components.moen_smart_water_network.sensor import NextScheduleRunSensor
 
 
 async def test_sensors(
@@ -44,3 +50,28 @@ async def test_sensors(
     # assert hass.states.get("sensor.smart_sprinkler_controller_2").state == "home"
 
     assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_next_schedule_run_moves_on_when_the_run_starts(
+    hass: HomeAssistant,
+) -> None:
+    """The next run sensor updates at the run's start without a REST poll."""
+    now = dt_util.utcnow()
+    first, second = now + timedelta(minutes=1), now + timedelta(days=1)
+    device = MagicMock(id="dev-1", next_schedule_run=first)
+    sensor = NextScheduleRunSensor(device)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.next_schedule_run"
+
+    sensor.async_write_ha_state()
+    assert hass.states.get(sensor.entity_id).state == first.isoformat(
+        timespec="seconds"
+    )
+
+    device.next_schedule_run = second
+    async_fire_time_changed(hass, first + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass.states.get(sensor.entity_id).state == second.isoformat(
+        timespec="seconds"
+    )
+    sensor._async_cancel_next_run()
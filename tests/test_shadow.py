@@ -0,0 +1,65 @@
+"""Tests for shadow state merging."""
+
+from custom_components.moen_smart_water_network.moen_api.shadow import (
+    ShadowDocument,
+    ShadowUpdate,
+)
+
+
+def test_delta_merge_reports_changed_leaves() -> None:
+    shadow = ShadowDocument({"hydraOverview": {"status": "idle", "zoneID": 1}})
+
+    changed = shadow.apply({"hydraOverview": {"status": "watering", "zoneID": 1}})
+
+    assert changed == {("hydraOverview", "status")}
+    assert shadow.state == {"hydraOverview": {"status": "watering", "zoneID": 1}}
+
+
+def test_null_deletes_key() -> None:
+    shadow = ShadowDocument({"hydraOverview": {"status": "idle", "zoneID": 1}})
+
+    changed = shadow.apply({"hydraOverview": {"zoneID": None}, "missing": None})
+
+    assert changed == {("hydraOverview", "zoneID")}
+    assert shadow.state == {"hydraOverview": {"status": "idle"}}
+
+
+def test_new_subtree_reports_every_leaf_without_nulls() -> None:
+    shadow = ShadowDocument()
+
+    changed = shadow.apply({"hydraOverview": {"status": "idle", "zoneID": None}})
+
+    assert changed == {("hydraOverview", "status")}
+    assert shadow.state == {"hydraOverview": {"status": "idle"}}
+
+
+def test_stale_versions_are_dropped() -> None:
+    shadow = ShadowDocument()
+    shadow.apply({"rssi": -50}, version=5)
+
+    assert shadow.apply({"rssi": -70}, version=4) == set()
+    assert shadow.apply({"rssi": -70}, version=5) == set()
+    assert shadow.apply({"rssi": -60}, version=6) == {("rssi",)}
+    assert shadow.version == 6
+
+
+def test_full_document_removes_absent_keys() -> None:
+    shadow = ShadowDocument({"a": 1, "nested": {"b": 2, "c": 3}})
+
+    changed = shadow.apply({"a": 1, "nested": {"b": 2}}, full=True)
+
+    assert changed == {("nested", "c")}
+    assert shadow.state == {"a": 1, "nested": {"b": 2}}
+
+
+def test_update_from_documents_message_uses_current() -> None:
+    update = ShadowUpdate.from_document(
+        {
+            "previous": {"state": {"reported": {"a": 1}}, "version": 1},
+            "current": {"state": {"reported": {"a": 2}}, "version": 2},
+        },
+        full=True,
+    )
+
+    assert update == ShadowUpdate({"a": 2}, 2, full=True)
+    assert ShadowUpdate.from_document({"state": {}}, full=False) is None
@@ -0,0 +1,104 @@
+"""Tests for configurable endpoints against the local cloud simulator."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp.test_utils import TestServer
+
+from custom_components.moen_smart_water_network.moen_api import (
+    DEFAULT_ENDPOINTS,
+    Endpoints,
+    MoenApiClient,
+    MoenAuth,
+)
+from custom_components.moen_smart_water_network.moen_api.const import API_BASE_URL_V3
+from custom_components.moen_smart_water_network.view import RunView
+
+from .simulator import MoenSimulator, refresh_token_for
+
+
+def test_local_endpoints_follow_the_cloud_layout() -> None:
+    endpoints = Endpoints.local("http://127.0.0.1:8099/", "broker:1883")
+
+    assert endpoints.api_v3 == "http://127.0.0.1:8099/v3"
+    assert endpoints.oauth_url == "http://127.0.0.1:8099/prod/v1/oauth2/token"
+    assert (endpoints.mqtt_endpoint, endpoints.mqtt_port) == ("broker", 1883)
+    assert endpoints.local_mqtt
+    assert not Endpoints.local("http://127.0.0.1:8099").local_mqtt
+    assert DEFAULT_ENDPOINTS.api_v3 == API_BASE_URL_V3
+
+
+def test_local_broker_defaults_port_and_rejects_bad_ports() -> None:
+    endpoints = Endpoints.local("http://127.0.0.1:8099", "localhost")
+    assert (endpoints.mqtt_endpoint, endpoints.mqtt_port) == ("localhost", 1883)
+    endpoints = Endpoints.local("http://127.0.0.1:8099", "[::1]:1884")
+    assert (endpoints.mqtt_endpoint, endpoints.mqtt_port) == ("::1", 1884)
+
+    for broker in ("localhost:mqtt", "localhost:70000"):
+        with pytest.raises(ValueError, match="Invalid port"):
+            Endpoints.local("http://127.0.0.1:8099", broker)
+
+
+async def test_client_refreshes_and_reads_simulated_devices(socket_enabled) -> None:
+    """A stale token is refreshed against the simulator, then devices load."""
+    simulator = MoenSimulator(accounts=2, devices=3, zones=4)
+    async with TestServer(simulator.app()) as server, ClientSession() as session:
+        endpoints = Endpoints.local(str(server.make_url("/")))
+        auth = MoenAuth(
+            access_token="stale",
+            refresh_token=refresh_token_for(1),
+            session=session,
+            endpoints=endpoints,
+        )
+        client = MoenApiClient(auth=auth, session=session, endpoints=endpoints)
+
+        user = await client.async_get_user()
+        devices = await client.async_get_devices()
+        device = await client.async_get_device(devices["devices"][0]["duid"])
+        schedules = await client.async_get_schedules(device.duid)
+
+    assert user == {"legacyId": "sim-1"}
+    assert len(devices["devices"]) == 3
+    assert len(device.zones) == 4
+    assert len(schedules) == 2
+    assert simulator.stats.unauthorized == 1
+    assert simulator.stats.refreshes == 1
+
+
+async def test_manual_run_publishes_async_and_shadow_updates() -> None:
+    """A manual run walks its zones and publishes run and shadow messages."""
+    published: list[tuple[str, dict]] = []
+    simulator = MoenSimulator(
+        zones=2,
+        minute=0.001,
+        publish=lambda topic, payload: published.append((topic, json.loads(payload))),
+    )
+    device = next(iter(simulator.accounts[0].devices.values()))
+
+    simulator.start_run(
+        device,
+        [{"id": f"{device.duid}_1", "duration": 1}, {"id": f"{device.duid}_2"}],
+    )
+    assert device.run_task is not None
+    await asyncio.wait_for(device.run_task, 5)
+
+    runs = [msg for topic, msg in published if topic == f"/async/{device.duid}"]
+    assert [msg["body"]["state"]["status"] for msg in runs] == [
+        "STARTING",
+        "WATERING",
+        "WATERING",
+        "COMPLETED",
+    ]
+    view = RunView.from_message(runs[1])
+    assert view.active_zone_id == f"{device.duid}_1"
+    assert view.active_zone_duration_remaining == 60
+
+    shadows = [
+        msg["state"]["reported"]["hydraOverview"]
+        for topic, msg in published
+        if topic.endswith("/shadow/update/accepted")
+    ]
+    assert shadows[-1] == {"status": "idle", "zoneID": None}
+    assert not device.running